@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Precomputed Care Answer Table
+===================================================
+
+This module turns the canonical care catalog into a compact table of short,
+templated answers keyed by (plant, intent), so common single-plant questions
+("how often should I water my Snake Plant", "is Pothos toxic to cats") can be
+answered without retrieval or a model call.
+
+A question is answered from the table only when the confidence gate passes:
+exactly one catalog plant is mentioned, one intent clearly outscores the rest,
+and the table has an answer for that pair. Fields whose text is only a
+CARE_TEMPLATES category default (see the catalog provenance) get no answer,
+so "is aloe safe for dogs" is not answered from the generic Succulent text.
+Everything else falls through to the normal retrieval + LLM path.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import re
+from typing import List, Dict, Any, Optional, Tuple
+
+from catalog_merge import is_template_field
+
+BASE_DIR = os.path.dirname(__file__)
+
+# Intent -> (catalog field, answer template)
+INTENTS = {
+    'watering': ('watering', "Watering {name}: {text}"),
+    'light': ('light', "Light for {name}: {text}"),
+    'soil': ('soil', "Soil for {name}: {text}"),
+    'temperature': ('temperature', "{name} temperature range: {text}"),
+    'humidity': ('humidity', "Humidity for {name}: {text}"),
+    'fertilizer': ('fertilizer', "Fertilizing {name}: {text}"),
+    'pruning': ('pruning', "Pruning {name}: {text}"),
+    'propagation': ('propagation', "Propagating {name}: {text}"),
+    'problems': ('common_problems', "Common {name} problems: {text}"),
+    'toxicity': ('toxicity', "{name} toxicity: {text}"),
+    'difficulty': ('difficulty', "{name} is rated {text} to care for."),
+}
+
+# Intent -> keyword patterns matched against the normalized question
+INTENT_KEYWORDS = {
+    'watering': [r'\bwater(ing|ed)?\b', r'\bthirsty\b', r'\bdry out\b'],
+    'light': [r'\blight\b', r'\bsun(light|ny)?\b', r'\bshade\b', r'\bwindow\b', r'\bdark\b'],
+    'soil': [r'\bsoil\b', r'\bpotting mix\b', r'\brepot(ting)?\b', r'\bdrainage\b'],
+    'temperature': [r'\btemperature\b', r'\bcold\b', r'\bheat\b', r'\bdegrees?\b', r'\bfrost\b', r'\bwinter\b'],
+    'humidity': [r'\bhumid(ity)?\b', r'\bmist(ing)?\b'],
+    'fertilizer': [r'\bfertili[sz](e|er|ing)\b', r'\bfeed(ing)?\b', r'\bnutrients?\b', r'\bplant food\b'],
+    'pruning': [r'\bprun(e|ing)\b', r'\btrim(ming)?\b', r'\bcut back\b'],
+    'propagation': [r'\bpropagat(e|ion|ing)\b', r'\bcuttings?\b', r'\bdivid(e|ing)\b', r'\bnew plants?\b'],
+    'problems': [r'\byellow(ing)?\b', r'\bbrown\b', r'\bdroop(ing|y)?\b', r'\bpests?\b', r'\bproblems?\b',
+                 r'\bdying\b', r'\bwilt(ing)?\b', r'\bspots?\b', r'\bwrong\b'],
+    'toxicity': [r'\btoxic(ity)?\b', r'\bpoison(ous)?\b', r'\bsafe for\b', r'\bpets?\b', r'\bcats?\b',
+                 r'\bdogs?\b', r'\bkids\b', r'\bchildren\b'],
+    'difficulty': [r'\beasy\b', r'\bbeginners?\b', r'\bdifficult(y)?\b', r'\bhard to\b', r'\blow maintenance\b'],
+}
+
+_COMPILED_KEYWORDS = {
+    intent: [re.compile(pattern) for pattern in patterns]
+    for intent, patterns in INTENT_KEYWORDS.items()
+}
+
+MAX_ANSWER_CHARS = 240
+
+
+def normalize_text(text: str) -> str:
+    text = (text or '').lower().replace("'", '').replace('’', '')
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text).split())
+
+
+def _unique_sentences(text: str) -> str:
+    """Drop sentences repeated in merged catalog text (compared normalized)."""
+    seen = set()
+    kept = []
+    for sentence in re.split(r'(?<=[.!?])\s+', ' '.join(text.split())):
+        key = normalize_text(sentence)
+        if key and key not in seen:
+            seen.add(key)
+            kept.append(sentence)
+    return ' '.join(kept)
+
+
+def _shorten(text: str) -> str:
+    """Keep whole sentences up to MAX_ANSWER_CHARS."""
+    text = ' '.join(text.split())
+    if len(text) <= MAX_ANSWER_CHARS:
+        return text
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    answer = ''
+    for sentence in sentences:
+        if answer and len(answer) + len(sentence) + 1 > MAX_ANSWER_CHARS:
+            break
+        answer = f"{answer} {sentence}".strip()
+    return answer[:MAX_ANSWER_CHARS]
+
+
+def build_answer_table(catalog: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the (plant, intent) answer table from a canonical catalog."""
+    plants = {}
+    names = {}
+    answers = {}
+
+    for plant in catalog['plants']:
+        key = plant['key']
+        plants[key] = plant['name']
+        for name in [plant['name']] + plant.get('aliases', []):
+            names.setdefault(normalize_text(name), key)
+        names.setdefault(key, key)
+
+        plant_answers = {}
+        for intent, (field, template) in INTENTS.items():
+            text = (plant.get(field) or '').strip()
+            if text and not is_template_field(plant, field):
+                plant_answers[intent] = template.format(name=plant['name'], text=_shorten(_unique_sentences(text)))
+        answers[key] = plant_answers
+
+    return {
+        'version': catalog.get('version', 0),
+        'plants': plants,
+        'names': names,
+        'answers': answers,
+    }
+
+
+class AnswerTable:
+    """Look up precomputed answers for free-text questions."""
+
+    def __init__(self, table: Dict[str, Any], max_name_words: Optional[int] = None):
+        self.version = table['version']
+        self.plants = table['plants']
+        self.names = table['names']
+        self.answers = table['answers']
+        self.max_name_words = max_name_words or max((len(n.split()) for n in self.names), default=1)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'AnswerTable':
+        path = path or os.path.join(BASE_DIR, 'data', 'answer_table.json')
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def find_plants(self, question: str) -> List[str]:
+        """Return catalog keys mentioned in the question (longest match wins)."""
+        tokens = normalize_text(question).split()
+        found = []
+        i = 0
+        while i < len(tokens):
+            for width in range(min(self.max_name_words, len(tokens) - i), 0, -1):
+                phrase = ' '.join(tokens[i:i + width])
+                key = self.names.get(phrase)
+                if key is None and phrase.endswith('s'):
+                    key = self.names.get(phrase[:-1])
+                if key is not None:
+                    if key not in found:
+                        found.append(key)
+                    i += width
+                    break
+            else:
+                i += 1
+        return found
+
+    @staticmethod
+    def classify_intent(question: str) -> List[Tuple[str, int]]:
+        """Score every intent by keyword hits, best first."""
+        text = normalize_text(question)
+        scores = []
+        for intent, patterns in _COMPILED_KEYWORDS.items():
+            score = sum(1 for pattern in patterns if pattern.search(text))
+            if score:
+                scores.append((intent, score))
+        scores.sort(key=lambda item: -item[1])
+        return scores
+
+    def answer(self, question: str, plants: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Return a precomputed answer if the confidence gate passes, else None.
+
+        `plants` may be supplied by an upstream entity extractor; otherwise the
+        table's own name index is used.
+        """
+        plants = plants if plants is not None else self.find_plants(question)
+        if len(plants) != 1:
+            return None
+
+        intents = self.classify_intent(question)
+        if not intents:
+            return None
+        if len(intents) > 1 and intents[0][1] == intents[1][1]:
+            return None
+
+        key = plants[0]
+        intent, score = intents[0]
+        text = self.answers.get(key, {}).get(intent)
+        if not text:
+            return None
+
+        margin = score - (intents[1][1] if len(intents) > 1 else 0)
+        return {
+            'plant': self.plants[key],
+            'key': key,
+            'intent': intent,
+            'answer': text,
+            'confidence': min(1.0, 0.6 + 0.2 * margin),
+            'catalog_version': self.version,
+        }
+
+
+def save_answer_table(table: Dict[str, Any], path: str):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(table, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def main():
+    """Build data/answer_table.json from the canonical catalog and try a few questions."""
+    parser = argparse.ArgumentParser(description='Build the precomputed care answer table')
+    parser.add_argument('--catalog', default=os.path.join(BASE_DIR, 'data', 'plant_catalog.json'))
+    parser.add_argument('--output', default=os.path.join(BASE_DIR, 'data', 'answer_table.json'))
+    parser.add_argument('questions', nargs='*')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Care Answer Table")
+    print("=" * 45)
+
+    if os.path.exists(args.catalog):
+        with open(args.catalog, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+    else:
+        from catalog_merge import build_catalog
+        print("⚠️ Catalog file not found, merging sources in memory")
+        catalog = build_catalog()
+
+    table = build_answer_table(catalog)
+    save_answer_table(table, args.output)
+    total = sum(len(a) for a in table['answers'].values())
+    print(f"✅ {total} answers for {len(table['plants'])} plants saved to {args.output}")
+
+    lookup = AnswerTable(table)
+    for question in args.questions or [
+        "How often should I water my Snake Plant?",
+        "Is Pothos toxic to cats?",
+        "What light does a fiddle leaf fig need?",
+        "Compare Pothos and Philodendron",
+    ]:
+        result = lookup.answer(question)
+        if result:
+            print(f"⚡ {question}\n   → {result['answer']} (confidence {result['confidence']:.2f})")
+        else:
+            print(f"🤖 {question}\n   → falls through to retrieval + LLM")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Bulk Query Runner
+=======================================
+
+This module runs thousands of questions against a Chroma collection (or
+anything with the same `query` interface) without paying one round trip per
+question:
+
+- identical questions are deduplicated and queried once
+- unique questions are grouped into multi-text `query_texts` calls
+  (optionally embedded locally in batches and sent as `query_embeddings`)
+- up to `max_concurrency` calls are in flight at once on a thread pool
+- results stream back in input order as soon as every earlier question has
+  been answered, so memory stays bounded by the in-flight window
+
+Typical uses are offline jobs such as re-tagging logs or prewarming caches.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+DEFAULT_INCLUDE = ['documents', 'metadatas', 'distances']
+
+
+def _split_results(results: Dict[str, Any], include: List[str], count: int) -> List[Dict[str, Any]]:
+    """Turn one multi-query result into a flat result per query text."""
+    keys = [key for key in ['ids'] + list(include) if results.get(key) is not None]
+    return [{key: results[key][i] for key in keys} for i in range(count)]
+
+
+def iter_bulk_query(collection, questions: List[str], n_results: int = 3,
+                    where: Optional[Dict[str, Any]] = None, include: Optional[List[str]] = None,
+                    batch_size: int = 32, max_concurrency: int = 4,
+                    embedding_backend=None, stats: Optional[Dict[str, int]] = None,
+                    return_errors: bool = False) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+    """Yield (index, question, result) for every question, in input order.
+
+    Each result has the include keys plus `ids`, flattened to this one
+    question. Pass `embedding_backend` to embed locally in batches instead
+    of letting the collection embed the texts. With `return_errors`, a failed
+    batch is retried one question at a time and questions that still fail
+    yield {'error': message} instead of stopping the run.
+    """
+    include = include or DEFAULT_INCLUDE
+    stats = stats if stats is not None else {}
+
+    # Map every question to its first occurrence and remember its last use
+    unique: List[str] = []
+    unique_ids: List[int] = []
+    positions: Dict[str, int] = {}
+    for question in questions:
+        uid = positions.get(question)
+        if uid is None:
+            uid = positions[question] = len(unique)
+            unique.append(question)
+        unique_ids.append(uid)
+    last_use = {uid: index for index, uid in enumerate(unique_ids)}
+
+    batches = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+    stats.update({'questions': len(questions), 'unique': len(unique), 'calls': len(batches)})
+
+    def query_batch(batch: List[str]) -> List[Dict[str, Any]]:
+        kwargs = {'n_results': n_results, 'include': include}
+        if where:
+            kwargs['where'] = where
+        if embedding_backend is not None:
+            from embedding_service import embed_documents
+            kwargs['query_embeddings'] = embed_documents(embedding_backend, batch, batch_size=len(batch))
+        else:
+            kwargs['query_texts'] = batch
+        return _split_results(collection.query(**kwargs), include, len(batch))
+
+    def run_batch(batch: List[str]) -> List[Dict[str, Any]]:
+        try:
+            return query_batch(batch)
+        except Exception as e:
+            if not return_errors:
+                raise
+            if len(batch) == 1:
+                return [{'error': str(e)}]
+            return [run_batch([question])[0] for question in batch]
+
+    answered: Dict[int, Dict[str, Any]] = {}
+    next_input = 0
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        # Bounded window of in-flight batches, consumed in submission order
+        window = deque()
+        next_batch = 0
+        while next_batch < len(batches) or window:
+            while next_batch < len(batches) and len(window) < max_concurrency:
+                window.append((next_batch, executor.submit(run_batch, batches[next_batch])))
+                next_batch += 1
+
+            batch_index, future = window.popleft()
+            first_uid = batch_index * batch_size
+            for offset, result in enumerate(future.result()):
+                answered[first_uid + offset] = result
+            answered_through = first_uid + len(batches[batch_index])
+
+            # First occurrences appear in uid order, so everything up to the
+            # first unanswered uid can be released
+            while next_input < len(questions) and unique_ids[next_input] < answered_through:
+                uid = unique_ids[next_input]
+                result = answered[uid]
+                if last_use[uid] == next_input:
+                    del answered[uid]
+                yield next_input, questions[next_input], result
+                next_input += 1
+
+
+def bulk_query(collection, questions: List[str], **kwargs) -> List[Dict[str, Any]]:
+    """Run iter_bulk_query to completion and return results in input order."""
+    return [result for _, _, result in iter_bulk_query(collection, questions, **kwargs)]
+
+
+def load_questions(path: str) -> List[str]:
+    """Questions from a JSON list (strings or {question: ...}) or a text file, one per line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.json'):
+            items = json.load(f)
+            return [item['question'] if isinstance(item, dict) else item for item in items]
+        return [line.strip() for line in f if line.strip()]
+
+
+def main():
+    """Run a question file against a collection and write JSON lines in input order."""
+    parser = argparse.ArgumentParser(description='Bulk plant care retrieval')
+    parser.add_argument('input', help='questions (.json list or one per line)')
+    parser.add_argument('--output', help='JSON lines output (default: stdout summary only)')
+    parser.add_argument('--backend', choices=['local', 'chroma'], default='local')
+    parser.add_argument('--collection', default='fast_plant_care')
+    parser.add_argument('-n', '--n-results', type=int, default=3)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--concurrency', type=int, default=4)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Bulk Query Runner")
+    print("=" * 45)
+
+    if args.backend == 'chroma':
+        from populate_fast_plant_database import connect_to_chroma_cloud
+        client = connect_to_chroma_cloud()
+        if not client:
+            return
+        collection = client.get_collection(name=args.collection)
+    else:
+        from local_collection import load_default_collection
+        collection = load_default_collection()
+
+    questions = load_questions(args.input)
+    stats = {}
+    started = time.perf_counter()
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        for index, question, result in iter_bulk_query(
+                collection, questions, n_results=args.n_results, batch_size=args.batch_size,
+                max_concurrency=args.concurrency, stats=stats):
+            if out:
+                out.write(json.dumps({'index': index, 'question': question, **result},
+                                     ensure_ascii=False) + '\n')
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - started
+
+    print(f"📊 {stats['questions']} questions, {stats['unique']} unique, {stats['calls']} query calls")
+    print(f"⏱️ {elapsed * 1000:.0f} ms ({stats['questions'] / max(elapsed, 1e-9):.0f} questions/s)")
+    if args.output:
+        print(f"💾 Results written to {os.path.abspath(args.output)}")
+
+if __name__ == "__main__":
+    main()
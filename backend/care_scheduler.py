@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Care Scheduler
+====================================
+
+This module computes next-due watering and fertilizing tasks for every
+tracked plant. Care intervals are derived once per species from the free-text
+catalog fields, and due tasks are kept in a priority queue so reminder jobs
+can ask "what is due in the next N hours" without scanning every plant.
+
+Author: Smart Plant Tracker Team
+"""
+
+import heapq
+import itertools
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+TASK_TYPES = ('watering', 'fertilizing')
+
+# Log types that count as a care event for a task type
+LOG_TYPE_TASKS = {
+    'watering': 'watering',
+    'water': 'watering',
+    'fertilizing': 'fertilizing',
+    'fertilizer': 'fertilizing',
+    'fertilize': 'fertilizing',
+}
+
+DEFAULT_INTERVAL_DAYS = {
+    'watering': 7.0,
+    'fertilizing': 30.0,
+}
+
+_UNIT_DAYS = {'day': 1.0, 'week': 7.0, 'month': 30.0}
+
+# Phrases in the catalog text that imply a cadence without stating a number
+_WATERING_PHRASES = [
+    ('consistently moist', 2.0),
+    ('never let dry', 2.0),
+    ('evenly moist', 4.0),
+    ('mist', 3.0),
+    ('top inch', 6.0),
+    ('top 1 inch', 6.0),
+    ('top 2', 8.0),
+    ('top 2-3', 9.0),
+    ('completely dry', 14.0),
+    ('sparingly', 18.0),
+    ('infrequently', 14.0),
+]
+
+# Frequency words that state an interval outright
+_FREQUENCY_WORDS = {
+    'daily': 1.0,
+    'weekly': 7.0,
+    'biweekly': 14.0,
+    'fortnightly': 14.0,
+    'monthly': 30.0,
+}
+
+_FERTILIZING_PHRASES = [
+    ('weekly', 7.0),
+    ('biweekly', 14.0),
+    ('monthly', 30.0),
+    ('rarely', 90.0),
+    ('not needed', None),
+]
+
+
+def _every_interval(lowered: str) -> Optional[float]:
+    """Cadence from "every 2-3 weeks" / "every week" (ranges use their midpoint)."""
+    match = re.search(r'every\s+(\d+)(?:\s*-\s*(\d+))?\s*(day|week|month)s?', lowered)
+    if match:
+        low = float(match.group(1))
+        high = float(match.group(2) or match.group(1))
+        return (low + high) / 2 * _UNIT_DAYS[match.group(3)]
+
+    match = re.search(r'every\s+(day|week|month)', lowered)
+    if match:
+        return _UNIT_DAYS[match.group(1)]
+    return None
+
+
+def explicit_interval_days(text: str) -> Optional[float]:
+    """Interval in days only when the text states one ("every 2-3 weeks", "monthly").
+
+    Unlike parse_interval_days, this never guesses from phrases or falls back
+    to a default, so callers that store the value as data get None instead.
+    """
+    lowered = (text or '').lower()
+    days = _every_interval(lowered)
+    if days is not None:
+        return days
+    match = re.search(r'\b(' + '|'.join(_FREQUENCY_WORDS) + r')\b', lowered)
+    return _FREQUENCY_WORDS[match.group(1)] if match else None
+
+
+def parse_interval_days(text: str, task_type: str) -> Optional[float]:
+    """Derive a care interval in days from a free-text catalog field.
+
+    Explicit cadences ("every 2-3 weeks", "every 2-4 weeks") win; ranges use
+    their midpoint. Otherwise well-known phrases from the catalog templates
+    are mapped to a typical cadence. Returns None when the text says the task
+    is not needed, and the task type's default when nothing matches.
+    """
+    if not text:
+        return DEFAULT_INTERVAL_DAYS[task_type]
+
+    lowered = text.lower()
+
+    days = _every_interval(lowered)
+    if days is not None:
+        return days
+
+    phrases = _WATERING_PHRASES if task_type == 'watering' else _FERTILIZING_PHRASES
+    found = None
+    for phrase, days in phrases:
+        # Later, more specific phrases override earlier generic ones
+        if phrase in lowered:
+            found = (days,)
+    if found is not None:
+        return found[0]
+
+    return DEFAULT_INTERVAL_DAYS[task_type]
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO/SQLite timestamp into an aware UTC datetime."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, (int, float)):
+        # The backend stores JS millisecond timestamps in a few places
+        seconds = value / 1000 if value > 1e11 else value
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+    else:
+        text = str(value).strip().replace('Z', '+00:00')
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def normalize_species(name: str) -> str:
+    """Normalize a species/plant name for catalog lookup."""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', (name or '').lower()).split())
+
+
+class CareScheduler:
+    """Priority queue of next-due care tasks for all tracked plants.
+
+    Each (plant, task type) pair has at most one live heap entry. Updates push
+    a fresh entry and give the pair a new version, so stale entries are
+    discarded lazily when they surface instead of being searched for and
+    removed. Versions come from one counter that never resets, so an entry
+    left over from a removed or popped task can never match again.
+    """
+
+    def __init__(self, catalog: Optional[List[Dict[str, Any]]] = None):
+        self.intervals: Dict[str, Dict[str, Optional[float]]] = {}
+        self.plants: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[Tuple[float, int, str, str]] = []
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._version_counter = itertools.count(1)
+        self._live = 0
+
+        if catalog:
+            self.load_catalog(catalog)
+
+    # Catalog -----------------------------------------------------------
+
+    def load_catalog(self, catalog: List[Dict[str, Any]]):
+        """Precompute per-species care intervals from catalog records."""
+        for plant in catalog:
+            key = normalize_species(plant.get('name', ''))
+            if not key or key in self.intervals:
+                continue
+            self.intervals[key] = {
+                'watering': parse_interval_days(plant.get('watering', ''), 'watering'),
+                'fertilizing': parse_interval_days(plant.get('fertilizer', ''), 'fertilizing'),
+            }
+
+    @classmethod
+    def from_catalog_file(cls, filename: str = 'fast_plant_care_data.json') -> 'CareScheduler':
+        """Create a scheduler from a catalog JSON file next to this script."""
+        file_path = os.path.join(os.path.dirname(__file__), filename)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def interval_for(self, species: str, task_type: str) -> Optional[float]:
+        """Return the interval in days for a species, falling back to defaults."""
+        intervals = self.intervals.get(normalize_species(species))
+        if intervals is None:
+            return DEFAULT_INTERVAL_DAYS[task_type]
+        return intervals[task_type]
+
+    # Plants ------------------------------------------------------------
+
+    def add_plant(self, plant_id: str, species: str, user_id: Any = None,
+                  last_watered: Any = None, last_fertilized: Any = None,
+                  now: Optional[datetime] = None):
+        """Track a plant (or replace its state) and schedule its tasks.
+
+        Plants with no recorded event are treated as cared for at `now`, so a
+        freshly added plant is not immediately overdue.
+        """
+        now = now or datetime.now(timezone.utc)
+        self.plants[plant_id] = {
+            'species': species,
+            'user_id': user_id,
+            'last': {
+                'watering': parse_timestamp(last_watered) or now,
+                'fertilizing': parse_timestamp(last_fertilized) or now,
+            },
+        }
+        for task_type in TASK_TYPES:
+            self._schedule(plant_id, task_type)
+
+    def remove_plant(self, plant_id: str):
+        """Stop tracking a plant; its heap entries expire lazily."""
+        if self.plants.pop(plant_id, None) is None:
+            return
+        for task_type in TASK_TYPES:
+            if self._versions.pop((plant_id, task_type), None) is not None:
+                self._live -= 1
+
+    def update_species(self, plant_id: str, species: str):
+        """Reschedule a plant after its species changed."""
+        plant = self.plants[plant_id]
+        plant['species'] = species
+        for task_type in TASK_TYPES:
+            self._schedule(plant_id, task_type)
+
+    def record_log(self, plant_id: str, log_type: str, timestamp: Any = None) -> bool:
+        """Apply a newly created care log incrementally.
+
+        Returns True when the log rescheduled a task. Logs of unrelated types,
+        logs for unknown plants and logs older than the last known event are
+        ignored.
+        """
+        task_type = LOG_TYPE_TASKS.get((log_type or '').lower())
+        plant = self.plants.get(plant_id)
+        if task_type is None or plant is None:
+            return False
+
+        when = parse_timestamp(timestamp) or datetime.now(timezone.utc)
+        if when <= plant['last'][task_type]:
+            return False
+
+        plant['last'][task_type] = when
+        self._schedule(plant_id, task_type)
+        return True
+
+    def next_due(self, plant_id: str, task_type: str) -> Optional[datetime]:
+        """Return when a plant's task is next due, or None if not scheduled."""
+        plant = self.plants.get(plant_id)
+        if plant is None:
+            return None
+        interval = self.interval_for(plant['species'], task_type)
+        if interval is None:
+            return None
+        return plant['last'][task_type] + timedelta(days=interval)
+
+    # Queries -----------------------------------------------------------
+
+    def due_within(self, hours: float, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """List tasks due before now + hours (overdue tasks included).
+
+        Walks the heap as an implicit tree, only descending into children of
+        entries inside the window, so the cost is O(k log k) for k results
+        regardless of how many plants are tracked.
+        """
+        now = now or datetime.now(timezone.utc)
+        bound = (now + timedelta(hours=hours)).timestamp()
+        heap = self._heap
+        results = []
+
+        frontier = [(heap[0][0], 0)] if heap else []
+        while frontier:
+            due_at, index = heapq.heappop(frontier)
+            if due_at > bound:
+                break
+            entry = heap[index]
+            if self._is_live(entry):
+                results.append(self._task(entry))
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap) and heap[child][0] <= bound:
+                    heapq.heappush(frontier, (heap[child][0], child))
+
+        return results
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Remove and return every task due at or before now.
+
+        Popped tasks are not rescheduled; the next care log for the plant
+        reschedules them via record_log.
+        """
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        results = []
+        while self._heap and self._heap[0][0] <= now_ts:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                del self._versions[(entry[2], entry[3])]
+                self._live -= 1
+                results.append(self._task(entry))
+        return results
+
+    def __len__(self) -> int:
+        return self._live
+
+    # Internals ---------------------------------------------------------
+
+    def _schedule(self, plant_id: str, task_type: str):
+        key = (plant_id, task_type)
+        due = self.next_due(plant_id, task_type)
+        if due is None:
+            if self._versions.pop(key, None) is not None:
+                self._live -= 1
+            return
+
+        if key not in self._versions:
+            self._live += 1
+        version = next(self._version_counter)
+        self._versions[key] = version
+        heapq.heappush(self._heap, (due.timestamp(), version, plant_id, task_type))
+
+        # Compact once stale entries dominate the heap
+        if len(self._heap) > 64 and len(self._heap) > 4 * self._live:
+            self._heap = [e for e in self._heap if self._is_live(e)]
+            heapq.heapify(self._heap)
+
+    def _is_live(self, entry: Tuple[float, int, str, str]) -> bool:
+        return self._versions.get((entry[2], entry[3])) == entry[1]
+
+    def _task(self, entry: Tuple[float, int, str, str]) -> Dict[str, Any]:
+        due_at, _, plant_id, task_type = entry
+        plant = self.plants[plant_id]
+        return {
+            'plant_id': plant_id,
+            'user_id': plant['user_id'],
+            'species': plant['species'],
+            'task': task_type,
+            'due_at': datetime.fromtimestamp(due_at, tz=timezone.utc).isoformat(),
+        }
+
+
+def load_from_database(scheduler: CareScheduler, db_path: str):
+    """Load plants and their latest care logs from the backend SQLite database."""
+    conn = sqlite3.connect(db_path)
+    try:
+        last_events: Dict[Tuple[str, str], str] = {}
+        rows = conn.execute(
+            "SELECT plant_id, type, MAX(timestamp) FROM logs GROUP BY plant_id, type"
+        )
+        for plant_id, log_type, timestamp in rows:
+            task_type = LOG_TYPE_TASKS.get((log_type or '').lower())
+            if task_type is None:
+                continue
+            key = (plant_id, task_type)
+            if key not in last_events or timestamp > last_events[key]:
+                last_events[key] = timestamp
+
+        for plant_id, user_id, species, name, last_watered in conn.execute(
+            "SELECT id, user_id, species, name, last_watered FROM plants"
+        ):
+            watered = last_events.get((plant_id, 'watering'))
+            if last_watered and (watered is None or str(last_watered) > watered):
+                watered = last_watered
+            scheduler.add_plant(
+                plant_id,
+                species or name,
+                user_id=user_id,
+                last_watered=watered,
+                last_fertilized=last_events.get((plant_id, 'fertilizing')),
+            )
+    finally:
+        conn.close()
+
+
+def main():
+    """Print care tasks due in the next 24 hours for the backend database."""
+    print("🌱 Smart Plant Tracker - Care Scheduler")
+    print("=" * 40)
+
+    db_path = os.path.join(os.path.dirname(__file__), 'data', 'users.db')
+    if not os.path.exists(db_path):
+        print(f"❌ Error: {db_path} not found. Start the backend once to create it.")
+        return
+
+    try:
+        scheduler = CareScheduler.from_catalog_file()
+    except FileNotFoundError:
+        print("⚠️ Warning: fast_plant_care_data.json not found, using default intervals")
+        scheduler = CareScheduler()
+
+    load_from_database(scheduler, db_path)
+    due = scheduler.due_within(24)
+
+    print(f"📊 Tracking {len(scheduler.plants)} plants ({len(scheduler)} scheduled tasks)")
+    print(f"⏰ {len(due)} tasks due in the next 24 hours")
+    for task in due:
+        print(f"   - {task['task']} {task['species']} ({task['plant_id']}) due {task['due_at']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Care Data Merge Engine
+============================================
+
+This script consolidates every care data source into one canonical catalog:
+
+- fast_plant_care_data.json      (fast_plant_database.py output)
+- scraped_plant_care_data.json   (plant_scraper.py output)
+- data/comprehensive_plant_data.json
+- data/plantCareDataset.json and its two backups
+
+Each source is streamed once and hash-joined on a normalized species name.
+Catalog-style records contribute whole care profiles; dataset-style snippets
+(species/category/text) are mapped onto the matching care field. When several
+sources provide a field, the highest-priority source wins and ties go to the
+freshest record. Every field in the output carries its provenance, including
+whether the winning text is only a CARE_TEMPLATES category default, and the
+catalog version is bumped whenever its content changes.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from fast_plant_database import is_template_value
+
+BASE_DIR = os.path.dirname(__file__)
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+# Share of the shorter sentence's words two snippet sentences must share to count as one
+NEAR_DUPLICATE_OVERLAP = 0.8
+
+CARE_FIELDS = [
+    'watering', 'light', 'soil', 'temperature', 'humidity', 'fertilizer',
+    'pruning', 'propagation', 'common_problems', 'tips', 'difficulty',
+    'toxicity', 'category',
+]
+
+# (name, path relative to backend/, record kind, priority). Higher priority wins.
+SOURCES = [
+    ('plantCareDataset', 'data/plantCareDataset.json', 'snippets', 100),
+    ('comprehensive', 'data/comprehensive_plant_data.json', 'snippets', 90),
+    ('plantCareDataset_backup', 'data/plantCareDataset_backup.json', 'snippets', 50),
+    ('plantCareDataset.backup', 'data/plantCareDataset.backup.json', 'snippets', 40),
+    ('fast_plant_database', 'fast_plant_care_data.json', 'catalog', 30),
+    ('plant_scraper', 'scraped_plant_care_data.json', 'catalog', 20),
+]
+
+# Dataset snippet categories -> catalog care field
+SNIPPET_FIELDS = {
+    'watering': 'watering',
+    'light': 'light',
+    'soil': 'soil',
+    'drainage': 'soil',
+    'repotting': 'soil',
+    'temperature': 'temperature',
+    'winter': 'temperature',
+    'humidity': 'humidity',
+    'air': 'humidity',
+    'fertilizing': 'fertilizer',
+    'pruning': 'pruning',
+    'pinching': 'pruning',
+    'deadheading': 'pruning',
+    'propagation': 'propagation',
+    'troubleshooting': 'common_problems',
+    'pests': 'common_problems',
+    'diseases': 'common_problems',
+    'root-rot': 'common_problems',
+    'yellow-leaves': 'common_problems',
+    'brown-tips': 'common_problems',
+    'drooping': 'common_problems',
+    'wilting': 'common_problems',
+    'leaf-drop': 'common_problems',
+    'no-growth': 'common_problems',
+    'stunted-growth': 'common_problems',
+}
+
+# Alternate names that refer to the same plant, by normalized key
+SPECIES_ALIASES = {
+    'monstera': 'monstera deliciosa',
+    'swiss cheese plant': 'monstera deliciosa',
+    'ficus lyrata': 'fiddle leaf fig',
+    'ficus elastica': 'rubber plant',
+    'rubber tree': 'rubber plant',
+    'sansevieria': 'snake plant',
+    'zamioculcas': 'zz plant',
+    'spathiphyllum': 'peace lily',
+    'golden pothos': 'pothos',
+    'epipremnum': 'pothos',
+    'pilea': 'chinese money plant',
+    'rabbits foot fern': 'rabbit foot fern',
+    'succulents': 'succulent',
+}
+
+GENERAL_KEYS = {'general', ''}
+
+# Dataset difficulty labels -> catalog difficulty wording
+DIFFICULTY_LABELS = {'easy': 'Easy', 'medium': 'Moderate', 'hard': 'Hard'}
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a plant name into a join key ("Rabbit's Foot Fern" -> "rabbits foot fern")."""
+    text = (name or '').lower().replace("'", '').replace('’', '')
+    key = ' '.join(re.sub(r'[^a-z0-9]+', ' ', text).split())
+    return SPECIES_ALIASES.get(key, key)
+
+
+def iter_json_array(path: str, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Stream the elements of a top-level JSON array without loading the whole file."""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        started = False
+        eof = False
+        while True:
+            if not eof and len(buffer) < chunk_size:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+
+            buffer = buffer.lstrip()
+            if not started:
+                if not buffer:
+                    if eof:
+                        return
+                    continue
+                if buffer[0] != '[':
+                    raise ValueError(f"{path} does not contain a JSON array")
+                buffer = buffer[1:]
+                started = True
+                continue
+
+            if buffer.startswith(','):
+                buffer = buffer[1:]
+                continue
+            if buffer.startswith(']'):
+                return
+            if not buffer:
+                if eof:
+                    raise ValueError(f"{path} ended inside a JSON array")
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield value
+            buffer = buffer[end:]
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream records from a JSON array or JSON Lines file."""
+    if path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from iter_json_array(path)
+
+
+def _record_time(record: Dict[str, Any], default: str) -> str:
+    return record.get('scraped_at') or record.get('updated_at') or record.get('created_at') or default
+
+
+def _sentence_words(sentence: str) -> set:
+    return set(re.findall(r'[a-z0-9]+', sentence.lower()))
+
+
+def merge_sentences(sentences: List[str], text: str) -> bool:
+    """Add the text's sentences to `sentences`, skipping near-duplicates.
+
+    A sentence whose words mostly (NEAR_DUPLICATE_OVERLAP) overlap an
+    existing one is a restatement of it: the longer of the two is kept in
+    the earlier position. Returns True if anything changed.
+    """
+    changed = False
+    for sentence in SENTENCE_SPLIT.split(' '.join(text.split())):
+        words = _sentence_words(sentence)
+        if not words:
+            continue
+        for i, existing in enumerate(sentences):
+            existing_words = _sentence_words(existing)
+            if not existing_words:
+                continue
+            overlap = len(words & existing_words) / min(len(words), len(existing_words))
+            if overlap >= NEAR_DUPLICATE_OVERLAP:
+                if len(words) > len(existing_words):
+                    sentences[i] = sentence
+                    changed = True
+                break
+        else:
+            sentences.append(sentence)
+            changed = True
+    return changed
+
+
+class CatalogMerger:
+    """Hash-join care sources into canonical per-species records."""
+
+    def __init__(self):
+        # key -> {'names': {name: count}, 'fields': {field: {source: [rank, fresh, texts, template]}}}
+        self.table: Dict[str, Dict[str, Any]] = {}
+        self.general: List[Dict[str, str]] = []
+        self.sources: List[Dict[str, Any]] = []
+
+    def _entry(self, key: str) -> Dict[str, Any]:
+        entry = self.table.get(key)
+        if entry is None:
+            entry = {'names': {}, 'fields': {}}
+            self.table[key] = entry
+        return entry
+
+    def _offer(self, entry: Dict[str, Any], field: str, source: str, priority: int,
+               freshness: str, text: str, append: bool = True, template: bool = False):
+        text = (text or '').strip()
+        if not text:
+            return
+        candidate = entry['fields'].setdefault(field, {}).get(source)
+        if candidate is None:
+            texts = [text]
+            if append:
+                texts = []
+                merge_sentences(texts, text)
+            entry['fields'][field][source] = [priority, freshness, texts, template]
+            return
+        # Snippets add their new sentences to a field; repeated catalog rows keep their first value
+        if append and merge_sentences(candidate[2], text):
+            candidate[1] = max(candidate[1], freshness)
+
+    def add_source(self, name: str, records: Iterator[Dict[str, Any]], kind: str,
+                   priority: int, source_time: str):
+        """Stream one source into the join table."""
+        count = 0
+        for record in records:
+            count += 1
+            freshness = _record_time(record, source_time)
+
+            if kind == 'catalog':
+                raw_name = record.get('name', '')
+                key = normalize_name(raw_name)
+                if key in GENERAL_KEYS:
+                    continue
+                entry = self._entry(key)
+                entry['names'][raw_name] = entry['names'].get(raw_name, 0) + 1
+                for field in CARE_FIELDS:
+                    if field in record:
+                        self._offer(entry, field, name, priority, freshness, record[field], append=False,
+                                    template=is_template_value(record, field))
+                continue
+
+            raw_name = record.get('species', '')
+            key = normalize_name(raw_name)
+            topic = (record.get('category') or '').lower()
+            if key in GENERAL_KEYS:
+                self.general.append({'topic': topic, 'text': record.get('text', ''), 'source': name})
+                continue
+            entry = self._entry(key)
+            entry['names'][raw_name] = entry['names'].get(raw_name, 0) + 1
+            field = SNIPPET_FIELDS.get(topic, 'tips')
+            self._offer(entry, field, name, priority, freshness, record.get('text', ''))
+            if record.get('difficulty'):
+                difficulty = DIFFICULTY_LABELS.get(record['difficulty'].lower(), record['difficulty'])
+                self._offer(entry, 'difficulty', name, priority, freshness, difficulty)
+
+        self.sources.append({'name': name, 'kind': kind, 'priority': priority,
+                             'records': count, 'modified_at': source_time})
+
+    def add_file(self, name: str, path: str, kind: str, priority: int) -> bool:
+        """Stream a source file; returns False if it does not exist."""
+        if not os.path.exists(path):
+            return False
+        modified = datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc).isoformat()
+        self.add_source(name, iter_records(path), kind, priority, modified)
+        return True
+
+    def resolve(self) -> List[Dict[str, Any]]:
+        """Pick the winning value for every field of every species."""
+        plants = []
+        for key in sorted(self.table):
+            entry = self.table[key]
+            names = sorted(entry['names'], key=lambda n: (-entry['names'][n], -len(n), n))
+            record = {'key': key, 'name': names[0], 'aliases': names[1:]}
+            provenance = {}
+            for field in CARE_FIELDS:
+                candidates = entry['fields'].get(field)
+                if not candidates:
+                    record[field] = ''
+                    continue
+                source, (priority, freshness, texts, template) = max(
+                    candidates.items(), key=lambda item: (item[1][0], item[1][1])
+                )
+                record[field] = texts[0] if field in ('difficulty', 'category') else ' '.join(texts)
+                provenance[field] = {
+                    'source': source,
+                    'updated_at': freshness,
+                    # Category default from CARE_TEMPLATES, not a statement about this species
+                    'template': template,
+                    'alternatives': sorted(s for s in candidates if s != source),
+                }
+            record['provenance'] = provenance
+            plants.append(record)
+        return plants
+
+
+def is_template_field(plant: Dict[str, Any], field: str) -> bool:
+    """Whether a catalog record's field holds category template text.
+
+    Merged records answer from their provenance; raw fast_plant_database
+    records are compared against CARE_TEMPLATES directly.
+    """
+    provenance = (plant.get('provenance') or {}).get(field)
+    if provenance is not None and 'template' in provenance:
+        return provenance['template']
+    return is_template_value(plant, field)
+
+
+def content_hash(plants: List[Dict[str, Any]]) -> str:
+    digest = hashlib.sha256()
+    for plant in plants:
+        digest.update(json.dumps({k: v for k, v in plant.items() if k != 'provenance'},
+                                 sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def build_catalog(sources=None, include_generated: bool = True) -> Dict[str, Any]:
+    """Merge all configured sources into an (unversioned) catalog document.
+
+    If fast_plant_care_data.json has not been generated yet, the fast
+    database is built in memory instead so the merged catalog is complete.
+    """
+    merger = CatalogMerger()
+    for name, rel_path, kind, priority in sources or SOURCES:
+        path = os.path.join(BASE_DIR, rel_path)
+        if merger.add_file(name, path, kind, priority):
+            continue
+        if name == 'fast_plant_database' and include_generated:
+            from fast_plant_database import FastPlantDatabase
+            merger.add_source(name, iter(FastPlantDatabase().plant_database), kind, priority,
+                              datetime.now(timezone.utc).isoformat())
+        else:
+            print(f"⚠️ Skipping missing source: {rel_path}")
+
+    plants = merger.resolve()
+    return {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'content_hash': content_hash(plants),
+        'sources': merger.sources,
+        'general': merger.general,
+        'plants': plants,
+    }
+
+
+def save_catalog(catalog: Dict[str, Any], output_path: str) -> Dict[str, Any]:
+    """Write the catalog, bumping its version only when the content changed."""
+    previous_version = 0
+    previous_hash = None
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        previous_version = previous.get('version', 0)
+        previous_hash = previous.get('content_hash')
+
+    if previous_hash == catalog['content_hash']:
+        catalog['version'] = previous_version
+        return catalog
+
+    catalog['version'] = previous_version + 1
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': catalog['version'], **catalog}, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, output_path)
+    return catalog
+
+
+def main():
+    """Merge every care data source into data/plant_catalog.json."""
+    parser = argparse.ArgumentParser(description='Merge care data sources into one catalog')
+    parser.add_argument('--output', default=os.path.join(BASE_DIR, 'data', 'plant_catalog.json'))
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Care Data Merge Engine")
+    print("=" * 50)
+
+    catalog = build_catalog()
+    catalog = save_catalog(catalog, args.output)
+
+    for source in catalog['sources']:
+        print(f"📥 {source['name']}: {source['records']} records (priority {source['priority']})")
+    print(f"✅ {len(catalog['plants'])} canonical plants, {len(catalog['general'])} general tips")
+    print(f"💾 Catalog version {catalog['version']} at {args.output}")
+
+    from answer_table import build_answer_table, save_answer_table
+    answers_path = os.path.join(os.path.dirname(args.output), 'answer_table.json')
+    save_answer_table(build_answer_table(catalog), answers_path)
+    print(f"⚡ Answer table saved to {answers_path}")
+
+    from catalog_release import publish_release
+    plants = [{k: v for k, v in plant.items() if k != 'provenance'} for plant in catalog['plants']]
+    # The release numbers its own versions: plant_catalog.json may be regenerated from v1
+    manifest = publish_release(plants, 'plant_catalog', key_fields=('key',))
+    print(f"📦 Release v{manifest['version']} published for hot reload")
+
+if __name__ == "__main__":
+    main()
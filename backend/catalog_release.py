@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Versioned Catalog Releases
+================================================
+
+This module publishes a care catalog (a list of plant records) as numbered
+releases that long-running consumers can hot-reload:
+
+    catalog_releases/<name>/manifest.json
+    catalog_releases/<name>/snapshot-v<N>.json
+    catalog_releases/<name>/delta-v<N-1>-v<N>.json
+
+Every publish whose content differs from the previous release gets the next
+version number, a full snapshot, and a compact delta holding only the
+records added, changed or removed since the previous version. The manifest
+is written last, so a consumer that sees version N can always read its
+files. Consumers poll the (small) manifest and apply just the deltas they
+are missing, falling back to the snapshot when they are too far behind.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Sequence
+
+BASE_DIR = os.path.dirname(__file__)
+RELEASE_ROOT = os.path.join(BASE_DIR, 'catalog_releases')
+MANIFEST_NAME = 'manifest.json'
+
+# Deltas kept in the manifest; older consumers reload the snapshot
+MAX_DELTAS = 20
+
+DEFAULT_KEY_FIELDS = ('name', 'category')
+
+
+def record_keys(records: List[Dict[str, Any]], key_fields: Sequence[str] = DEFAULT_KEY_FIELDS) -> List[str]:
+    """Stable identity for each record.
+
+    The fast database repeats some names across families, so the key joins
+    several fields and numbers any remaining repeats in order of appearance.
+    """
+    keys = []
+    seen: Dict[str, int] = {}
+    for record in records:
+        base = '|'.join(str(record.get(field, '')).strip().lower() for field in key_fields)
+        count = seen.get(base, 0)
+        seen[base] = count + 1
+        keys.append(base if count == 0 else f"{base}#{count + 1}")
+    return keys
+
+
+def record_digest(record: Dict[str, Any]) -> str:
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()
+
+
+def content_hash(keys: List[str], records: List[Dict[str, Any]]) -> str:
+    digest = hashlib.sha256()
+    for key, record in zip(keys, records):
+        digest.update(key.encode('utf-8'))
+        digest.update(record_digest(record).encode('ascii'))
+    return digest.hexdigest()
+
+
+def diff_records(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute added/changed/removed between two key -> record maps."""
+    added = {}
+    changed = {}
+    for key, record in new.items():
+        previous = old.get(key)
+        if previous is None:
+            added[key] = record
+        elif record_digest(previous) != record_digest(record):
+            changed[key] = record
+    removed = [key for key in old if key not in new]
+    return {'added': added, 'changed': changed, 'removed': removed}
+
+
+def _write_json(path: str, payload: Any):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> Any:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_manifest(release_dir: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(release_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    return _read_json(path)
+
+
+def load_snapshot(release_dir: str, manifest: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    snapshot = _read_json(os.path.join(release_dir, manifest['snapshot']))
+    return dict(zip(snapshot['keys'], snapshot['records']))
+
+
+def publish_release(records: List[Dict[str, Any]], name: str = 'fast_plant_care',
+                    release_root: str = RELEASE_ROOT,
+                    key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+                    version: Optional[int] = None) -> Dict[str, Any]:
+    """Publish records as the next catalog release and return the manifest.
+
+    Nothing is written when the content matches the current release. An
+    explicit `version` (e.g. the merged catalog's own version) must be
+    greater than the current one.
+    """
+    release_dir = os.path.join(release_root, name)
+    os.makedirs(release_dir, exist_ok=True)
+
+    keys = record_keys(records, key_fields)
+    digest = content_hash(keys, records)
+    manifest = read_manifest(release_dir)
+    if manifest and manifest['content_hash'] == digest:
+        return manifest
+
+    previous_version = manifest['version'] if manifest else 0
+    if version is None:
+        version = previous_version + 1
+    elif version <= previous_version:
+        raise ValueError(f"Release version {version} is not newer than {previous_version}")
+
+    current = dict(zip(keys, records))
+    deltas = list(manifest['deltas']) if manifest else []
+    delta_entry = None
+    if manifest:
+        delta = diff_records(load_snapshot(release_dir, manifest), current)
+        delta_name = f"delta-v{previous_version}-v{version}.json"
+        _write_json(os.path.join(release_dir, delta_name), {
+            'from_version': previous_version,
+            'to_version': version,
+            **delta,
+        })
+        delta_entry = {
+            'from_version': previous_version,
+            'to_version': version,
+            'file': delta_name,
+            'added': len(delta['added']),
+            'changed': len(delta['changed']),
+            'removed': len(delta['removed']),
+        }
+        deltas.append(delta_entry)
+
+    snapshot_name = f"snapshot-v{version}.json"
+    _write_json(os.path.join(release_dir, snapshot_name), {
+        'version': version,
+        'keys': keys,
+        'records': records,
+    })
+
+    expired, deltas = deltas[:-MAX_DELTAS], deltas[-MAX_DELTAS:]
+    new_manifest = {
+        'name': name,
+        'version': version,
+        'content_hash': digest,
+        'record_count': len(records),
+        'key_fields': list(key_fields),
+        'published_at': datetime.now(timezone.utc).isoformat(),
+        'snapshot': snapshot_name,
+        'deltas': deltas,
+    }
+    _write_json(os.path.join(release_dir, MANIFEST_NAME), new_manifest)
+
+    # Old files go only after the manifest stops pointing at them
+    stale = [entry['file'] for entry in expired]
+    if manifest:
+        stale.append(manifest['snapshot'])
+    for filename in stale:
+        try:
+            os.remove(os.path.join(release_dir, filename))
+        except FileNotFoundError:
+            pass
+
+    return new_manifest
+
+
+def apply_delta(records: Dict[str, Dict[str, Any]], delta: Dict[str, Any]):
+    """Apply one release delta to a key -> record mapping in place."""
+    for key in delta['removed']:
+        records.pop(key, None)
+    records.update(delta['changed'])
+    records.update(delta['added'])
+
+
+class CatalogReloader:
+    """Keep an in-memory copy of a published catalog current.
+
+    Call `poll()` periodically; it stats the manifest, and only when it has
+    changed reads it and applies the missing deltas in order.
+    """
+
+    def __init__(self, name: str = 'fast_plant_care', release_root: str = RELEASE_ROOT):
+        self.release_dir = os.path.join(release_root, name)
+        self.version = 0
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self._manifest_mtime = None
+
+    def poll(self) -> bool:
+        """Bring the catalog up to date; return True if it changed."""
+        path = os.path.join(self.release_dir, MANIFEST_NAME)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._manifest_mtime:
+            return False
+
+        manifest = _read_json(path)
+        if manifest['version'] == self.version:
+            self._manifest_mtime = mtime
+            return False
+
+        # Build the new version on a copy: if a delta or snapshot can't be read
+        # (e.g. mid-publish), nothing changes and the next poll retries
+        chain = self._delta_chain(manifest)
+        if chain is None:
+            records = load_snapshot(self.release_dir, manifest)
+        else:
+            records = dict(self.records)
+            for entry in chain:
+                apply_delta(records, _read_json(os.path.join(self.release_dir, entry['file'])))
+        self.records = records
+        self.version = manifest['version']
+        self._manifest_mtime = mtime
+        return True
+
+    def _delta_chain(self, manifest: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Deltas leading from our version to the manifest's, or None if not all retained."""
+        if not self.version:
+            return None
+        by_start = {entry['from_version']: entry for entry in manifest['deltas']}
+        chain = []
+        version = self.version
+        while version != manifest['version']:
+            entry = by_start.get(version)
+            if entry is None:
+                return None
+            chain.append(entry)
+            version = entry['to_version']
+        return chain
+
+    def apply_delta(self, delta: Dict[str, Any]):
+        apply_delta(self.records, delta)
+
+    def values(self) -> List[Dict[str, Any]]:
+        return list(self.records.values())
+
+
+def main():
+    """Publish a catalog file as the next release and report what changed."""
+    parser = argparse.ArgumentParser(description='Publish a versioned catalog release')
+    parser.add_argument('--input', default=os.path.join(BASE_DIR, 'fast_plant_care_data.json'))
+    parser.add_argument('--name', default='fast_plant_care')
+    parser.add_argument('--release-root', default=RELEASE_ROOT)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Catalog Release")
+    print("=" * 45)
+
+    data = _read_json(args.input)
+    if isinstance(data, dict):
+        # Canonical catalog produced by catalog_merge.py
+        manifest = publish_release(data['plants'], args.name, args.release_root,
+                                   key_fields=('key',))
+    else:
+        manifest = publish_release(data, args.name, args.release_root)
+
+    print(f"📦 {manifest['name']} v{manifest['version']}: {manifest['record_count']} records")
+    if manifest['deltas']:
+        latest = manifest['deltas'][-1]
+        print(f"🔄 Delta v{latest['from_version']}→v{latest['to_version']}: +{latest['added']} "
+              f"~{latest['changed']} -{latest['removed']}")
+
+if __name__ == "__main__":
+    main()
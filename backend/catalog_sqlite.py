@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - SQLite Catalog Artifact
+=============================================
+
+This module writes the care catalog to a SQLite database next to the JSON
+exports, so readers get indexed lookups instead of parsing and scanning one
+large JSON array:
+
+- categories    one row per family, with its partition group
+- plants        one row per record with every care field
+- aliases       alternate names (catalog aliases and SPECIES_ALIASES)
+- care_ranges   numeric ranges parsed from the text (temperature in °F/°C,
+                humidity %, watering and fertilizing interval in days where
+                the text states one)
+- plant_text    FTS5 index over names and all care text
+- meta          catalog version, content hash and build time
+
+B-tree indexes cover name, category, difficulty, toxicity and range
+lookups. The database is built in a temporary file in one bulk transaction
+and moved into place atomically, so readers never see a partial build.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+BASE_DIR = os.path.dirname(__file__)
+DEFAULT_DB = os.path.join(BASE_DIR, 'fast_plant_care.db')
+
+TEXT_FIELDS = ['watering', 'light', 'soil', 'temperature', 'humidity', 'fertilizer', 'pruning',
+               'propagation', 'common_problems', 'tips']
+
+# Typical relative humidity (%) for the phrases used in the catalog templates
+HUMIDITY_LEVELS = [
+    ('low humidity', (20, 40)),
+    ('normal household humidity', (30, 50)),
+    ('normal to high humidity', (40, 60)),
+    ('high humidity', (50, 80)),
+]
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    partition TEXT NOT NULL
+);
+
+CREATE TABLE plants (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    category_id INTEGER REFERENCES categories(id),
+    difficulty TEXT,
+    toxicity TEXT,
+    watering TEXT,
+    light TEXT,
+    soil TEXT,
+    temperature TEXT,
+    humidity TEXT,
+    fertilizer TEXT,
+    pruning TEXT,
+    propagation TEXT,
+    common_problems TEXT,
+    tips TEXT
+);
+
+CREATE TABLE aliases (
+    alias TEXT NOT NULL,
+    plant_id INTEGER NOT NULL REFERENCES plants(id),
+    PRIMARY KEY (alias, plant_id)
+) WITHOUT ROWID;
+
+CREATE TABLE care_ranges (
+    plant_id INTEGER NOT NULL REFERENCES plants(id),
+    attribute TEXT NOT NULL,
+    min_value REAL NOT NULL,
+    max_value REAL NOT NULL,
+    unit TEXT NOT NULL,
+    PRIMARY KEY (plant_id, attribute)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE plant_text USING fts5(
+    name, aliases, category, care_text,
+    tokenize = 'porter unicode61'
+);
+"""
+
+INDEXES = """
+CREATE INDEX idx_plants_key ON plants(key);
+CREATE INDEX idx_plants_name ON plants(name COLLATE NOCASE);
+CREATE INDEX idx_plants_category ON plants(category_id);
+CREATE INDEX idx_plants_difficulty ON plants(difficulty);
+CREATE INDEX idx_plants_toxicity ON plants(toxicity);
+CREATE INDEX idx_care_ranges_attribute ON care_ranges(attribute, min_value, max_value);
+"""
+
+
+def parse_temperature(text: str) -> List[Tuple[str, float, float, str]]:
+    """Ranges like "65-75°F (18-24°C)" -> [('temperature_f', 65, 75, '°F'), ('temperature_c', ...)]."""
+    ranges = []
+    for low, high, unit in re.findall(r'(-?\d+)\s*-\s*(-?\d+)\s*°\s*([FC])', text or ''):
+        attribute = 'temperature_f' if unit == 'F' else 'temperature_c'
+        if not any(r[0] == attribute for r in ranges):
+            ranges.append((attribute, float(low), float(high), f"°{unit}"))
+    return ranges
+
+
+def parse_humidity(text: str) -> Optional[Tuple[float, float]]:
+    lowered = (text or '').lower()
+    match = re.search(r'(\d+)\s*-\s*(\d+)\s*%', lowered)
+    if match:
+        return float(match.group(1)), float(match.group(2))
+    found = None
+    for phrase, levels in HUMIDITY_LEVELS:
+        if phrase in lowered:
+            found = levels
+    return found
+
+
+def care_ranges(plant: Dict[str, Any]) -> List[Tuple[str, float, float, str]]:
+    """All numeric ranges the record's care text actually states."""
+    from care_scheduler import explicit_interval_days
+
+    ranges = parse_temperature(plant.get('temperature', ''))
+    humidity = parse_humidity(plant.get('humidity', ''))
+    if humidity:
+        ranges.append(('humidity_pct', humidity[0], humidity[1], '%'))
+    for attribute, field in (('watering_days', 'watering'), ('fertilizing_days', 'fertilizer')):
+        # Scheduler defaults and phrase guesses are not catalog data
+        days = explicit_interval_days(plant.get(field, ''))
+        if days is not None:
+            ranges.append((attribute, days, days, 'days'))
+    return ranges
+
+
+def build_catalog_db(plants: List[Dict[str, Any]], path: str = DEFAULT_DB,
+                     version: Optional[int] = None) -> Dict[str, int]:
+    """Write plant records (fast database or merged catalog format) to a SQLite file."""
+    from catalog_merge import SPECIES_ALIASES, normalize_name, content_hash
+    from partitioned_collection import partition_for
+
+    tmp_path = path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        # Nothing reads the temporary file, so skip the journal entirely
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.executescript(SCHEMA)
+
+        aliases_by_key: Dict[str, List[str]] = {}
+        for alias, key in SPECIES_ALIASES.items():
+            aliases_by_key.setdefault(key, []).append(alias)
+
+        category_ids: Dict[str, int] = {}
+        plant_rows, alias_rows, range_rows, text_rows = [], [], [], []
+        for plant_id, plant in enumerate(plants, 1):
+            category = plant.get('category') or ''
+            if category and category not in category_ids:
+                category_ids[category] = len(category_ids) + 1
+
+            key = plant.get('key') or normalize_name(plant['name'])
+            plant_rows.append((plant_id, key, plant['name'], category_ids.get(category),
+                               plant.get('difficulty', ''), plant.get('toxicity', ''),
+                               *(plant.get(field, '') for field in TEXT_FIELDS)))
+
+            aliases = sorted({normalize_name(a) for a in plant.get('aliases', [])}
+                             | set(aliases_by_key.get(key, [])))
+            alias_rows.extend((alias, plant_id) for alias in aliases if alias != key)
+            range_rows.extend((plant_id, *r) for r in care_ranges(plant))
+            text_rows.append((plant_id, plant['name'], ' '.join(aliases), category,
+                              ' '.join(plant.get(field, '') for field in TEXT_FIELDS)))
+
+        with conn:
+            conn.executemany('INSERT INTO categories (id, name, partition) VALUES (?, ?, ?)',
+                             [(cid, name, partition_for(name)) for name, cid in category_ids.items()])
+            conn.executemany(f"INSERT INTO plants VALUES ({', '.join('?' * (6 + len(TEXT_FIELDS)))})",
+                             plant_rows)
+            conn.executemany('INSERT OR IGNORE INTO aliases VALUES (?, ?)', alias_rows)
+            conn.executemany('INSERT INTO care_ranges VALUES (?, ?, ?, ?, ?)', range_rows)
+            conn.executemany('INSERT INTO plant_text (rowid, name, aliases, category, care_text) '
+                             'VALUES (?, ?, ?, ?, ?)', text_rows)
+            conn.executescript(INDEXES)
+            conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+                ('version', str(version or 0)),
+                ('content_hash', content_hash(plants)),
+                ('record_count', str(len(plants))),
+                ('built_at', datetime.now(timezone.utc).isoformat()),
+            ])
+        conn.execute("INSERT INTO plant_text (plant_text) VALUES ('optimize')")
+        conn.execute('ANALYZE')
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    return {
+        'plants': len(plant_rows),
+        'categories': len(category_ids),
+        'aliases': len(alias_rows),
+        'ranges': len(range_rows),
+    }
+
+
+class CatalogDB:
+    """Read-only queries over a catalog database built by build_catalog_db."""
+
+    def __init__(self, path: str = DEFAULT_DB):
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._metadata: Optional[List[Dict[str, Any]]] = None
+        self._metadata_index = None
+
+    def _plants(self, where: str, params: Tuple = (), limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        sql = ('SELECT p.*, c.name AS category FROM plants p '
+               f'LEFT JOIN categories c ON c.id = p.category_id WHERE {where}')
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        return [self._record(row) for row in self.conn.execute(sql, params)]
+
+    @staticmethod
+    def _record(row: sqlite3.Row) -> Dict[str, Any]:
+        record = dict(row)
+        record.pop('category_id', None)
+        return record
+
+    def meta(self) -> Dict[str, str]:
+        return dict(self.conn.execute('SELECT key, value FROM meta').fetchall())
+
+    def lookup(self, name: str) -> List[Dict[str, Any]]:
+        """Plants whose name, key or alias matches `name` exactly (normalized)."""
+        from catalog_merge import normalize_name
+
+        key = normalize_name(name)
+        return self._plants(
+            'p.key = ? OR p.name = ? COLLATE NOCASE '
+            'OR p.id IN (SELECT plant_id FROM aliases WHERE alias = ?)',
+            (key, name.strip(), key))
+
+    def by_category(self, category: str) -> List[Dict[str, Any]]:
+        return self._plants('c.name = ? COLLATE NOCASE', (category,))
+
+    def filter(self, difficulty: Optional[str] = None, toxicity: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        clauses, params = ['1'], []
+        if difficulty:
+            clauses.append('p.difficulty = ?')
+            params.append(difficulty)
+        if toxicity:
+            clauses.append('p.toxicity = ?')
+            params.append(toxicity)
+        return self._plants(' AND '.join(clauses), tuple(params), limit)
+
+    def in_range(self, attribute: str, value: float) -> List[Dict[str, Any]]:
+        """Plants whose `attribute` range contains `value` (e.g. temperature_f, 58)."""
+        return self._plants(
+            'p.id IN (SELECT plant_id FROM care_ranges WHERE attribute = ? AND min_value <= ? AND max_value >= ?)',
+            (attribute, value, value))
+
+    def metadata_index(self):
+        """Bitmap index over this catalog's own rows: ordinal i is plant id i + 1."""
+        from metadata_bitmaps import MetadataBitmapIndex
+
+        if self._metadata_index is None:
+            self._metadata = [dict(row) for row in self.conn.execute(
+                'SELECT c.name AS category, p.difficulty, p.toxicity FROM plants p '
+                'LEFT JOIN categories c ON c.id = p.category_id ORDER BY p.id')]
+            index = MetadataBitmapIndex()
+            index.add(self._metadata)
+            self._metadata_index = index
+        return self._metadata_index
+
+    def filter_ids(self, where: Dict[str, Any]) -> List[int]:
+        """Plant ids matching a Chroma-style filter on category, difficulty and toxicity."""
+        bitmap, exact = self.metadata_index().evaluate(where)
+        positions = range(len(self._metadata)) if bitmap is None else bitmap.to_array().tolist()
+        if not exact:
+            from local_collection import matches_where
+            positions = [p for p in positions if matches_where(self._metadata[p], where)]
+        return [p + 1 for p in positions]
+
+    def search(self, text: str, limit: int = 10, where: Optional[Dict[str, Any]] = None,
+               candidates: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Full-text search over names and care text, best BM25 match first.
+
+        `where` is a metadata filter evaluated on this catalog's own bitmap
+        index (see filter_ids), and `candidates` restricts the search to those
+        plant ids; both apply before ranking. Positions in a LocalCollection or
+        Chroma collection are not plant ids: those collections may be deduped
+        or ordered differently.
+        """
+        terms = re.findall(r'\w+', text.lower())
+        if not terms:
+            return []
+        if where:
+            allowed = self.filter_ids(where)
+            candidates = allowed if candidates is None else sorted(set(allowed) & {int(c) for c in candidates})
+        query = ' OR '.join(f'"{term}"' for term in terms)
+        sql = 'SELECT rowid, bm25(plant_text, 10.0, 5.0, 2.0, 1.0) AS score FROM plant_text WHERE plant_text MATCH ?'
+        params: Tuple = (query,)
+        if candidates is not None:
+            # plant_text rowids are plant ids
+            sql += ' AND rowid IN (SELECT value FROM json_each(?))'
+            params += (json.dumps([int(c) for c in candidates]),)
+        rows = self.conn.execute(sql + ' ORDER BY score LIMIT ?', params + (limit,)).fetchall()
+        if not rows:
+            return []
+        ids = [row['rowid'] for row in rows]
+        by_id = {record['id']: record for record in
+                 self._plants(f"p.id IN ({', '.join('?' * len(ids))})", tuple(ids))}
+        results = []
+        for row in rows:
+            record = by_id[row['rowid']]
+            record['score'] = -row['score']
+            results.append(record)
+        return results
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    """Build the SQLite catalog from a JSON export and run a few sample queries."""
+    parser = argparse.ArgumentParser(description='Build the SQLite care catalog')
+    parser.add_argument('--input', default=os.path.join(BASE_DIR, 'fast_plant_care_data.json'),
+                        help='fast database export or merged catalog (data/plant_catalog.json)')
+    parser.add_argument('--output', default=DEFAULT_DB)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - SQLite Catalog")
+    print("=" * 45)
+
+    version = None
+    if os.path.exists(args.input):
+        with open(args.input, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            version = data.get('version')
+            data = data['plants']
+    else:
+        from fast_plant_database import FastPlantDatabase
+        print("⚠️ Input not found, generating the fast database in memory")
+        data = FastPlantDatabase().plant_database
+
+    counts = build_catalog_db(data, args.output, version=version)
+    print(f"💾 {counts['plants']} plants, {counts['categories']} categories, {counts['aliases']} aliases, "
+          f"{counts['ranges']} care ranges → {args.output}")
+
+    db = CatalogDB(args.output)
+    for plant in db.lookup('Sansevieria'):
+        print(f"🔍 lookup 'Sansevieria' → {plant['name']} ({plant['category']})")
+    hits = db.search('mist humidity fern', limit=3)
+    print(f"📝 search 'mist humidity fern' → {', '.join(p['name'] for p in hits)}")
+    print(f"🌡️ {len(db.in_range('temperature_f', 78))} plants tolerate 78°F")
+    db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Compiled Care Document Renderer
+=====================================================
+
+Chroma documents are "Label: value" segments joined with " | ". Most values
+come from a small set of CARE_TEMPLATES strings, so building the same
+segments with f-strings for every record repeats the same work millions of
+times on a synthetic catalog.
+
+A DocumentRenderer compiles a field layout once and caches every rendered
+segment by its source string, both as plain text and JSON-escaped:
+
+- `render(record)` returns the document text (used by format_for_chroma in
+  fast_plant_database.py and plant_scraper.py)
+- `write_jsonl(records, stream)` streams whole Chroma documents as JSON
+  lines through a reusable buffer. The escaped segments are reused, and no
+  per-document dict or json.dumps call is needed, so formatting a sharded
+  catalog is bound by reading and writing rather than by formatting
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from json.encoder import encode_basestring
+from typing import List, Dict, Any, Iterable, Callable, Tuple
+
+# (label, record field) in document order, as used by format_for_chroma
+CARE_DOCUMENT_FIELDS = [
+    ('Plant', 'name'),
+    ('Watering', 'watering'),
+    ('Light', 'light'),
+    ('Soil', 'soil'),
+    ('Temperature', 'temperature'),
+    ('Humidity', 'humidity'),
+    ('Fertilizer', 'fertilizer'),
+    ('Pruning', 'pruning'),
+    ('Propagation', 'propagation'),
+    ('Common Problems', 'common_problems'),
+    ('Care Tips', 'tips'),
+    ('Difficulty', 'difficulty'),
+    ('Toxicity', 'toxicity'),
+    ('Category', 'category'),
+]
+
+# The scraper's documents have no category line
+SCRAPED_DOCUMENT_FIELDS = CARE_DOCUMENT_FIELDS[:-1]
+
+METADATA_FIELDS = ['name', 'category', 'difficulty', 'toxicity']
+
+# Segment caches stop growing at this many entries, which only happens for
+# fields whose values are unique per record (like names)
+MAX_CACHED_SEGMENTS = 1 << 16
+
+
+def _json_value(value) -> str:
+    return encode_basestring(value) if type(value) is str else json.dumps(value, ensure_ascii=False)
+
+
+class DocumentRenderer:
+    """A compiled "Label: value | ..." layout with per-field segment caches.
+
+    The layout is turned into straight-line Python once per renderer: every
+    field becomes a dictionary lookup of its pre-rendered segment, falling
+    back to rendering (and caching) it on a miss.
+    """
+
+    def __init__(self, fields: List[Tuple[str, str]] = None, separator: str = ' | ',
+                 metadata_fields: List[str] = None, max_cached: int = MAX_CACHED_SEGMENTS):
+        self.fields = list(fields or CARE_DOCUMENT_FIELDS)
+        self.separator = separator
+        self.metadata_fields = list(metadata_fields or METADATA_FIELDS)
+        self.max_cached = max_cached
+        self.misses = 0
+
+        namespace = {'encode': encode_basestring, 'separator': separator}
+        text_parts, json_parts = [], []
+        for slot, (label, field) in enumerate(self.fields):
+            namespace[f'text_cache{slot}'], namespace[f'text_miss{slot}'] = self._cache(
+                lambda value, prefix=f"{label}: ": f"{prefix}{value}")
+            namespace[f'json_cache{slot}'], namespace[f'json_miss{slot}'] = self._cache(
+                lambda value, prefix=f"{label}: ": encode_basestring(f"{prefix}{value}")[1:-1])
+            lookup = f"(value{slot} := record[{field!r}])"
+            text_parts.append(f"(text_cache{slot}.get({lookup}) or text_miss{slot}(value{slot}))")
+            json_parts.append(f"(json_cache{slot}.get({lookup}) or json_miss{slot}(value{slot}))")
+
+        metadata_parts = []
+        for position, field in enumerate(self.metadata_fields):
+            namespace[f'meta_cache{position}'], namespace[f'meta_miss{position}'] = self._cache(_json_value)
+            key = encode_basestring(field)
+            metadata_parts.append(repr(f"{key}: " if position == 0 else f", {key}: "))
+            metadata_parts.append(f"(meta_cache{position}.get(meta{position} := record[{field!r}])"
+                                  f" or meta_miss{position}(meta{position}))")
+
+        json_separator = repr(encode_basestring(separator)[1:-1])
+        source = (
+            "def render(record):\n"
+            f"    return separator.join(({', '.join(text_parts)},))\n"
+            "def render_line(record, doc_id, tail):\n"
+            "    return ''.join(('{\"id\": ', encode(doc_id), ', \"document\": \"', "
+            + f", {json_separator}, ".join(json_parts)
+            + ", '\", \"metadata\": {', " + ", ".join(metadata_parts) + ", tail))\n"
+        )
+        exec(compile(source, f'<DocumentRenderer {len(self.fields)} fields>', 'exec'), namespace)
+        self.render = namespace['render']
+        self.render_line = namespace['render_line']
+
+    def _cache(self, render: Callable[[Any], str]):
+        """A segment cache and its miss handler; caches stop growing at max_cached."""
+        cache: Dict[Any, str] = {}
+
+        def miss(value):
+            self.misses += 1
+            segment = render(value)
+            if len(cache) < self.max_cached:
+                cache[value] = segment
+            return segment
+
+        return cache, miss
+
+    def write_jsonl(self, records: Iterable[Dict[str, Any]], stream,
+                    id_for: Callable[[int, Dict[str, Any]], str] = None,
+                    source: str = 'Fast Plant Database', created_at: str = None,
+                    flush_every: int = 1024) -> int:
+        """Stream one Chroma document per line ({id, document, metadata}) to `stream`.
+
+        Records without an `id` get format_for_chroma's plant_NNN ids unless
+        `id_for(index, record)` says otherwise. Returns the number written.
+        """
+        created_at = encode_basestring(created_at or datetime.now().isoformat())
+        tail = f', "source": {encode_basestring(source)}, "created_at": {created_at}}}}}\n'
+        render_line = self.render_line
+        buffer: List[str] = []
+        count = 0
+        for index, record in enumerate(records):
+            if id_for is not None:
+                doc_id = id_for(index, record)
+            else:
+                doc_id = record.get('id') or f"plant_{index + 1:03d}"
+            buffer.append(render_line(record, doc_id, tail))
+            count += 1
+            if len(buffer) >= flush_every:
+                stream.write(''.join(buffer))
+                buffer.clear()
+        if buffer:
+            stream.write(''.join(buffer))
+        return count
+
+
+def iter_catalog_records(path: str) -> Iterable[Dict[str, Any]]:
+    """Records from a JSON catalog, a JSON Lines file or a synthetic catalog directory."""
+    if os.path.isdir(path):
+        with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as f:
+            shards = json.load(f)['shards']
+        for shard in shards:
+            yield from iter_catalog_records(os.path.join(path, shard['file']))
+    elif path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            plants = json.load(f)
+        yield from plants['plants'] if isinstance(plants, dict) else plants
+
+
+def main():
+    """Stream a catalog into Chroma documents as JSON lines and report throughput."""
+    parser = argparse.ArgumentParser(description='Render plant care documents for Chroma')
+    parser.add_argument('input', help='catalog JSON, JSON Lines file or synthetic catalog directory')
+    parser.add_argument('--output', help='JSON Lines output (default: discard, to time rendering only)')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Compiled Care Document Renderer")
+    print("=" * 55)
+
+    renderer = DocumentRenderer()
+    started = time.perf_counter()
+    out = open(args.output, 'w', encoding='utf-8', buffering=1024 * 1024) if args.output else open(os.devnull, 'w')
+    try:
+        count = renderer.write_jsonl(iter_catalog_records(args.input), out)
+    finally:
+        out.close()
+    elapsed = time.perf_counter() - started
+
+    segments = count * (len(renderer.fields) + len(renderer.metadata_fields))
+    print(f"📊 {count} documents in {elapsed:.2f} s ({count / max(elapsed, 1e-9):,.0f} docs/s)")
+    print(f"⚡ Segment cache hit rate {1 - renderer.misses / max(segments, 1):.1%}")
+    if args.output:
+        print(f"💾 Saved to {os.path.abspath(args.output)}")
+
+if __name__ == "__main__":
+    main()
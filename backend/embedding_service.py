@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Micro-Batching Embedding Service
+======================================================
+
+This module puts an asyncio front-end in front of any embedding backend.
+Concurrent callers each ask for one text; the service coalesces identical
+texts that are already queued or in flight, groups the rest into batches, and
+flushes a batch when it reaches `max_batch_size` or when its oldest request
+has waited `max_latency_ms`. A semaphore caps how many backend calls run at
+once, so bursts of chat traffic become a few large calls instead of many
+small ones.
+
+Backends implement `embed_batch(texts) -> List[List[float]]`:
+
+- HashingEmbeddingBackend: deterministic local feature-hashing model for tests
+- OpenAIEmbeddingBackend: OpenAI embeddings API (imports openai lazily)
+- ChromaDefaultEmbeddingBackend: Chroma's bundled default model
+
+Author: Smart Plant Tracker Team
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import re
+import time
+from typing import List, Dict, Any, Optional
+
+
+class HashingEmbeddingBackend:
+    """Deterministic bag-of-words embedding via signed feature hashing.
+
+    Not a semantic model, but stable across runs and processes, dependency
+    free, and good enough to exercise batching, storage and retrieval code.
+    """
+
+    def __init__(self, dimension: int = 384, delay_ms: float = 0.0):
+        self.dimension = dimension
+        self.delay_ms = delay_ms
+        self.calls = 0
+        self.texts_embedded = 0
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimension
+        tokens = re.findall(r'[a-z0-9]+', text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], 'little') % self.dimension
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        self.texts_embedded += len(texts)
+        if self.delay_ms:
+            time.sleep(self.delay_ms / 1000)
+        return [self._embed(text) for text in texts]
+
+
+class OpenAIEmbeddingBackend:
+    """OpenAI embeddings API backend."""
+
+    def __init__(self, model: str = 'text-embedding-3-small', api_key: Optional[str] = None):
+        import openai
+
+        self.model = model
+        self.client = openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        response = self.client.embeddings.create(model=self.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+class ChromaDefaultEmbeddingBackend:
+    """Chroma's default local embedding function (all-MiniLM-L6-v2)."""
+
+    def __init__(self):
+        from chromadb.utils import embedding_functions
+
+        self.function = embedding_functions.DefaultEmbeddingFunction()
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return [list(map(float, vector)) for vector in self.function(texts)]
+
+
+BACKENDS = {
+    'hashing': HashingEmbeddingBackend,
+    'openai': OpenAIEmbeddingBackend,
+    'chroma': ChromaDefaultEmbeddingBackend,
+}
+
+
+class EmbeddingService:
+    """Coalescing micro-batcher over an embedding backend.
+
+    Must be used from within a running event loop. Backend calls run in the
+    default thread pool unless the backend provides an `aembed_batch`
+    coroutine.
+    """
+
+    def __init__(self, backend, max_batch_size: int = 64, max_latency_ms: float = 10.0,
+                 max_concurrency: int = 4):
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+        # text -> future shared by every caller waiting on that text
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._queue: List[str] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        self.stats = {'requests': 0, 'coalesced': 0, 'batches': 0, 'texts': 0}
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed one text, sharing work with identical concurrent requests."""
+        self.stats['requests'] += 1
+        future = self._pending.get(text)
+        if future is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[text] = future
+        self._queue.append(text)
+
+        if len(self._queue) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush)
+
+        return await asyncio.shield(future)
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts through the batcher, preserving order."""
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    async def drain(self):
+        """Flush the queue and wait for every in-flight batch to finish."""
+        self._flush()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queue:
+            batch = self._queue[:self.max_batch_size]
+            del self._queue[:self.max_batch_size]
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[str]):
+        async with self.semaphore:
+            try:
+                if hasattr(self.backend, 'aembed_batch'):
+                    vectors = await self.backend.aembed_batch(batch)
+                else:
+                    vectors = await asyncio.to_thread(self.backend.embed_batch, batch)
+                if len(vectors) != len(batch):
+                    raise RuntimeError(f"Backend returned {len(vectors)} vectors for {len(batch)} texts")
+            except Exception as e:
+                for text in batch:
+                    future = self._pending.pop(text, None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                return
+
+        self.stats['batches'] += 1
+        self.stats['texts'] += len(batch)
+        for text, vector in zip(batch, vectors):
+            future = self._pending.pop(text, None)
+            if future is not None and not future.done():
+                future.set_result(vector)
+
+
+def embed_documents(backend, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+    """Synchronously embed a document list in deduplicated fixed-size batches."""
+    unique = list(dict.fromkeys(texts))
+    vectors: Dict[str, List[float]] = {}
+    for i in range(0, len(unique), batch_size):
+        batch = unique[i:i + batch_size]
+        vectors.update(zip(batch, backend.embed_batch(batch)))
+    return [vectors[text] for text in texts]
+
+
+async def _burst_demo(requests: int, distinct: int):
+    backend = HashingEmbeddingBackend(delay_ms=20)
+    service = EmbeddingService(backend, max_batch_size=64, max_latency_ms=5, max_concurrency=4)
+    questions = [f"How often should I water plant number {i % distinct}?" for i in range(requests)]
+
+    latencies = []
+
+    async def ask(text):
+        started = time.perf_counter()
+        await service.embed(text)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(ask(q) for q in questions))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return service.stats, backend.calls, elapsed, latencies
+
+
+def main():
+    """Simulate a burst of chat queries against the local hashing backend."""
+    print("🌱 Smart Plant Tracker - Embedding Service Demo")
+    print("=" * 50)
+
+    stats, calls, elapsed, latencies = asyncio.run(_burst_demo(requests=2000, distinct=300))
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+
+    print(f"📊 {stats['requests']} requests, {stats['coalesced']} coalesced")
+    print(f"📦 {stats['batches']} batches ({calls} backend calls) for {stats['texts']} texts")
+    print(f"⏱️ {elapsed * 1000:.0f} ms total, p95 latency {p95 * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,556 @@ import os
 from datetime import datetime
 from typing import List, Dict, Any
 
+from document_renderer import DocumentRenderer, CARE_DOCUMENT_FIELDS
+
+# Common plant families and their variations
+PLANT_FAMILIES = {
+    'Pothos': ['Golden Pothos', 'Marble Queen Pothos', 'Neon Pothos', 'Jade Pothos', 'Manjula Pothos', 'Pearls and Jade Pothos', 'N\'Joy Pothos', 'Cebu Blue Pothos', 'Silver Pothos', 'Satin Pothos'],
+    'Philodendron': ['Heartleaf Philodendron', 'Split-leaf Philodendron', 'Brazil Philodendron', 'Pink Princess Philodendron', 'Prince of Orange Philodendron', 'Lemon Lime Philodendron', 'Brasil Philodendron', 'Rio Philodendron', 'Micans Philodendron', 'Xanadu Philodendron'],
+    'Ficus': ['Fiddle Leaf Fig', 'Rubber Plant', 'Weeping Fig', 'Ficus Benjamina', 'Ficus Elastica', 'Ficus Lyrata', 'Ficus Audrey', 'Ficus Altissima', 'Ficus Religiosa', 'Ficus Microcarpa'],
+    'Succulent': ['Echeveria', 'Haworthia', 'Lithops', 'Sedum', 'Crassula', 'Kalanchoe', 'Aeonium', 'Graptopetalum', 'Senecio', 'Agave', 'Aloe', 'Gasteria', 'Sempervivum', 'Echeveria', 'Pachyphytum', 'Adromischus', 'Cotyledon', 'Dudleya', 'Graptoveria', 'Pachyveria'],
+    'Cactus': ['Barrel Cactus', 'Prickly Pear', 'Christmas Cactus', 'Easter Cactus', 'Moon Cactus', 'Star Cactus', 'Golden Barrel Cactus', 'Saguaro Cactus', 'Bishop\'s Cap', 'Old Man Cactus', 'Bunny Ears Cactus', 'Ladyfinger Cactus', 'Rat Tail Cactus', 'Crown of Thorns'],
+    'Fern': ['Boston Fern', 'Maidenhair Fern', 'Bird\'s Nest Fern', 'Staghorn Fern', 'Rabbit\'s Foot Fern', 'Button Fern', 'Kimberly Queen Fern', 'Asparagus Fern', 'Lemon Button Fern', 'Cretan Brake Fern', 'Japanese Painted Fern', 'Royal Fern'],
+    'Palm': ['Areca Palm', 'Kentia Palm', 'Parlor Palm', 'Ponytail Palm', 'Lady Palm', 'Fishtail Palm', 'Bamboo Palm', 'Sago Palm', 'Windmill Palm', 'European Fan Palm', 'Pygmy Date Palm', 'Majesty Palm'],
+    'Herb': ['Basil', 'Mint', 'Rosemary', 'Thyme', 'Oregano', 'Parsley', 'Cilantro', 'Chives', 'Sage', 'Lavender', 'Dill', 'Fennel', 'Tarragon', 'Marjoram', 'Bay Laurel', 'Chervil', 'Borage', 'Catnip', 'Lemon Balm', 'Stevia'],
+    'Flowering': ['African Violet', 'Begonia', 'Geranium', 'Impatiens', 'Petunia', 'Marigold', 'Pansy', 'Snapdragon', 'Zinnia', 'Cosmos', 'Alyssum', 'Calendula', 'Nasturtium', 'Sweet Alyssum', 'Lobelia', 'Verbena', 'Salvia', 'Penstemon', 'Coreopsis', 'Gaillardia'],
+    'Tree': ['Lemon Tree', 'Orange Tree', 'Avocado', 'Fig Tree', 'Olive Tree', 'Bonsai', 'Norfolk Pine', 'Lime Tree', 'Mango Tree', 'Cherry Tree', 'Apple Tree', 'Pear Tree', 'Peach Tree', 'Plum Tree', 'Apricot Tree', 'Pomegranate Tree', 'Persimmon Tree', 'Guava Tree', 'Papaya Tree', 'Banana Tree'],
+    'Vine': ['English Ivy', 'Pothos', 'Philodendron', 'Hoya', 'String of Hearts', 'Tradescantia', 'Monstera Adansonii', 'Swiss Cheese Plant', 'Pothos', 'Scindapsus', 'Epipremnum', 'Syngonium', 'Pothos', 'Heartleaf Vine', 'Grape Ivy', 'Creeping Fig', 'Climbing Fig', 'Jasmine', 'Passion Flower', 'Morning Glory'],
+    'Air Plant': ['Tillandsia', 'Spanish Moss', 'Air Plant', 'Bromeliad', 'Pineapple Plant', 'Guzmania', 'Vriesea', 'Aechmea', 'Neoregelia', 'Billbergia', 'Cryptanthus', 'Dyckia', 'Hechtia', 'Puya', 'Quesnelia', 'Racinaea', 'Wittrockia'],
+    'Orchid': ['Phalaenopsis', 'Cattleya', 'Dendrobium', 'Oncidium', 'Cymbidium', 'Vanda', 'Paphiopedilum', 'Miltonia', 'Miltoniopsis', 'Brassia', 'Epidendrum', 'Laelia', 'Masdevallia', 'Odontoglossum', 'Psychopsis', 'Sophronitis', 'Stanhopea'],
+    'Bamboo': ['Lucky Bamboo', 'Bamboo', 'Dracaena Sanderiana', 'Bamboo Palm', 'Heavenly Bamboo', 'Sacred Bamboo', 'Nandina', 'Bamboo Grass', 'Clumping Bamboo', 'Running Bamboo', 'Black Bamboo', 'Golden Bamboo', 'Giant Bamboo', 'Dwarf Bamboo'],
+    'Moss': ['Moss', 'Sphagnum Moss', 'Sheet Moss', 'Mood Moss', 'Cushion Moss', 'Hair Cap Moss', 'Fern Moss', 'Peat Moss', 'Club Moss', 'Reindeer Moss', 'Icelandic Moss', 'Spanish Moss', 'Ball Moss', 'Tree Moss', 'Rock Moss'],
+    'Aquatic': ['Water Lily', 'Lotus', 'Water Hyacinth', 'Water Lettuce', 'Duckweed', 'Water Fern', 'Water Sprite', 'Hornwort', 'Anacharis', 'Cabomba', 'Vallisneria', 'Sagittaria', 'Arrowhead', 'Pickerel Weed', 'Cattail'],
+    'Carnivorous': ['Venus Flytrap', 'Pitcher Plant', 'Sundew', 'Butterwort', 'Bladderwort', 'Cobra Plant', 'Tropical Pitcher Plant', 'Trumpet Pitcher', 'Heliamphora', 'Drosera', 'Pinguicula', 'Utricularia', 'Nepenthes', 'Sarracenia', 'Dionaea'],
+    'Bonsai': ['Juniper Bonsai', 'Ficus Bonsai', 'Chinese Elm Bonsai', 'Jade Bonsai', 'Azalea Bonsai', 'Maple Bonsai', 'Pine Bonsai', 'Oak Bonsai', 'Cherry Bonsai', 'Wisteria Bonsai', 'Bougainvillea Bonsai', 'Ginkgo Bonsai', 'Cedar Bonsai', 'Spruce Bonsai', 'Larch Bonsai'],
+    'Tropical': ['Bird of Paradise', 'Banana Plant', 'Elephant Ear', 'Calathea', 'Prayer Plant', 'Maranta', 'Pilea', 'Peperomia', 'Anthurium', 'Spathiphyllum', 'Dieffenbachia', 'Aglaonema', 'Dracaena', 'Cordyline', 'Ti Plant'],
+    'Desert': ['Desert Rose', 'Crown of Thorns', 'Desert Willow', 'Ocotillo', 'Palo Verde', 'Mesquite', 'Creosote Bush', 'Joshua Tree', 'Yucca', 'Agave', 'Aloe', 'Hedgehog Cactus', 'Barrel Cactus', 'Prickly Pear', 'Cholla'],
+    'Medicinal': ['Aloe Vera', 'Echinacea', 'Ginseng', 'Ginkgo', 'Turmeric', 'Ginger', 'Chamomile', 'Elderberry', 'Milk Thistle', 'St. John\'s Wort', 'Valerian', 'Passionflower', 'Ashwagandha', 'Holy Basil', 'Rhodiola'],
+    'Aromatic': ['Lavender', 'Rosemary', 'Mint', 'Basil', 'Thyme', 'Oregano', 'Sage', 'Lemon Balm', 'Catnip', 'Chamomile', 'Eucalyptus', 'Jasmine', 'Rose', 'Lilac', 'Gardenia'],
+    'Indoor Trees': ['Fiddle Leaf Fig', 'Rubber Plant', 'Norfolk Pine', 'Dracaena', 'Yucca', 'Ponytail Palm', 'Areca Palm', 'Kentia Palm', 'Parlor Palm', 'Lady Palm', 'Bamboo Palm', 'Sago Palm', 'Windmill Palm', 'European Fan Palm', 'Majesty Palm'],
+    'Hanging Plants': ['String of Pearls', 'String of Hearts', 'String of Bananas', 'Burro\'s Tail', 'Donkey Tail', 'Trailing Jade', 'Creeping Jenny', 'Ivy', 'Pothos', 'Philodendron', 'Spider Plant', 'Boston Fern', 'Maidenhair Fern', 'Rabbit\'s Foot Fern', 'Staghorn Fern'],
+    'Low Light': ['Snake Plant', 'ZZ Plant', 'Pothos', 'Philodendron', 'Spider Plant', 'Peace Lily', 'Chinese Evergreen', 'Cast Iron Plant', 'Dracaena', 'Parlor Palm', 'Lucky Bamboo', 'Peperomia', 'Fittonia', 'Calathea', 'Maranta'],
+    'High Light': ['Succulents', 'Cacti', 'Jade Plant', 'Aloe', 'Echeveria', 'Haworthia', 'Lithops', 'Sedum', 'Kalanchoe', 'Aeonium', 'Graptopetalum', 'Senecio', 'Agave', 'Gasteria', 'Sempervivum'],
+    'Flowering Houseplants': ['African Violet', 'Begonia', 'Geranium', 'Impatiens', 'Petunia', 'Marigold', 'Pansy', 'Snapdragon', 'Zinnia', 'Cosmos', 'Alyssum', 'Calendula', 'Nasturtium', 'Sweet Alyssum', 'Lobelia'],
+    'Fruit Trees': ['Lemon Tree', 'Orange Tree', 'Lime Tree', 'Mango Tree', 'Avocado', 'Fig Tree', 'Olive Tree', 'Apple Tree', 'Pear Tree', 'Peach Tree', 'Plum Tree', 'Cherry Tree', 'Apricot Tree', 'Pomegranate Tree', 'Persimmon Tree'],
+    'Vegetable Plants': ['Tomato', 'Pepper', 'Cucumber', 'Lettuce', 'Spinach', 'Kale', 'Broccoli', 'Cauliflower', 'Cabbage', 'Carrot', 'Radish', 'Beet', 'Onion', 'Garlic', 'Potato'],
+    'Spice Plants': ['Black Pepper', 'Cinnamon', 'Cloves', 'Nutmeg', 'Cardamom', 'Vanilla', 'Star Anise', 'Allspice', 'Juniper', 'Bay Leaves', 'Saffron', 'Cumin', 'Coriander', 'Fennel', 'Dill'],
+    'Tea Plants': ['Camellia Sinensis', 'Chamomile', 'Peppermint', 'Spearmint', 'Lemon Balm', 'Lemon Verbena', 'Rooibos', 'Hibiscus', 'Rose Hip', 'Elderflower', 'Linden', 'Ginkgo', 'Ginseng', 'Echinacea', 'Valerian'],
+    'Ornamental Grasses': ['Fountain Grass', 'Pampas Grass', 'Blue Fescue', 'Feather Reed Grass', 'Japanese Forest Grass', 'Hakone Grass', 'Mondo Grass', 'Liriope', 'Carex', 'Sedge', 'Juncus', 'Cyperus', 'Scirpus', 'Eleocharis', 'Schoenoplectus'],
+    'Ground Covers': ['Creeping Thyme', 'Creeping Jenny', 'Ivy', 'Vinca', 'Ajuga', 'Lamium', 'Sedum', 'Sempervivum', 'Thyme', 'Oregano', 'Mint', 'Chamomile', 'Clover', 'Violet', 'Wild Strawberry'],
+    'Climbing Plants': ['English Ivy', 'Virginia Creeper', 'Wisteria', 'Clematis', 'Honeysuckle', 'Jasmine', 'Passion Flower', 'Morning Glory', 'Sweet Pea', 'Nasturtium', 'Climbing Rose', 'Bougainvillea', 'Trumpet Vine', 'Grape Vine', 'Kiwi Vine'],
+    'Shade Plants': ['Hostas', 'Ferns', 'Astilbe', 'Coral Bells', 'Bleeding Heart', 'Lungwort', 'Foamflower', 'Solomon\'s Seal', 'Trillium', 'Jack-in-the-Pulpit', 'Wild Ginger', 'Mayapple', 'Bloodroot', 'Trout Lily', 'Spring Beauty'],
+    'Sun Plants': ['Sunflower', 'Marigold', 'Zinnia', 'Cosmos', 'Coreopsis', 'Gaillardia', 'Rudbeckia', 'Echinacea', 'Salvia', 'Verbena', 'Petunia', 'Impatiens', 'Geranium', 'Begonia', 'Dahlia'],
+    'Rock Garden': ['Sedum', 'Sempervivum', 'Aeonium', 'Echeveria', 'Haworthia', 'Lithops', 'Delosperma', 'Aubrieta', 'Arabis', 'Alyssum', 'Iberis', 'Phlox', 'Thymus', 'Satureja', 'Origanum'],
+    'Water Plants': ['Water Lily', 'Lotus', 'Water Hyacinth', 'Water Lettuce', 'Duckweed', 'Water Fern', 'Water Sprite', 'Hornwort', 'Anacharis', 'Cabomba', 'Vallisneria', 'Sagittaria', 'Arrowhead', 'Pickerel Weed', 'Cattail'],
+    'Bog Plants': ['Pitcher Plant', 'Sundew', 'Butterwort', 'Bladderwort', 'Cobra Plant', 'Tropical Pitcher Plant', 'Trumpet Pitcher', 'Heliamphora', 'Drosera', 'Pinguicula', 'Utricularia', 'Nepenthes', 'Sarracenia', 'Dionaea', 'Aldrovanda']
+}
+
+# Base care templates by category
+CARE_TEMPLATES = {
+    'Houseplant': {
+        'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
+        'light': 'Bright, indirect light. Avoid direct sunlight.',
+        'soil': 'Well-draining potting mix.',
+        'temperature': '65-75°F (18-24°C).',
+        'humidity': 'Normal household humidity.',
+        'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
+        'pruning': 'Remove dead or damaged leaves.',
+        'propagation': 'Stem cuttings or division.',
+        'common_problems': 'Watch for signs of overwatering or underwatering.',
+        'tips': 'Rotate plant weekly for even growth.',
+        'difficulty': 'Easy',
+        'toxicity': 'Check toxicity before bringing near pets'
+    },
+    'Succulent': {
+        'watering': 'Water deeply but infrequently. Allow soil to dry completely between waterings.',
+        'light': 'Bright, indirect light. Can tolerate some direct sun.',
+        'soil': 'Well-draining cactus or succulent mix.',
+        'temperature': '60-75°F (15-24°C).',
+        'humidity': 'Low humidity tolerance.',
+        'fertilizer': 'Feed monthly during growing season with diluted fertilizer.',
+        'pruning': 'Remove dead or damaged leaves.',
+        'propagation': 'Leaf or stem cuttings.',
+        'common_problems': 'Mushy leaves (overwatering), wrinkled leaves (underwatering).',
+        'tips': 'Store water in leaves and stems.',
+        'difficulty': 'Easy',
+        'toxicity': 'Generally safe for pets'
+    },
+    'Cactus': {
+        'watering': 'Water sparingly, only when soil is completely dry.',
+        'light': 'Bright, direct light. Needs plenty of sunlight.',
+        'soil': 'Well-draining cactus mix.',
+        'temperature': '60-80°F (15-27°C).',
+        'humidity': 'Low humidity tolerance.',
+        'fertilizer': 'Feed monthly during growing season with cactus fertilizer.',
+        'pruning': 'Remove dead or damaged parts.',
+        'propagation': 'Offsets or cuttings.',
+        'common_problems': 'Root rot (overwatering), etiolation (insufficient light).',
+        'tips': 'Handle with care due to spines.',
+        'difficulty': 'Easy',
+        'toxicity': 'Generally safe for pets'
+    },
+    'Fern': {
+        'watering': 'Keep soil evenly moist but not soggy.',
+        'light': 'Low to bright indirect light. Avoid direct sunlight.',
+        'soil': 'Well-draining potting mix with good moisture retention.',
+        'temperature': '60-75°F (15-24°C).',
+        'humidity': 'High humidity preferred. Mist leaves regularly.',
+        'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
+        'pruning': 'Remove dead or damaged fronds.',
+        'propagation': 'Division of root ball.',
+        'common_problems': 'Brown tips (low humidity), yellow leaves (overwatering).',
+        'tips': 'Loves humidity and consistent moisture.',
+        'difficulty': 'Moderate',
+        'toxicity': 'Generally safe for pets'
+    },
+    'Palm': {
+        'watering': 'Water when top inch of soil is dry.',
+        'light': 'Bright, indirect light. Can tolerate some direct morning sun.',
+        'soil': 'Well-draining potting mix.',
+        'temperature': '65-80°F (18-27°C).',
+        'humidity': 'Normal to high humidity.',
+        'fertilizer': 'Feed monthly during growing season with palm fertilizer.',
+        'pruning': 'Remove dead or damaged fronds.',
+        'propagation': 'Division or seeds.',
+        'common_problems': 'Brown tips (low humidity), yellow leaves (overwatering).',
+        'tips': 'Wipe leaves regularly to keep them clean.',
+        'difficulty': 'Easy to Moderate',
+        'toxicity': 'Generally safe for pets'
+    },
+    'Herb': {
+        'watering': 'Keep soil evenly moist but not soggy.',
+        'light': 'Bright, direct light. Needs plenty of sunlight.',
+        'soil': 'Well-draining potting mix.',
+        'temperature': '60-75°F (15-24°C).',
+        'humidity': 'Normal household humidity.',
+        'fertilizer': 'Feed monthly with balanced fertilizer.',
+        'pruning': 'Harvest regularly to encourage growth.',
+        'propagation': 'Seeds or cuttings.',
+        'common_problems': 'Leggy growth (insufficient light), yellow leaves (overwatering).',
+        'tips': 'Harvest in the morning for best flavor.',
+        'difficulty': 'Easy',
+        'toxicity': 'Generally safe for pets'
+    },
+    'Flowering': {
+        'watering': 'Keep soil evenly moist but not soggy.',
+        'light': 'Bright, indirect light. Some can tolerate direct sun.',
+        'soil': 'Well-draining potting mix.',
+        'temperature': '65-75°F (18-24°C).',
+        'humidity': 'Normal household humidity.',
+        'fertilizer': 'Feed monthly during growing season with flowering plant fertilizer.',
+        'pruning': 'Deadhead spent flowers to encourage blooming.',
+        'propagation': 'Seeds or cuttings.',
+        'common_problems': 'No flowers (insufficient light), yellow leaves (overwatering).',
+        'tips': 'Remove spent flowers to encourage new blooms.',
+        'difficulty': 'Easy to Moderate',
+        'toxicity': 'Check toxicity before bringing near pets'
+    },
+    'Tree': {
+        'watering': 'Water when top 2-3 inches of soil are dry.',
+        'light': 'Bright, indirect light. Some can tolerate direct sun.',
+        'soil': 'Well-draining potting mix.',
+        'temperature': '65-80°F (18-27°C).',
+        'humidity': 'Normal household humidity.',
+        'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
+        'pruning': 'Prune to shape and remove dead branches.',
+        'propagation': 'Seeds or cuttings.',
+        'common_problems': 'Leaf drop (environmental stress), yellow leaves (overwatering).',
+        'tips': 'Rotate regularly for even growth.',
+        'difficulty': 'Moderate',
+        'toxicity': 'Check toxicity before bringing near pets'
+    },
+    'Vine': {
+        'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
+        'light': 'Low to bright indirect light. Avoid direct sunlight.',
+        'soil': 'Well-draining potting mix.',
+        'temperature': '65-80°F (18-27°C).',
+        'humidity': 'Normal household humidity.',
+        'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
+        'pruning': 'Trim to control length and encourage bushiness.',
+        'propagation': 'Stem cuttings in water or soil.',
+        'common_problems': 'Yellow leaves (overwatering), leggy growth (insufficient light).',
+        'tips': 'Provide support for climbing. Can be trained to climb or trail.',
+        'difficulty': 'Easy',
+        'toxicity': 'Check toxicity before bringing near pets'
+    },
+    'Air Plant': {
+        'watering': 'Mist 2-3 times per week or soak weekly for 30 minutes.',
+        'light': 'Bright, indirect light. Avoid direct sunlight.',
+        'soil': 'No soil needed. Can be mounted or placed in containers.',
+        'temperature': '60-80°F (15-27°C).',
+        'humidity': 'High humidity preferred. Mist regularly.',
+        'fertilizer': 'Feed monthly with bromeliad fertilizer.',
+        'pruning': 'Remove dead or damaged leaves.',
+        'propagation': 'Pups (baby plants) that form at the base.',
+        'common_problems': 'Brown tips (underwatering), rot (overwatering).',
+        'tips': 'Ensure good air circulation. Dry completely after watering.',
+        'difficulty': 'Easy',
+        'toxicity': 'Generally safe for pets'
+    },
+    'Orchid': {
+        'watering': 'Water when potting mix is almost dry. Water thoroughly and allow to drain.',
+        'light': 'Bright, indirect light. Avoid direct sunlight.',
+        'soil': 'Orchid bark or sphagnum moss mix.',
+        'temperature': '65-75°F (18-24°C).',
+        'humidity': 'High humidity preferred. Use humidity tray.',
+        'fertilizer': 'Feed weekly with orchid fertilizer during growing season.',
+        'pruning': 'Remove spent flower spikes. Trim dead roots.',
+        'propagation': 'Division or keiki (baby plants).',
+        'common_problems': 'No flowers (insufficient light), yellow leaves (overwatering).',
+        'tips': 'Repot every 1-2 years. Provide good air circulation.',
+        'difficulty': 'Moderate',
+        'toxicity': 'Generally safe for pets'
+    },
+    'Bamboo': {
+        'watering': 'Keep soil evenly moist but not soggy.',
+        'light': 'Low to bright indirect light. Avoid direct sunlight.',
+        'soil': 'Well-draining potting mix or water.',
+        'temperature': '65-80°F (18-27°C).',
+        'humidity': 'Normal household humidity.',
+        'fertilizer': 'Feed monthly with balanced fertilizer.',
+        'pruning': 'Trim to control height and shape.',
+        'propagation': 'Division of root ball.',
+        'common_problems': 'Yellow leaves (overwatering), brown tips (low humidity).',
+        'tips': 'Can grow in water or soil. Change water weekly if growing in water.',
+        'difficulty': 'Easy',
+        'toxicity': 'Generally safe for pets'
+    },
+            'Moss': {
+                'watering': 'Keep consistently moist. Mist regularly.',
+                'light': 'Low to bright indirect light. Avoid direct sunlight.',
+                'soil': 'No soil needed. Can grow on various surfaces.',
+                'temperature': '60-75°F (15-24°C).',
+                'humidity': 'High humidity preferred. Mist daily.',
+                'fertilizer': 'Feed monthly with diluted fertilizer.',
+                'pruning': 'Trim to maintain shape.',
+                'propagation': 'Division or spores.',
+                'common_problems': 'Drying out (low humidity), browning (too much light).',
+                'tips': 'Loves humidity and consistent moisture. Great for terrariums.',
+                'difficulty': 'Easy',
+                'toxicity': 'Generally safe for pets'
+            },
+            'Medicinal': {
+                'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
+                'light': 'Bright, indirect light. Some can tolerate direct sun.',
+                'soil': 'Well-draining potting mix with organic matter.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly with organic fertilizer.',
+                'pruning': 'Harvest leaves and flowers regularly.',
+                'propagation': 'Seeds, cuttings, or division.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Research medicinal properties before use. Consult healthcare provider.',
+                'difficulty': 'Easy to Moderate',
+                'toxicity': 'Research toxicity before use'
+            },
+            'Aromatic': {
+                'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '60-75°F (15-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly with balanced fertilizer.',
+                'pruning': 'Pinch back to encourage bushiness.',
+                'propagation': 'Cuttings or seeds.',
+                'common_problems': 'Leggy growth (insufficient light), overwatering.',
+                'tips': 'Crush leaves to release fragrance. Use in cooking and aromatherapy.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before use'
+            },
+            'Indoor Trees': {
+                'watering': 'Water when top 2 inches of soil are dry.',
+                'light': 'Bright, indirect light. Avoid direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim to maintain shape and size.',
+                'propagation': 'Cuttings or air layering.',
+                'common_problems': 'Leaf drop (overwatering), brown tips (low humidity).',
+                'tips': 'Rotate regularly for even growth. Wipe leaves to remove dust.',
+                'difficulty': 'Easy to Moderate',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Hanging Plants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, indirect light. Avoid direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim to control length and encourage bushiness.',
+                'propagation': 'Cuttings in water or soil.',
+                'common_problems': 'Leggy growth (insufficient light), overwatering.',
+                'tips': 'Provide support for trailing. Can be trained to climb or trail.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Low Light': {
+                'watering': 'Water when top 2 inches of soil are dry.',
+                'light': 'Low to bright indirect light. Avoid direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim dead or damaged leaves.',
+                'propagation': 'Division or cuttings.',
+                'common_problems': 'Leggy growth (insufficient light), overwatering.',
+                'tips': 'Perfect for low-light areas. Rotate regularly for even growth.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'High Light': {
+                'watering': 'Water when soil is completely dry.',
+                'light': 'Bright, direct light. Full sun preferred.',
+                'soil': 'Well-draining cactus/succulent mix.',
+                'temperature': '65-80°F (18-27°C).',
+                'humidity': 'Low humidity preferred.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim dead or damaged parts.',
+                'propagation': 'Cuttings, offsets, or seeds.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Perfect for sunny windows. Allow soil to dry completely between waterings.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Flowering Houseplants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly with flowering plant fertilizer.',
+                'pruning': 'Deadhead spent flowers. Trim to maintain shape.',
+                'propagation': 'Cuttings, seeds, or division.',
+                'common_problems': 'No flowers (insufficient light), overwatering.',
+                'tips': 'Provide consistent care for best flowering. Deadhead regularly.',
+                'difficulty': 'Easy to Moderate',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Fruit Trees': {
+                'watering': 'Water when top 2 inches of soil are dry.',
+                'light': 'Bright, direct light. Full sun preferred.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly with fruit tree fertilizer.',
+                'pruning': 'Prune to maintain shape and encourage fruiting.',
+                'propagation': 'Cuttings, grafting, or seeds.',
+                'common_problems': 'No fruit (insufficient light), overwatering.',
+                'tips': 'Provide consistent care for best fruiting. Pollinate flowers if needed.',
+                'difficulty': 'Moderate to Hard',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Vegetable Plants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, direct light. Full sun preferred.',
+                'soil': 'Well-draining potting mix with compost.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly with vegetable fertilizer.',
+                'pruning': 'Harvest regularly. Trim dead or damaged parts.',
+                'propagation': 'Seeds or cuttings.',
+                'common_problems': 'Pests, diseases, insufficient light.',
+                'tips': 'Provide consistent care for best harvest. Rotate crops.',
+                'difficulty': 'Easy to Moderate',
+                'toxicity': 'Generally safe for pets'
+            },
+            'Spice Plants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly with organic fertilizer.',
+                'pruning': 'Harvest regularly. Trim to maintain shape.',
+                'propagation': 'Cuttings or seeds.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Harvest regularly for best flavor. Use in cooking.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before use'
+            },
+            'Tea Plants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly with organic fertilizer.',
+                'pruning': 'Harvest leaves regularly. Trim to maintain shape.',
+                'propagation': 'Cuttings or seeds.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Harvest leaves for tea. Research proper preparation.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before use'
+            },
+            'Ornamental Grasses': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim dead or damaged parts.',
+                'propagation': 'Division or seeds.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Perfect for adding texture. Trim regularly.',
+                'difficulty': 'Easy',
+                'toxicity': 'Generally safe for pets'
+            },
+            'Ground Covers': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Low to bright indirect light. Some prefer direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim to control spread.',
+                'propagation': 'Division or cuttings.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Perfect for covering bare soil. Trim regularly.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Climbing Plants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim to control growth and encourage bushiness.',
+                'propagation': 'Cuttings or seeds.',
+                'common_problems': 'Leggy growth (insufficient light), overwatering.',
+                'tips': 'Provide support for climbing. Train regularly.',
+                'difficulty': 'Easy to Moderate',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Shade Plants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Low to bright indirect light. Avoid direct sun.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim dead or damaged parts.',
+                'propagation': 'Division or cuttings.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Perfect for shady areas. Rotate regularly.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Sun Plants': {
+                'watering': 'Water when top inch of soil is dry.',
+                'light': 'Bright, direct light. Full sun preferred.',
+                'soil': 'Well-draining potting mix.',
+                'temperature': '65-80°F (18-27°C).',
+                'humidity': 'Normal household humidity.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Deadhead spent flowers. Trim to maintain shape.',
+                'propagation': 'Cuttings or seeds.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Perfect for sunny areas. Deadhead regularly.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Rock Garden': {
+                'watering': 'Water when soil is completely dry.',
+                'light': 'Bright, direct light. Full sun preferred.',
+                'soil': 'Well-draining cactus/succulent mix.',
+                'temperature': '65-80°F (18-27°C).',
+                'humidity': 'Low humidity preferred.',
+                'fertilizer': 'Feed monthly during growing season.',
+                'pruning': 'Trim dead or damaged parts.',
+                'propagation': 'Cuttings or seeds.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Perfect for rock gardens. Allow soil to dry completely.',
+                'difficulty': 'Easy',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Water Plants': {
+                'watering': 'Keep consistently moist. Submerge in water.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Aquatic soil or no soil needed.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'High humidity preferred.',
+                'fertilizer': 'Feed monthly with aquatic fertilizer.',
+                'pruning': 'Trim dead or damaged parts.',
+                'propagation': 'Division or cuttings.',
+                'common_problems': 'Overwatering, insufficient light.',
+                'tips': 'Perfect for water gardens. Keep water clean.',
+                'difficulty': 'Easy to Moderate',
+                'toxicity': 'Research toxicity before bringing near pets'
+            },
+            'Bog Plants': {
+                'watering': 'Keep consistently moist. Never let dry out.',
+                'light': 'Bright, indirect light. Some prefer direct sun.',
+                'soil': 'Bog soil or sphagnum moss.',
+                'temperature': '65-75°F (18-24°C).',
+                'humidity': 'High humidity preferred.',
+                'fertilizer': 'Feed monthly with bog fertilizer.',
+                'pruning': 'Trim dead or damaged parts.',
+                'propagation': 'Division or cuttings.',
+                'common_problems': 'Drying out, insufficient light.',
+                'tips': 'Perfect for bog gardens. Keep consistently moist.',
+                'difficulty': 'Moderate',
+                'toxicity': 'Research toxicity before bringing near pets'
+            }
+}
+
+
+def is_template_value(plant: Dict[str, Any], field: str) -> bool:
+    """Whether a record's field is its category's CARE_TEMPLATES text rather than species data."""
+    template = CARE_TEMPLATES.get(plant.get('category', ''), CARE_TEMPLATES['Houseplant'])
+    value = plant.get(field)
+    return bool(value) and value == template.get(field)
+
+
+def format_plants_for_chroma(plants: List[Dict[str, Any]], dedupe: bool = False,
+                             links: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Format plant care records for Chroma Cloud database.
+    
+    With `dedupe`, near-duplicate records (see near_duplicates.py) share one
+    document: only each cluster's canonical record is formatted, and every
+    record's {id, name, canonical_id} link is appended to `links` if given.
+    """
+    clusters = None
+    indexes = range(len(plants))
+    if dedupe:
+        from near_duplicates import cluster_plants
+        clusters = cluster_plants(plants)
+        indexes = [members[0] for members in clusters]
+    
+    renderer = DocumentRenderer(CARE_DOCUMENT_FIELDS)
+    created_at = datetime.now().isoformat()
+    chroma_documents = []
+    
+    for i in indexes:
+        plant = plants[i]
+        document_text = renderer.render(plant)
+        
+        chroma_documents.append({
+            'id': f"plant_{i + 1:03d}",
+            'document': document_text,
+            'metadata': {
+                'name': plant['name'],
+                'category': plant['category'],
+                'difficulty': plant['difficulty'],
+                'toxicity': plant['toxicity'],
+                'source': 'Fast Plant Database',
+                'created_at': created_at
+            }
+        })
+    
+    if clusters is not None:
+        from near_duplicates import link_clusters
+        member_links = link_clusters(chroma_documents, clusters, plants, lambda i: f"plant_{i + 1:03d}")
+        if links is not None:
+            links.extend(member_links)
+    
+    return chroma_documents
+
+
 class FastPlantDatabase:
     def __init__(self):
         self.plant_database = self.build_comprehensive_plant_database()
@@ -196,50 +746,7 @@ class FastPlantDatabase:
         """Generate additional plant variations and species."""
         variations = []
         
-        # Common plant families and their variations
-        plant_families = {
-            'Pothos': ['Golden Pothos', 'Marble Queen Pothos', 'Neon Pothos', 'Jade Pothos', 'Manjula Pothos', 'Pearls and Jade Pothos', 'N\'Joy Pothos', 'Cebu Blue Pothos', 'Silver Pothos', 'Satin Pothos'],
-            'Philodendron': ['Heartleaf Philodendron', 'Split-leaf Philodendron', 'Brazil Philodendron', 'Pink Princess Philodendron', 'Prince of Orange Philodendron', 'Lemon Lime Philodendron', 'Brasil Philodendron', 'Rio Philodendron', 'Micans Philodendron', 'Xanadu Philodendron'],
-            'Ficus': ['Fiddle Leaf Fig', 'Rubber Plant', 'Weeping Fig', 'Ficus Benjamina', 'Ficus Elastica', 'Ficus Lyrata', 'Ficus Audrey', 'Ficus Altissima', 'Ficus Religiosa', 'Ficus Microcarpa'],
-            'Succulent': ['Echeveria', 'Haworthia', 'Lithops', 'Sedum', 'Crassula', 'Kalanchoe', 'Aeonium', 'Graptopetalum', 'Senecio', 'Agave', 'Aloe', 'Gasteria', 'Sempervivum', 'Echeveria', 'Pachyphytum', 'Adromischus', 'Cotyledon', 'Dudleya', 'Graptoveria', 'Pachyveria'],
-            'Cactus': ['Barrel Cactus', 'Prickly Pear', 'Christmas Cactus', 'Easter Cactus', 'Moon Cactus', 'Star Cactus', 'Golden Barrel Cactus', 'Saguaro Cactus', 'Bishop\'s Cap', 'Old Man Cactus', 'Bunny Ears Cactus', 'Ladyfinger Cactus', 'Rat Tail Cactus', 'Crown of Thorns'],
-            'Fern': ['Boston Fern', 'Maidenhair Fern', 'Bird\'s Nest Fern', 'Staghorn Fern', 'Rabbit\'s Foot Fern', 'Button Fern', 'Kimberly Queen Fern', 'Asparagus Fern', 'Lemon Button Fern', 'Cretan Brake Fern', 'Japanese Painted Fern', 'Royal Fern'],
-            'Palm': ['Areca Palm', 'Kentia Palm', 'Parlor Palm', 'Ponytail Palm', 'Lady Palm', 'Fishtail Palm', 'Bamboo Palm', 'Sago Palm', 'Windmill Palm', 'European Fan Palm', 'Pygmy Date Palm', 'Majesty Palm'],
-            'Herb': ['Basil', 'Mint', 'Rosemary', 'Thyme', 'Oregano', 'Parsley', 'Cilantro', 'Chives', 'Sage', 'Lavender', 'Dill', 'Fennel', 'Tarragon', 'Marjoram', 'Bay Laurel', 'Chervil', 'Borage', 'Catnip', 'Lemon Balm', 'Stevia'],
-            'Flowering': ['African Violet', 'Begonia', 'Geranium', 'Impatiens', 'Petunia', 'Marigold', 'Pansy', 'Snapdragon', 'Zinnia', 'Cosmos', 'Alyssum', 'Calendula', 'Nasturtium', 'Sweet Alyssum', 'Lobelia', 'Verbena', 'Salvia', 'Penstemon', 'Coreopsis', 'Gaillardia'],
-            'Tree': ['Lemon Tree', 'Orange Tree', 'Avocado', 'Fig Tree', 'Olive Tree', 'Bonsai', 'Norfolk Pine', 'Lime Tree', 'Mango Tree', 'Cherry Tree', 'Apple Tree', 'Pear Tree', 'Peach Tree', 'Plum Tree', 'Apricot Tree', 'Pomegranate Tree', 'Persimmon Tree', 'Guava Tree', 'Papaya Tree', 'Banana Tree'],
-            'Vine': ['English Ivy', 'Pothos', 'Philodendron', 'Hoya', 'String of Hearts', 'Tradescantia', 'Monstera Adansonii', 'Swiss Cheese Plant', 'Pothos', 'Scindapsus', 'Epipremnum', 'Syngonium', 'Pothos', 'Heartleaf Vine', 'Grape Ivy', 'Creeping Fig', 'Climbing Fig', 'Jasmine', 'Passion Flower', 'Morning Glory'],
-            'Air Plant': ['Tillandsia', 'Spanish Moss', 'Air Plant', 'Bromeliad', 'Pineapple Plant', 'Guzmania', 'Vriesea', 'Aechmea', 'Neoregelia', 'Billbergia', 'Cryptanthus', 'Dyckia', 'Hechtia', 'Puya', 'Quesnelia', 'Racinaea', 'Wittrockia'],
-            'Orchid': ['Phalaenopsis', 'Cattleya', 'Dendrobium', 'Oncidium', 'Cymbidium', 'Vanda', 'Paphiopedilum', 'Miltonia', 'Miltoniopsis', 'Brassia', 'Epidendrum', 'Laelia', 'Masdevallia', 'Odontoglossum', 'Psychopsis', 'Sophronitis', 'Stanhopea'],
-            'Bamboo': ['Lucky Bamboo', 'Bamboo', 'Dracaena Sanderiana', 'Bamboo Palm', 'Heavenly Bamboo', 'Sacred Bamboo', 'Nandina', 'Bamboo Grass', 'Clumping Bamboo', 'Running Bamboo', 'Black Bamboo', 'Golden Bamboo', 'Giant Bamboo', 'Dwarf Bamboo'],
-            'Moss': ['Moss', 'Sphagnum Moss', 'Sheet Moss', 'Mood Moss', 'Cushion Moss', 'Hair Cap Moss', 'Fern Moss', 'Peat Moss', 'Club Moss', 'Reindeer Moss', 'Icelandic Moss', 'Spanish Moss', 'Ball Moss', 'Tree Moss', 'Rock Moss'],
-            'Aquatic': ['Water Lily', 'Lotus', 'Water Hyacinth', 'Water Lettuce', 'Duckweed', 'Water Fern', 'Water Sprite', 'Hornwort', 'Anacharis', 'Cabomba', 'Vallisneria', 'Sagittaria', 'Arrowhead', 'Pickerel Weed', 'Cattail'],
-            'Carnivorous': ['Venus Flytrap', 'Pitcher Plant', 'Sundew', 'Butterwort', 'Bladderwort', 'Cobra Plant', 'Tropical Pitcher Plant', 'Trumpet Pitcher', 'Heliamphora', 'Drosera', 'Pinguicula', 'Utricularia', 'Nepenthes', 'Sarracenia', 'Dionaea'],
-            'Bonsai': ['Juniper Bonsai', 'Ficus Bonsai', 'Chinese Elm Bonsai', 'Jade Bonsai', 'Azalea Bonsai', 'Maple Bonsai', 'Pine Bonsai', 'Oak Bonsai', 'Cherry Bonsai', 'Wisteria Bonsai', 'Bougainvillea Bonsai', 'Ginkgo Bonsai', 'Cedar Bonsai', 'Spruce Bonsai', 'Larch Bonsai'],
-            'Tropical': ['Bird of Paradise', 'Banana Plant', 'Elephant Ear', 'Calathea', 'Prayer Plant', 'Maranta', 'Pilea', 'Peperomia', 'Anthurium', 'Spathiphyllum', 'Dieffenbachia', 'Aglaonema', 'Dracaena', 'Cordyline', 'Ti Plant'],
-            'Desert': ['Desert Rose', 'Crown of Thorns', 'Desert Willow', 'Ocotillo', 'Palo Verde', 'Mesquite', 'Creosote Bush', 'Joshua Tree', 'Yucca', 'Agave', 'Aloe', 'Hedgehog Cactus', 'Barrel Cactus', 'Prickly Pear', 'Cholla'],
-            'Medicinal': ['Aloe Vera', 'Echinacea', 'Ginseng', 'Ginkgo', 'Turmeric', 'Ginger', 'Chamomile', 'Elderberry', 'Milk Thistle', 'St. John\'s Wort', 'Valerian', 'Passionflower', 'Ashwagandha', 'Holy Basil', 'Rhodiola'],
-            'Aromatic': ['Lavender', 'Rosemary', 'Mint', 'Basil', 'Thyme', 'Oregano', 'Sage', 'Lemon Balm', 'Catnip', 'Chamomile', 'Eucalyptus', 'Jasmine', 'Rose', 'Lilac', 'Gardenia'],
-            'Indoor Trees': ['Fiddle Leaf Fig', 'Rubber Plant', 'Norfolk Pine', 'Dracaena', 'Yucca', 'Ponytail Palm', 'Areca Palm', 'Kentia Palm', 'Parlor Palm', 'Lady Palm', 'Bamboo Palm', 'Sago Palm', 'Windmill Palm', 'European Fan Palm', 'Majesty Palm'],
-            'Hanging Plants': ['String of Pearls', 'String of Hearts', 'String of Bananas', 'Burro\'s Tail', 'Donkey Tail', 'Trailing Jade', 'Creeping Jenny', 'Ivy', 'Pothos', 'Philodendron', 'Spider Plant', 'Boston Fern', 'Maidenhair Fern', 'Rabbit\'s Foot Fern', 'Staghorn Fern'],
-            'Low Light': ['Snake Plant', 'ZZ Plant', 'Pothos', 'Philodendron', 'Spider Plant', 'Peace Lily', 'Chinese Evergreen', 'Cast Iron Plant', 'Dracaena', 'Parlor Palm', 'Lucky Bamboo', 'Peperomia', 'Fittonia', 'Calathea', 'Maranta'],
-            'High Light': ['Succulents', 'Cacti', 'Jade Plant', 'Aloe', 'Echeveria', 'Haworthia', 'Lithops', 'Sedum', 'Kalanchoe', 'Aeonium', 'Graptopetalum', 'Senecio', 'Agave', 'Gasteria', 'Sempervivum'],
-            'Flowering Houseplants': ['African Violet', 'Begonia', 'Geranium', 'Impatiens', 'Petunia', 'Marigold', 'Pansy', 'Snapdragon', 'Zinnia', 'Cosmos', 'Alyssum', 'Calendula', 'Nasturtium', 'Sweet Alyssum', 'Lobelia'],
-            'Fruit Trees': ['Lemon Tree', 'Orange Tree', 'Lime Tree', 'Mango Tree', 'Avocado', 'Fig Tree', 'Olive Tree', 'Apple Tree', 'Pear Tree', 'Peach Tree', 'Plum Tree', 'Cherry Tree', 'Apricot Tree', 'Pomegranate Tree', 'Persimmon Tree'],
-            'Vegetable Plants': ['Tomato', 'Pepper', 'Cucumber', 'Lettuce', 'Spinach', 'Kale', 'Broccoli', 'Cauliflower', 'Cabbage', 'Carrot', 'Radish', 'Beet', 'Onion', 'Garlic', 'Potato'],
-            'Spice Plants': ['Black Pepper', 'Cinnamon', 'Cloves', 'Nutmeg', 'Cardamom', 'Vanilla', 'Star Anise', 'Allspice', 'Juniper', 'Bay Leaves', 'Saffron', 'Cumin', 'Coriander', 'Fennel', 'Dill'],
-            'Tea Plants': ['Camellia Sinensis', 'Chamomile', 'Peppermint', 'Spearmint', 'Lemon Balm', 'Lemon Verbena', 'Rooibos', 'Hibiscus', 'Rose Hip', 'Elderflower', 'Linden', 'Ginkgo', 'Ginseng', 'Echinacea', 'Valerian'],
-            'Ornamental Grasses': ['Fountain Grass', 'Pampas Grass', 'Blue Fescue', 'Feather Reed Grass', 'Japanese Forest Grass', 'Hakone Grass', 'Mondo Grass', 'Liriope', 'Carex', 'Sedge', 'Juncus', 'Cyperus', 'Scirpus', 'Eleocharis', 'Schoenoplectus'],
-            'Ground Covers': ['Creeping Thyme', 'Creeping Jenny', 'Ivy', 'Vinca', 'Ajuga', 'Lamium', 'Sedum', 'Sempervivum', 'Thyme', 'Oregano', 'Mint', 'Chamomile', 'Clover', 'Violet', 'Wild Strawberry'],
-            'Climbing Plants': ['English Ivy', 'Virginia Creeper', 'Wisteria', 'Clematis', 'Honeysuckle', 'Jasmine', 'Passion Flower', 'Morning Glory', 'Sweet Pea', 'Nasturtium', 'Climbing Rose', 'Bougainvillea', 'Trumpet Vine', 'Grape Vine', 'Kiwi Vine'],
-            'Shade Plants': ['Hostas', 'Ferns', 'Astilbe', 'Coral Bells', 'Bleeding Heart', 'Lungwort', 'Foamflower', 'Solomon\'s Seal', 'Trillium', 'Jack-in-the-Pulpit', 'Wild Ginger', 'Mayapple', 'Bloodroot', 'Trout Lily', 'Spring Beauty'],
-            'Sun Plants': ['Sunflower', 'Marigold', 'Zinnia', 'Cosmos', 'Coreopsis', 'Gaillardia', 'Rudbeckia', 'Echinacea', 'Salvia', 'Verbena', 'Petunia', 'Impatiens', 'Geranium', 'Begonia', 'Dahlia'],
-            'Rock Garden': ['Sedum', 'Sempervivum', 'Aeonium', 'Echeveria', 'Haworthia', 'Lithops', 'Delosperma', 'Aubrieta', 'Arabis', 'Alyssum', 'Iberis', 'Phlox', 'Thymus', 'Satureja', 'Origanum'],
-            'Water Plants': ['Water Lily', 'Lotus', 'Water Hyacinth', 'Water Lettuce', 'Duckweed', 'Water Fern', 'Water Sprite', 'Hornwort', 'Anacharis', 'Cabomba', 'Vallisneria', 'Sagittaria', 'Arrowhead', 'Pickerel Weed', 'Cattail'],
-            'Bog Plants': ['Pitcher Plant', 'Sundew', 'Butterwort', 'Bladderwort', 'Cobra Plant', 'Tropical Pitcher Plant', 'Trumpet Pitcher', 'Heliamphora', 'Drosera', 'Pinguicula', 'Utricularia', 'Nepenthes', 'Sarracenia', 'Dionaea', 'Aldrovanda']
-        }
-        
-        for family, species_list in plant_families.items():
+        for family, species_list in PLANT_FAMILIES.items():
             for species in species_list:
                 # Create plant entry based on family characteristics
                 plant_entry = self.create_plant_entry(species, family)
@@ -250,460 +757,8 @@ class FastPlantDatabase:
     def create_plant_entry(self, name: str, category: str) -> Dict[str, Any]:
         """Create a plant entry with appropriate care information based on category."""
         
-        # Base care templates by category
-        care_templates = {
-            'Houseplant': {
-                'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
-                'light': 'Bright, indirect light. Avoid direct sunlight.',
-                'soil': 'Well-draining potting mix.',
-                'temperature': '65-75°F (18-24°C).',
-                'humidity': 'Normal household humidity.',
-                'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
-                'pruning': 'Remove dead or damaged leaves.',
-                'propagation': 'Stem cuttings or division.',
-                'common_problems': 'Watch for signs of overwatering or underwatering.',
-                'tips': 'Rotate plant weekly for even growth.',
-                'difficulty': 'Easy',
-                'toxicity': 'Check toxicity before bringing near pets'
-            },
-            'Succulent': {
-                'watering': 'Water deeply but infrequently. Allow soil to dry completely between waterings.',
-                'light': 'Bright, indirect light. Can tolerate some direct sun.',
-                'soil': 'Well-draining cactus or succulent mix.',
-                'temperature': '60-75°F (15-24°C).',
-                'humidity': 'Low humidity tolerance.',
-                'fertilizer': 'Feed monthly during growing season with diluted fertilizer.',
-                'pruning': 'Remove dead or damaged leaves.',
-                'propagation': 'Leaf or stem cuttings.',
-                'common_problems': 'Mushy leaves (overwatering), wrinkled leaves (underwatering).',
-                'tips': 'Store water in leaves and stems.',
-                'difficulty': 'Easy',
-                'toxicity': 'Generally safe for pets'
-            },
-            'Cactus': {
-                'watering': 'Water sparingly, only when soil is completely dry.',
-                'light': 'Bright, direct light. Needs plenty of sunlight.',
-                'soil': 'Well-draining cactus mix.',
-                'temperature': '60-80°F (15-27°C).',
-                'humidity': 'Low humidity tolerance.',
-                'fertilizer': 'Feed monthly during growing season with cactus fertilizer.',
-                'pruning': 'Remove dead or damaged parts.',
-                'propagation': 'Offsets or cuttings.',
-                'common_problems': 'Root rot (overwatering), etiolation (insufficient light).',
-                'tips': 'Handle with care due to spines.',
-                'difficulty': 'Easy',
-                'toxicity': 'Generally safe for pets'
-            },
-            'Fern': {
-                'watering': 'Keep soil evenly moist but not soggy.',
-                'light': 'Low to bright indirect light. Avoid direct sunlight.',
-                'soil': 'Well-draining potting mix with good moisture retention.',
-                'temperature': '60-75°F (15-24°C).',
-                'humidity': 'High humidity preferred. Mist leaves regularly.',
-                'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
-                'pruning': 'Remove dead or damaged fronds.',
-                'propagation': 'Division of root ball.',
-                'common_problems': 'Brown tips (low humidity), yellow leaves (overwatering).',
-                'tips': 'Loves humidity and consistent moisture.',
-                'difficulty': 'Moderate',
-                'toxicity': 'Generally safe for pets'
-            },
-            'Palm': {
-                'watering': 'Water when top inch of soil is dry.',
-                'light': 'Bright, indirect light. Can tolerate some direct morning sun.',
-                'soil': 'Well-draining potting mix.',
-                'temperature': '65-80°F (18-27°C).',
-                'humidity': 'Normal to high humidity.',
-                'fertilizer': 'Feed monthly during growing season with palm fertilizer.',
-                'pruning': 'Remove dead or damaged fronds.',
-                'propagation': 'Division or seeds.',
-                'common_problems': 'Brown tips (low humidity), yellow leaves (overwatering).',
-                'tips': 'Wipe leaves regularly to keep them clean.',
-                'difficulty': 'Easy to Moderate',
-                'toxicity': 'Generally safe for pets'
-            },
-            'Herb': {
-                'watering': 'Keep soil evenly moist but not soggy.',
-                'light': 'Bright, direct light. Needs plenty of sunlight.',
-                'soil': 'Well-draining potting mix.',
-                'temperature': '60-75°F (15-24°C).',
-                'humidity': 'Normal household humidity.',
-                'fertilizer': 'Feed monthly with balanced fertilizer.',
-                'pruning': 'Harvest regularly to encourage growth.',
-                'propagation': 'Seeds or cuttings.',
-                'common_problems': 'Leggy growth (insufficient light), yellow leaves (overwatering).',
-                'tips': 'Harvest in the morning for best flavor.',
-                'difficulty': 'Easy',
-                'toxicity': 'Generally safe for pets'
-            },
-            'Flowering': {
-                'watering': 'Keep soil evenly moist but not soggy.',
-                'light': 'Bright, indirect light. Some can tolerate direct sun.',
-                'soil': 'Well-draining potting mix.',
-                'temperature': '65-75°F (18-24°C).',
-                'humidity': 'Normal household humidity.',
-                'fertilizer': 'Feed monthly during growing season with flowering plant fertilizer.',
-                'pruning': 'Deadhead spent flowers to encourage blooming.',
-                'propagation': 'Seeds or cuttings.',
-                'common_problems': 'No flowers (insufficient light), yellow leaves (overwatering).',
-                'tips': 'Remove spent flowers to encourage new blooms.',
-                'difficulty': 'Easy to Moderate',
-                'toxicity': 'Check toxicity before bringing near pets'
-            },
-            'Tree': {
-                'watering': 'Water when top 2-3 inches of soil are dry.',
-                'light': 'Bright, indirect light. Some can tolerate direct sun.',
-                'soil': 'Well-draining potting mix.',
-                'temperature': '65-80°F (18-27°C).',
-                'humidity': 'Normal household humidity.',
-                'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
-                'pruning': 'Prune to shape and remove dead branches.',
-                'propagation': 'Seeds or cuttings.',
-                'common_problems': 'Leaf drop (environmental stress), yellow leaves (overwatering).',
-                'tips': 'Rotate regularly for even growth.',
-                'difficulty': 'Moderate',
-                'toxicity': 'Check toxicity before bringing near pets'
-            },
-            'Vine': {
-                'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
-                'light': 'Low to bright indirect light. Avoid direct sunlight.',
-                'soil': 'Well-draining potting mix.',
-                'temperature': '65-80°F (18-27°C).',
-                'humidity': 'Normal household humidity.',
-                'fertilizer': 'Feed monthly during growing season with balanced fertilizer.',
-                'pruning': 'Trim to control length and encourage bushiness.',
-                'propagation': 'Stem cuttings in water or soil.',
-                'common_problems': 'Yellow leaves (overwatering), leggy growth (insufficient light).',
-                'tips': 'Provide support for climbing. Can be trained to climb or trail.',
-                'difficulty': 'Easy',
-                'toxicity': 'Check toxicity before bringing near pets'
-            },
-            'Air Plant': {
-                'watering': 'Mist 2-3 times per week or soak weekly for 30 minutes.',
-                'light': 'Bright, indirect light. Avoid direct sunlight.',
-                'soil': 'No soil needed. Can be mounted or placed in containers.',
-                'temperature': '60-80°F (15-27°C).',
-                'humidity': 'High humidity preferred. Mist regularly.',
-                'fertilizer': 'Feed monthly with bromeliad fertilizer.',
-                'pruning': 'Remove dead or damaged leaves.',
-                'propagation': 'Pups (baby plants) that form at the base.',
-                'common_problems': 'Brown tips (underwatering), rot (overwatering).',
-                'tips': 'Ensure good air circulation. Dry completely after watering.',
-                'difficulty': 'Easy',
-                'toxicity': 'Generally safe for pets'
-            },
-            'Orchid': {
-                'watering': 'Water when potting mix is almost dry. Water thoroughly and allow to drain.',
-                'light': 'Bright, indirect light. Avoid direct sunlight.',
-                'soil': 'Orchid bark or sphagnum moss mix.',
-                'temperature': '65-75°F (18-24°C).',
-                'humidity': 'High humidity preferred. Use humidity tray.',
-                'fertilizer': 'Feed weekly with orchid fertilizer during growing season.',
-                'pruning': 'Remove spent flower spikes. Trim dead roots.',
-                'propagation': 'Division or keiki (baby plants).',
-                'common_problems': 'No flowers (insufficient light), yellow leaves (overwatering).',
-                'tips': 'Repot every 1-2 years. Provide good air circulation.',
-                'difficulty': 'Moderate',
-                'toxicity': 'Generally safe for pets'
-            },
-            'Bamboo': {
-                'watering': 'Keep soil evenly moist but not soggy.',
-                'light': 'Low to bright indirect light. Avoid direct sunlight.',
-                'soil': 'Well-draining potting mix or water.',
-                'temperature': '65-80°F (18-27°C).',
-                'humidity': 'Normal household humidity.',
-                'fertilizer': 'Feed monthly with balanced fertilizer.',
-                'pruning': 'Trim to control height and shape.',
-                'propagation': 'Division of root ball.',
-                'common_problems': 'Yellow leaves (overwatering), brown tips (low humidity).',
-                'tips': 'Can grow in water or soil. Change water weekly if growing in water.',
-                'difficulty': 'Easy',
-                'toxicity': 'Generally safe for pets'
-            },
-                    'Moss': {
-                        'watering': 'Keep consistently moist. Mist regularly.',
-                        'light': 'Low to bright indirect light. Avoid direct sunlight.',
-                        'soil': 'No soil needed. Can grow on various surfaces.',
-                        'temperature': '60-75°F (15-24°C).',
-                        'humidity': 'High humidity preferred. Mist daily.',
-                        'fertilizer': 'Feed monthly with diluted fertilizer.',
-                        'pruning': 'Trim to maintain shape.',
-                        'propagation': 'Division or spores.',
-                        'common_problems': 'Drying out (low humidity), browning (too much light).',
-                        'tips': 'Loves humidity and consistent moisture. Great for terrariums.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Generally safe for pets'
-                    },
-                    'Medicinal': {
-                        'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
-                        'light': 'Bright, indirect light. Some can tolerate direct sun.',
-                        'soil': 'Well-draining potting mix with organic matter.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly with organic fertilizer.',
-                        'pruning': 'Harvest leaves and flowers regularly.',
-                        'propagation': 'Seeds, cuttings, or division.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Research medicinal properties before use. Consult healthcare provider.',
-                        'difficulty': 'Easy to Moderate',
-                        'toxicity': 'Research toxicity before use'
-                    },
-                    'Aromatic': {
-                        'watering': 'Water when top inch of soil is dry. Allow soil to dry between waterings.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '60-75°F (15-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly with balanced fertilizer.',
-                        'pruning': 'Pinch back to encourage bushiness.',
-                        'propagation': 'Cuttings or seeds.',
-                        'common_problems': 'Leggy growth (insufficient light), overwatering.',
-                        'tips': 'Crush leaves to release fragrance. Use in cooking and aromatherapy.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before use'
-                    },
-                    'Indoor Trees': {
-                        'watering': 'Water when top 2 inches of soil are dry.',
-                        'light': 'Bright, indirect light. Avoid direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim to maintain shape and size.',
-                        'propagation': 'Cuttings or air layering.',
-                        'common_problems': 'Leaf drop (overwatering), brown tips (low humidity).',
-                        'tips': 'Rotate regularly for even growth. Wipe leaves to remove dust.',
-                        'difficulty': 'Easy to Moderate',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Hanging Plants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, indirect light. Avoid direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim to control length and encourage bushiness.',
-                        'propagation': 'Cuttings in water or soil.',
-                        'common_problems': 'Leggy growth (insufficient light), overwatering.',
-                        'tips': 'Provide support for trailing. Can be trained to climb or trail.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Low Light': {
-                        'watering': 'Water when top 2 inches of soil are dry.',
-                        'light': 'Low to bright indirect light. Avoid direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim dead or damaged leaves.',
-                        'propagation': 'Division or cuttings.',
-                        'common_problems': 'Leggy growth (insufficient light), overwatering.',
-                        'tips': 'Perfect for low-light areas. Rotate regularly for even growth.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'High Light': {
-                        'watering': 'Water when soil is completely dry.',
-                        'light': 'Bright, direct light. Full sun preferred.',
-                        'soil': 'Well-draining cactus/succulent mix.',
-                        'temperature': '65-80°F (18-27°C).',
-                        'humidity': 'Low humidity preferred.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim dead or damaged parts.',
-                        'propagation': 'Cuttings, offsets, or seeds.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Perfect for sunny windows. Allow soil to dry completely between waterings.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Flowering Houseplants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly with flowering plant fertilizer.',
-                        'pruning': 'Deadhead spent flowers. Trim to maintain shape.',
-                        'propagation': 'Cuttings, seeds, or division.',
-                        'common_problems': 'No flowers (insufficient light), overwatering.',
-                        'tips': 'Provide consistent care for best flowering. Deadhead regularly.',
-                        'difficulty': 'Easy to Moderate',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Fruit Trees': {
-                        'watering': 'Water when top 2 inches of soil are dry.',
-                        'light': 'Bright, direct light. Full sun preferred.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly with fruit tree fertilizer.',
-                        'pruning': 'Prune to maintain shape and encourage fruiting.',
-                        'propagation': 'Cuttings, grafting, or seeds.',
-                        'common_problems': 'No fruit (insufficient light), overwatering.',
-                        'tips': 'Provide consistent care for best fruiting. Pollinate flowers if needed.',
-                        'difficulty': 'Moderate to Hard',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Vegetable Plants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, direct light. Full sun preferred.',
-                        'soil': 'Well-draining potting mix with compost.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly with vegetable fertilizer.',
-                        'pruning': 'Harvest regularly. Trim dead or damaged parts.',
-                        'propagation': 'Seeds or cuttings.',
-                        'common_problems': 'Pests, diseases, insufficient light.',
-                        'tips': 'Provide consistent care for best harvest. Rotate crops.',
-                        'difficulty': 'Easy to Moderate',
-                        'toxicity': 'Generally safe for pets'
-                    },
-                    'Spice Plants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly with organic fertilizer.',
-                        'pruning': 'Harvest regularly. Trim to maintain shape.',
-                        'propagation': 'Cuttings or seeds.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Harvest regularly for best flavor. Use in cooking.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before use'
-                    },
-                    'Tea Plants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly with organic fertilizer.',
-                        'pruning': 'Harvest leaves regularly. Trim to maintain shape.',
-                        'propagation': 'Cuttings or seeds.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Harvest leaves for tea. Research proper preparation.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before use'
-                    },
-                    'Ornamental Grasses': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim dead or damaged parts.',
-                        'propagation': 'Division or seeds.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Perfect for adding texture. Trim regularly.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Generally safe for pets'
-                    },
-                    'Ground Covers': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Low to bright indirect light. Some prefer direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim to control spread.',
-                        'propagation': 'Division or cuttings.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Perfect for covering bare soil. Trim regularly.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Climbing Plants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim to control growth and encourage bushiness.',
-                        'propagation': 'Cuttings or seeds.',
-                        'common_problems': 'Leggy growth (insufficient light), overwatering.',
-                        'tips': 'Provide support for climbing. Train regularly.',
-                        'difficulty': 'Easy to Moderate',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Shade Plants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Low to bright indirect light. Avoid direct sun.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim dead or damaged parts.',
-                        'propagation': 'Division or cuttings.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Perfect for shady areas. Rotate regularly.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Sun Plants': {
-                        'watering': 'Water when top inch of soil is dry.',
-                        'light': 'Bright, direct light. Full sun preferred.',
-                        'soil': 'Well-draining potting mix.',
-                        'temperature': '65-80°F (18-27°C).',
-                        'humidity': 'Normal household humidity.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Deadhead spent flowers. Trim to maintain shape.',
-                        'propagation': 'Cuttings or seeds.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Perfect for sunny areas. Deadhead regularly.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Rock Garden': {
-                        'watering': 'Water when soil is completely dry.',
-                        'light': 'Bright, direct light. Full sun preferred.',
-                        'soil': 'Well-draining cactus/succulent mix.',
-                        'temperature': '65-80°F (18-27°C).',
-                        'humidity': 'Low humidity preferred.',
-                        'fertilizer': 'Feed monthly during growing season.',
-                        'pruning': 'Trim dead or damaged parts.',
-                        'propagation': 'Cuttings or seeds.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Perfect for rock gardens. Allow soil to dry completely.',
-                        'difficulty': 'Easy',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Water Plants': {
-                        'watering': 'Keep consistently moist. Submerge in water.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Aquatic soil or no soil needed.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'High humidity preferred.',
-                        'fertilizer': 'Feed monthly with aquatic fertilizer.',
-                        'pruning': 'Trim dead or damaged parts.',
-                        'propagation': 'Division or cuttings.',
-                        'common_problems': 'Overwatering, insufficient light.',
-                        'tips': 'Perfect for water gardens. Keep water clean.',
-                        'difficulty': 'Easy to Moderate',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    },
-                    'Bog Plants': {
-                        'watering': 'Keep consistently moist. Never let dry out.',
-                        'light': 'Bright, indirect light. Some prefer direct sun.',
-                        'soil': 'Bog soil or sphagnum moss.',
-                        'temperature': '65-75°F (18-24°C).',
-                        'humidity': 'High humidity preferred.',
-                        'fertilizer': 'Feed monthly with bog fertilizer.',
-                        'pruning': 'Trim dead or damaged parts.',
-                        'propagation': 'Division or cuttings.',
-                        'common_problems': 'Drying out, insufficient light.',
-                        'tips': 'Perfect for bog gardens. Keep consistently moist.',
-                        'difficulty': 'Moderate',
-                        'toxicity': 'Research toxicity before bringing near pets'
-                    }
-        }
-        
         # Get appropriate care template
-        template = care_templates.get(category, care_templates['Houseplant'])
+        template = CARE_TEMPLATES.get(category, CARE_TEMPLATES['Houseplant'])
         
         return {
             'name': name,
@@ -722,45 +777,9 @@ class FastPlantDatabase:
             'category': category
         }
     
-    def format_for_chroma(self) -> List[Dict[str, Any]]:
+    def format_for_chroma(self, dedupe: bool = False, links: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Format plant data for Chroma Cloud database."""
-        chroma_documents = []
-        
-        for i, plant in enumerate(self.plant_database):
-            # Create comprehensive document text
-            document_parts = [
-                f"Plant: {plant['name']}",
-                f"Watering: {plant['watering']}",
-                f"Light: {plant['light']}",
-                f"Soil: {plant['soil']}",
-                f"Temperature: {plant['temperature']}",
-                f"Humidity: {plant['humidity']}",
-                f"Fertilizer: {plant['fertilizer']}",
-                f"Pruning: {plant['pruning']}",
-                f"Propagation: {plant['propagation']}",
-                f"Common Problems: {plant['common_problems']}",
-                f"Care Tips: {plant['tips']}",
-                f"Difficulty: {plant['difficulty']}",
-                f"Toxicity: {plant['toxicity']}",
-                f"Category: {plant['category']}"
-            ]
-            
-            document_text = " | ".join([part for part in document_parts if part.strip()])
-            
-            chroma_documents.append({
-                'id': f"plant_{i + 1:03d}",
-                'document': document_text,
-                'metadata': {
-                    'name': plant['name'],
-                    'category': plant['category'],
-                    'difficulty': plant['difficulty'],
-                    'toxicity': plant['toxicity'],
-                    'source': 'Fast Plant Database',
-                    'created_at': datetime.now().isoformat()
-                }
-            })
-        
-        return chroma_documents
+        return format_plants_for_chroma(self.plant_database, dedupe=dedupe, links=links)
     
     def save_to_json(self, filename: str = 'fast_plant_care_data.json'):
         """Save plant data to JSON file."""
@@ -771,16 +790,35 @@ class FastPlantDatabase:
         
         print(f"💾 Saved {len(self.plant_database)} plants to {output_path}")
     
-    def save_chroma_format(self, filename: str = 'chroma_fast_plant_data.json'):
-        """Save Chroma-formatted data to JSON file."""
-        chroma_documents = self.format_for_chroma()
+    def save_chroma_format(self, filename: str = 'chroma_fast_plant_data.json', dedupe: bool = False):
+        """Save Chroma-formatted data to JSON file.
+        
+        With `dedupe`, the member links are saved next to it as <name>_links.json.
+        """
+        links = []
+        chroma_documents = self.format_for_chroma(dedupe=dedupe, links=links)
         output_path = os.path.join(os.path.dirname(__file__), filename)
         
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(chroma_documents, f, indent=2, ensure_ascii=False)
         
         print(f"💾 Saved {len(chroma_documents)} Chroma documents to {output_path}")
+        if dedupe:
+            links_path = os.path.splitext(output_path)[0] + '_links.json'
+            with open(links_path, 'w', encoding='utf-8') as f:
+                json.dump(links, f, indent=2, ensure_ascii=False)
+            print(f"🔗 Linked {len(links)} plants to {len(chroma_documents)} shared documents in {links_path}")
         return chroma_documents
+    
+    def save_sqlite(self, filename: str = 'fast_plant_care.db', version: int = None):
+        """Save plant data as an indexed SQLite catalog (see catalog_sqlite.py)."""
+        from catalog_sqlite import build_catalog_db
+        
+        output_path = os.path.join(os.path.dirname(__file__), filename)
+        counts = build_catalog_db(self.plant_database, output_path, version=version)
+        
+        print(f"💾 Saved {counts['plants']} plants to SQLite catalog {output_path}")
+        return counts
 
 def main():
     """Main function to generate fast plant database."""
@@ -795,13 +833,29 @@ def main():
     # Save to JSON files
     db.save_to_json('fast_plant_care_data.json')
     chroma_documents = db.save_chroma_format('chroma_fast_plant_data.json')
+
+    from catalog_release import publish_release
+    manifest = publish_release(db.plant_database)
+    db.save_sqlite('fast_plant_care.db', version=manifest['version'])
+
+    try:
+        from similar_plants import build_similarity_graph, DEFAULT_GRAPH_DIR
+    except ImportError:
+        build_similarity_graph = None
+        print("⚠️ numpy not installed, skipping the similar-plants graph")
+    if build_similarity_graph:
+        build_similarity_graph(db.plant_database)
     
     print("\n🎉 Fast plant care database generation complete!")
     print("📁 Files created:")
     print("   - fast_plant_care_data.json (raw plant data)")
     print("   - chroma_fast_plant_data.json (formatted for Chroma Cloud)")
+    print("   - fast_plant_care.db (indexed SQLite catalog)")
+    if build_similarity_graph:
+        print(f"   - {DEFAULT_GRAPH_DIR} (precomputed similar-plant neighbours)")
     print(f"📊 Total plants: {len(db.plant_database)}")
     print(f"📊 Chroma documents: {len(chroma_documents)}")
+    print(f"📦 Catalog release v{manifest['version']}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Image Derivative Pipeline
+===============================================
+
+This script precomputes resized variants of every upload so request handlers
+can read a small, ready-made file instead of decoding and re-encoding the
+original each time:
+
+- thumb:   256px, for gallery grids
+- display: 1600px, for full-screen viewing
+- api:     1024px JPEG q85, matching optimizeImageForAPI in utils/imageAnalysis.js
+
+Variants are keyed by the content digest of the original, so byte-identical
+uploads are processed once and already-processed digests are skipped. Work is
+spread over a process pool, and JPEG originals are decoded at reduced scale
+(libjpeg DCT scaling via Image.draft) so multi-megapixel photos never need a
+full-resolution bitmap in memory.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from upload_store import UploadStore, cached_file_digest
+
+DERIVATIVE_DIR = '.derivatives'
+MANIFEST_FILE = 'manifest.json'
+
+# Variant name -> (max edge in pixels, JPEG quality). Ordered largest first so
+# each smaller variant can be resized from the previous one.
+VARIANTS: Dict[str, Tuple[int, int]] = {
+    'display': (1600, 85),
+    'api': (1024, 85),
+    'thumb': (256, 80),
+}
+
+# Allow very large originals; they are decoded at reduced scale anyway
+Image.MAX_IMAGE_PIXELS = None
+
+
+def derivative_path(root: str, digest: str, variant: str) -> str:
+    """Return where a variant of the given original digest is stored."""
+    return os.path.join(root, DERIVATIVE_DIR, variant, digest[:2], f"{digest}.jpg")
+
+
+def _open_scaled(path: str, max_edge: int) -> Image.Image:
+    """Open an image, decoding at the smallest scale still >= max_edge."""
+    image = Image.open(path)
+    if image.format == 'JPEG':
+        # draft() picks a 1/2, 1/4 or 1/8 DCT scale; must precede load()
+        image.draft('RGB', (max_edge, max_edge))
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ('RGB', 'L'):
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        rgba = image.convert('RGBA')
+        background.paste(rgba, mask=rgba.split()[-1])
+        image = background
+    elif image.mode == 'L':
+        image = image.convert('RGB')
+    return image
+
+
+def _save_atomic(image: Image.Image, path: str, quality: int):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    os.close(fd)
+    try:
+        image.save(tmp_path, 'JPEG', quality=quality, progressive=True, optimize=True)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def render_variants(source_path: str, root: str, digest: str,
+                    variants: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Render the requested variants of one original. Runs in a worker process."""
+    variants = variants or list(VARIANTS)
+    ordered = [name for name in VARIANTS if name in variants]
+    largest_edge = VARIANTS[ordered[0]][0]
+
+    image = _open_scaled(source_path, largest_edge)
+    result = {'digest': digest, 'width': image.width, 'height': image.height, 'variants': {}}
+
+    for name in ordered:
+        max_edge, quality = VARIANTS[name]
+        if max(image.size) > max_edge:
+            # Resize from the previous (larger) variant, never enlarge
+            image = image.copy()
+            image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        path = derivative_path(root, digest, name)
+        _save_atomic(image, path, quality)
+        result['variants'][name] = {
+            'path': os.path.relpath(path, root),
+            'width': image.width,
+            'height': image.height,
+            'bytes': os.path.getsize(path),
+        }
+
+    return result
+
+
+class DerivativePipeline:
+    """Build and look up precomputed image variants for an uploads directory."""
+
+    def __init__(self, root: Optional[str] = None, workers: Optional[int] = None):
+        self.store = UploadStore(root)
+        self.root = self.store.root
+        self.workers = workers
+        self.manifest_path = os.path.join(self.root, DERIVATIVE_DIR, MANIFEST_FILE)
+        self.manifest: Dict[str, Any] = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if not os.path.exists(self.manifest_path):
+            return {'digests': {}, 'names': {}, 'failed': {}, 'file_stats': {}}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        manifest.setdefault('file_stats', {})
+        return manifest
+
+    def save_manifest(self):
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.manifest_path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _digest_for(self, name: str) -> str:
+        digest = self.store.digest_for(name)
+        if digest is None:
+            # Not migrated to the upload store: hash once, then trust size + mtime
+            digest = cached_file_digest(os.path.join(self.root, name), name, self.manifest['file_stats'])
+        return digest
+
+    def is_complete(self, digest: str) -> bool:
+        """True when every variant of this digest has been rendered."""
+        entry = self.manifest['digests'].get(digest)
+        if not entry:
+            return False
+        return all(
+            name in entry['variants'] and os.path.exists(os.path.join(self.root, entry['variants'][name]['path']))
+            for name in VARIANTS
+        )
+
+    def pending(self) -> Dict[str, str]:
+        """Map each unprocessed digest to one source file that has its bytes."""
+        todo: Dict[str, str] = {}
+        names = list(self.store.iter_uploads())
+        for name in names:
+            digest = self._digest_for(name)
+            self.manifest['names'][name] = digest
+            if digest in todo or self.is_complete(digest) or digest in self.manifest['failed']:
+                continue
+            todo[digest] = os.path.join(self.root, name)
+        # Forget deleted uploads, so they neither resolve via variant_path nor count in the stats
+        present = set(names)
+        self.manifest['names'] = {n: d for n, d in self.manifest['names'].items() if n in present}
+        self.manifest['file_stats'] = {n: e for n, e in self.manifest['file_stats'].items() if n in present}
+        return todo
+
+    def run(self, retry_failed: bool = False) -> Dict[str, int]:
+        """Render variants for all unprocessed uploads in a process pool."""
+        if retry_failed:
+            self.manifest['failed'] = {}
+        todo = self.pending()
+        unique = set(self.manifest['names'].values()) - set(self.manifest['failed'])
+        stats = {'uploads': len(self.manifest['names']), 'processed': 0, 'failed': 0,
+                 'skipped': len(unique) - len(todo)}
+
+        if todo:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(render_variants, path, self.root, digest): digest
+                    for digest, path in todo.items()
+                }
+                for future in as_completed(futures):
+                    digest = futures[future]
+                    try:
+                        self.manifest['digests'][digest] = future.result()
+                        stats['processed'] += 1
+                    except Exception as e:
+                        self.manifest['failed'][digest] = str(e)
+                        stats['failed'] += 1
+                        print(f"❌ Error processing {os.path.basename(todo[digest])}: {e}")
+
+        self.save_manifest()
+        return stats
+
+    def variant_path(self, name: str, variant: str) -> Optional[str]:
+        """Return the absolute path of a ready-made variant for an upload name."""
+        digest = self.manifest['names'].get(name) or self.store.digest_for(name)
+        entry = self.manifest['digests'].get(digest) if digest else None
+        if not entry or variant not in entry['variants']:
+            return None
+        return os.path.join(self.root, entry['variants'][variant]['path'])
+
+
+def main():
+    """Precompute thumbnail, display and API variants for backend/uploads."""
+    parser = argparse.ArgumentParser(description='Precompute image derivatives for uploads')
+    parser.add_argument('--root', help='uploads directory (default: backend/uploads)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--retry-failed', action='store_true', help='retry images that failed before')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Image Derivative Pipeline")
+    print("=" * 50)
+
+    pipeline = DerivativePipeline(args.root, workers=args.workers)
+    stats = pipeline.run(retry_failed=args.retry_failed)
+
+    print(f"📊 {stats['uploads']} uploads scanned")
+    print(f"   - {stats['processed']} originals processed")
+    print(f"   - {stats['skipped']} already up to date")
+    print(f"   - {stats['failed']} failed")
+    print(f"💾 Manifest saved to {pipeline.manifest_path}")
+
+if __name__ == "__main__":
+    main()
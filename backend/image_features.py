@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Local Image Feature Extraction
+====================================================
+
+extractPlantFeatures and comparePlantGrowth in utils/imageAnalysis.js return
+simulated values, and a model call per photo is too slow and costly for
+tracking growth over a photo series. This script measures plant photos
+locally instead, with NumPy on downsampled arrays:
+
+- canopy ratio: share of foliage pixels (green, yellowing or browning)
+- green ratio, and yellowing/browning indices as shares of the canopy
+- hue and RGB histograms of the canopy
+- size estimates from the canopy bounding box (width, height, fill)
+
+Features are cached per content digest (see upload_store.py), so
+re-uploads and already-measured photos are free, and new photos are
+measured in a process pool. Growth trends are per plant: a plant's photos
+are the uploads its care logs reference (logs.photos in data/users.db),
+and the trend over them is a few array operations: canopy and colour
+changes between photos and per-day slopes over the whole series.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from image_derivatives import _open_scaled
+from upload_store import UploadStore, cached_file_digest
+
+FEATURE_DIR = '.features'
+FEATURE_FILE = 'features.json'
+DEFAULT_DB = os.path.join(os.path.dirname(__file__), 'data', 'users.db')
+# Bump when the measurements change so cached features are recomputed
+FEATURE_VERSION = 1
+
+ANALYSIS_EDGE = 256
+HUE_BINS = 18
+RGB_BINS = 16
+
+# Hue windows in degrees, with minimum saturation and value, for foliage classes
+GREEN_HUE = (65.0, 170.0)
+YELLOW_HUE = (40.0, 65.0)
+BROWN_HUE = (10.0, 40.0)
+MIN_SATURATION = 0.18
+MIN_VALUE = 0.12
+
+# Upload names end with the millisecond timestamp multer assigned
+UPLOAD_TIME_PATTERN = re.compile(r'-(\d{13})\.[A-Za-z0-9]+$')
+
+
+def _hsv(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Hue in degrees, saturation and value (0..1) of an (H, W, 3) float array."""
+    maximum = rgb.max(axis=2)
+    minimum = rgb.min(axis=2)
+    delta = maximum - minimum
+    safe = np.where(delta > 0, delta, 1.0)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    hue = np.where(maximum == r, ((g - b) / safe) % 6.0,
+                   np.where(maximum == g, (b - r) / safe + 2.0, (r - g) / safe + 4.0)) * 60.0
+    hue = np.where(delta > 0, hue, 0.0)
+    saturation = np.where(maximum > 0, delta / np.where(maximum > 0, maximum, 1.0), 0.0)
+    return hue, saturation, maximum
+
+
+def _histogram(values: np.ndarray, bins: int, upper: float) -> List[float]:
+    counts = np.bincount(np.minimum((values * (bins / upper)).astype(np.int64), bins - 1),
+                         minlength=bins)
+    total = counts.sum()
+    return [round(float(c), 4) for c in (counts / total if total else counts.astype(float))]
+
+
+def measure(rgb: np.ndarray) -> Dict[str, Any]:
+    """Features of one (H, W, 3) uint8 RGB array."""
+    pixels = rgb.astype(np.float32) / 255.0
+    hue, saturation, value = _hsv(pixels)
+    colored = (saturation >= MIN_SATURATION) & (value >= MIN_VALUE)
+    green = colored & (hue >= GREEN_HUE[0]) & (hue < GREEN_HUE[1])
+    yellow = colored & (hue >= YELLOW_HUE[0]) & (hue < YELLOW_HUE[1]) & (value >= 0.35)
+    brown = colored & (hue >= BROWN_HUE[0]) & (hue < BROWN_HUE[1]) & (value < 0.65)
+    canopy = green | yellow | brown
+
+    total = canopy.size
+    canopy_pixels = int(canopy.sum())
+    features: Dict[str, Any] = {
+        'width': int(rgb.shape[1]),
+        'height': int(rgb.shape[0]),
+        'canopy_ratio': round(canopy_pixels / total, 4),
+        'green_ratio': round(float(green.sum()) / total, 4),
+        'yellowing_index': round(float(yellow.sum()) / canopy_pixels, 4) if canopy_pixels else 0.0,
+        'browning_index': round(float(brown.sum()) / canopy_pixels, 4) if canopy_pixels else 0.0,
+    }
+
+    if canopy_pixels:
+        rows = np.flatnonzero(canopy.any(axis=1))
+        cols = np.flatnonzero(canopy.any(axis=0))
+        box_height = (rows[-1] - rows[0] + 1) / canopy.shape[0]
+        box_width = (cols[-1] - cols[0] + 1) / canopy.shape[1]
+        ys, xs = np.nonzero(canopy)
+        r, g, b = pixels[canopy].T
+        features.update({
+            'canopy_width': round(float(box_width), 4),
+            'canopy_height': round(float(box_height), 4),
+            'canopy_fill': round(canopy_pixels / (box_width * box_height * total), 4),
+            'canopy_center': [round(float(xs.mean()) / canopy.shape[1], 4),
+                              round(float(ys.mean()) / canopy.shape[0], 4)],
+            # Excess green (2g - r - b) of the canopy, a common vigour proxy
+            'excess_green': round(float((2 * g - r - b).mean()), 4),
+            'hue_histogram': _histogram(hue[canopy], HUE_BINS, 360.0),
+        })
+    else:
+        features.update({'canopy_width': 0.0, 'canopy_height': 0.0, 'canopy_fill': 0.0,
+                         'canopy_center': None, 'excess_green': 0.0,
+                         'hue_histogram': [0.0] * HUE_BINS})
+
+    features['rgb_histogram'] = [_histogram(pixels[..., channel].ravel(), RGB_BINS, 1.0 + 1e-6)
+                                 for channel in range(3)]
+    # Share of the canopy that is not discoloured, mirroring the 0..1 healthScore scale
+    features['color_health'] = round(max(0.0, 1.0 - features['yellowing_index']
+                                         - 1.5 * features['browning_index']), 4)
+    return features
+
+
+def extract_features(path: str, max_edge: int = ANALYSIS_EDGE) -> Dict[str, Any]:
+    """Decode an image at reduced scale and measure it."""
+    image = _open_scaled(path, max_edge)
+    if max(image.size) > max_edge:
+        image.thumbnail((max_edge, max_edge))
+    return measure(np.asarray(image, dtype=np.uint8))
+
+
+def extract_batch(items: List[Tuple[str, str]], max_edge: int = ANALYSIS_EDGE) -> List[Tuple[str, Any, Optional[str]]]:
+    """Measure (digest, path) pairs; returns (digest, features, error). Runs in a worker."""
+    results = []
+    for digest, path in items:
+        try:
+            results.append((digest, extract_features(path, max_edge), None))
+        except Exception as e:
+            results.append((digest, None, str(e)))
+    return results
+
+
+def upload_time(name: str, path: Optional[str] = None) -> Optional[float]:
+    """Upload time (epoch seconds) from the name, else the file's modification time."""
+    match = UPLOAD_TIME_PATTERN.search(name)
+    if match:
+        return int(match.group(1)) / 1000.0
+    return os.path.getmtime(path) if path and os.path.exists(path) else None
+
+
+def plant_photos(plant_id: str, db_path: str = DEFAULT_DB) -> List[str]:
+    """Upload names referenced by the care logs of one plant, oldest log first."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30)
+    try:
+        rows = conn.execute(
+            "SELECT photos FROM logs WHERE plant_id = ? AND photos IS NOT NULL ORDER BY timestamp",
+            (plant_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    names: List[str] = []
+    for (photos,) in rows:
+        try:
+            entries = json.loads(photos)
+        except ValueError:
+            continue
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            # Entries are upload records ({fileName, url, ...}) or bare /uploads/... URLs
+            if isinstance(entry, dict):
+                entry = entry.get('fileName') or entry.get('url')
+            if isinstance(entry, str) and entry:
+                name = os.path.basename(entry)
+                if name not in names:
+                    names.append(name)
+    return names
+
+
+def compare_features(previous: Dict[str, Any], current: Dict[str, Any],
+                     days: Optional[float] = None) -> Dict[str, Any]:
+    """Growth between two photos, in the shape comparePlantGrowth returns."""
+    # Relative to at least 1% of the frame so an almost empty first photo does not explode it
+    size_change = (current['canopy_ratio'] - previous['canopy_ratio']) / max(previous['canopy_ratio'], 0.01)
+    health_change = current['color_health'] - previous['color_health']
+    if size_change > 0.05 or health_change > 0.05:
+        trend = 'declining' if health_change < -0.05 else 'improving'
+    elif size_change < -0.05 or health_change < -0.05:
+        trend = 'declining'
+    else:
+        trend = 'stable'
+    return {
+        'sizeChange': round(size_change, 4),
+        'heightChange': round(current['canopy_height'] - previous['canopy_height'], 4),
+        'healthImprovement': round(health_change, 4),
+        'yellowingChange': round(current['yellowing_index'] - previous['yellowing_index'], 4),
+        'browningChange': round(current['browning_index'] - previous['browning_index'], 4),
+        'timeElapsed': round(days, 2) if days is not None else None,
+        'overallTrend': trend,
+    }
+
+
+def growth_trend(series: List[Tuple[float, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Per-day slopes and step-by-step changes over (epoch seconds, features) pairs."""
+    series = sorted(series, key=lambda item: item[0])
+    if len(series) < 2:
+        return {'photos': len(series), 'steps': [], 'slopes_per_day': {}}
+
+    days = np.array([timestamp for timestamp, _ in series]) / 86400.0
+    days -= days[0]
+    metrics = ['canopy_ratio', 'green_ratio', 'canopy_height', 'yellowing_index',
+               'browning_index', 'color_health']
+    values = np.array([[features[metric] for metric in metrics] for _, features in series])
+    # Least-squares slope of every metric against time, in one solve
+    design = np.stack([days, np.ones_like(days)], axis=1)
+    slopes = np.linalg.lstsq(design, values, rcond=None)[0][0] if days[-1] > 0 else np.zeros(len(metrics))
+
+    steps = [compare_features(series[i - 1][1], series[i][1], float(days[i] - days[i - 1]))
+             for i in range(1, len(series))]
+    return {
+        'photos': len(series),
+        'span_days': round(float(days[-1]), 2),
+        'first': datetime.fromtimestamp(series[0][0]).isoformat(),
+        'last': datetime.fromtimestamp(series[-1][0]).isoformat(),
+        'slopes_per_day': {metric: round(float(slope), 6) for metric, slope in zip(metrics, slopes)},
+        'overall': compare_features(series[0][1], series[-1][1], float(days[-1])),
+        'steps': steps,
+    }
+
+
+class FeatureExtractor:
+    """Digest-keyed feature cache for an uploads directory."""
+
+    def __init__(self, root: Optional[str] = None, workers: Optional[int] = None,
+                 batch_size: int = 16):
+        self.store = UploadStore(root)
+        self.root = self.store.root
+        self.workers = workers
+        self.batch_size = batch_size
+        self.cache_path = os.path.join(self.root, FEATURE_DIR, FEATURE_FILE)
+        self.cache: Dict[str, Any] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == FEATURE_VERSION:
+                cache.setdefault('file_stats', {})
+                return cache
+        return {'version': FEATURE_VERSION, 'digests': {}, 'names': {}, 'failed': {}, 'file_stats': {}}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.cache_path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    def _digest_for(self, name: str) -> str:
+        digest = self.store.digest_for(name)
+        if digest is None:
+            # Not migrated to the upload store: hash once, then trust size + mtime
+            digest = cached_file_digest(os.path.join(self.root, name), name, self.cache['file_stats'])
+        return digest
+
+    def pending(self, names: Optional[List[str]] = None) -> Dict[str, str]:
+        """Map each unmeasured digest to one file with its bytes."""
+        todo: Dict[str, str] = {}
+        every_upload = names is None
+        if every_upload:
+            names = list(self.store.iter_uploads())
+        for name in names:
+            digest = self._digest_for(name)
+            self.cache['names'][name] = digest
+            if digest in todo or digest in self.cache['digests'] or digest in self.cache['failed']:
+                continue
+            todo[digest] = os.path.join(self.root, name)
+        if every_upload:
+            # Forget deleted uploads, so they neither resolve via features_for nor count in the stats
+            present = set(names)
+            self.cache['names'] = {n: d for n, d in self.cache['names'].items() if n in present}
+            self.cache['file_stats'] = {n: e for n, e in self.cache['file_stats'].items() if n in present}
+        return todo
+
+    def run(self, names: Optional[List[str]] = None, retry_failed: bool = False) -> Dict[str, int]:
+        """Measure every uncached upload (or just `names`) in a process pool."""
+        if retry_failed:
+            self.cache['failed'] = {}
+        todo = list(self.pending(names).items())
+        unique = set(self.cache['names'].values())
+        stats = {'uploads': len(self.cache['names']), 'measured': 0, 'failed': 0,
+                 'cached': len(unique & self.cache['digests'].keys())}
+
+        if todo:
+            batches = [todo[i:i + self.batch_size] for i in range(0, len(todo), self.batch_size)]
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(extract_batch, batch) for batch in batches]
+                for future in as_completed(futures):
+                    for digest, features, error in future.result():
+                        if error is None:
+                            self.cache['digests'][digest] = features
+                            stats['measured'] += 1
+                        else:
+                            self.cache['failed'][digest] = error
+                            stats['failed'] += 1
+        self.save()
+        return stats
+
+    def features_for(self, name: str) -> Optional[Dict[str, Any]]:
+        digest = self.cache['names'].get(name) or self.store.digest_for(name)
+        return self.cache['digests'].get(digest) if digest else None
+
+    def trend(self, names: List[str]) -> Dict[str, Any]:
+        """Growth trend over the given uploads (photos of one plant), ordered by upload time."""
+        series = []
+        for name in names:
+            features = self.features_for(name)
+            timestamp = upload_time(name, os.path.join(self.root, name))
+            if features is not None and timestamp is not None:
+                series.append((timestamp, features))
+        return growth_trend(series)
+
+    def plant_trend(self, plant_id: str, db_path: str = DEFAULT_DB) -> Dict[str, Any]:
+        """Growth trend over the uploaded photos of one plant, measuring any that are new."""
+        names = [name for name in plant_photos(plant_id, db_path)
+                 if os.path.exists(os.path.join(self.root, name))]
+        if names:
+            self.run(names)
+        return self.trend(names)
+
+
+def main():
+    """Measure backend/uploads and optionally report a growth trend."""
+    parser = argparse.ArgumentParser(description='Local plant photo feature extraction')
+    parser.add_argument('names', nargs='*', help='upload names (default: every upload)')
+    parser.add_argument('--root', help='uploads directory (default: backend/uploads)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--retry-failed', action='store_true')
+    parser.add_argument('--trend', action='store_true',
+                        help='report the growth trend over the named photos (all of one plant)')
+    parser.add_argument('--plant', help="report the growth trend over this plant's logged photos")
+    parser.add_argument('--db', default=DEFAULT_DB, help='backend database with the care logs')
+    parser.add_argument('--output', help='write features (and trend) as JSON')
+    args = parser.parse_args()
+    if args.trend and not args.names and not args.plant:
+        # Uploads of different plants do not form one growth series
+        parser.error('--trend needs the photo names of one plant, or --plant')
+
+    print("🌱 Smart Plant Tracker - Local Image Feature Extraction")
+    print("=" * 55)
+
+    extractor = FeatureExtractor(args.root, workers=args.workers)
+    started = datetime.now()
+    stats = extractor.run(args.names or None, retry_failed=args.retry_failed)
+    elapsed = (datetime.now() - started).total_seconds()
+
+    print(f"📊 {stats['uploads']} uploads: {stats['measured']} measured, "
+          f"{stats['cached']} cached, {stats['failed']} failed ({elapsed:.2f} s)")
+
+    names = args.names or list(extractor.store.iter_uploads())
+    report: Dict[str, Any] = {'features': {name: extractor.features_for(name) for name in names}}
+    if args.plant:
+        report['plant'] = args.plant
+        report['trend'] = trend = extractor.plant_trend(args.plant, args.db)
+    elif args.trend:
+        report['trend'] = trend = extractor.trend(names)
+    if 'trend' in report:
+        if trend['photos'] >= 2:
+            overall = trend['overall']
+            print(f"📈 {trend['photos']} photos over {trend['span_days']} days: "
+                  f"canopy {overall['sizeChange']:+.1%}, health {overall['healthImprovement']:+.2f} "
+                  f"({overall['overallTrend']})")
+        else:
+            print("⚠️ Need at least two measured photos for a trend")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {os.path.abspath(args.output)}")
+    print(f"💾 Feature cache: {extractor.cache_path}")
+
+if __name__ == "__main__":
+    main()
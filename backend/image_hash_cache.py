@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Perceptual Hash Identification Cache
+==========================================================
+
+This module caches vision-model results for plant photos by perceptual hash,
+so re-uploads of the same or a nearly identical photo (re-encoded, resized,
+slightly cropped) can reuse an earlier identification instead of making
+another model call.
+
+Hashes are 64-bit pHash (DCT of a 32x32 grayscale thumbnail) or dHash
+(horizontal gradient of a 9x8 thumbnail). Lookups use a BK-tree over Hamming
+distance, so a radius search only visits a small part of the index.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageOps
+
+HASH_BITS = 64
+DEFAULT_MAX_DISTANCE = 6
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """Orthonormal DCT-II basis matrix of size n x n."""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix
+
+_DCT_32 = _dct_matrix(32)
+
+
+def _grayscale(image: Image.Image, size: Tuple[int, int]) -> np.ndarray:
+    if image.format == 'JPEG':
+        # Decode at reduced scale; the hash only needs a tiny thumbnail
+        image.draft('L', (size[0] * 4, size[1] * 4))
+    image = ImageOps.exif_transpose(image).convert('L')
+    return np.asarray(image.resize(size, Image.LANCZOS), dtype=np.float64)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    value = 0
+    for bit in bits.ravel():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def phash(image: Image.Image) -> int:
+    """64-bit DCT perceptual hash."""
+    pixels = _grayscale(image, (32, 32))
+    coefficients = _DCT_32 @ pixels @ _DCT_32.T
+    low = coefficients[:8, :8].ravel()
+    # Exclude the DC term from the median so overall brightness is ignored
+    median = np.median(low[1:])
+    return _bits_to_int(low > median)
+
+
+def dhash(image: Image.Image) -> int:
+    """64-bit difference hash."""
+    pixels = _grayscale(image, (9, 8))
+    return _bits_to_int(pixels[:, 1:] > pixels[:, :-1])
+
+
+HASH_FUNCTIONS = {'phash': phash, 'dhash': dhash}
+
+
+def hash_image(path: str, method: str = 'phash') -> int:
+    """Compute the perceptual hash of an image file."""
+    with Image.open(path) as image:
+        return HASH_FUNCTIONS[method](image)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes with Hamming distance.
+
+    Nodes are stored as [hash, {distance: child}] lists. A radius-r search
+    only descends into children whose edge distance d satisfies
+    |d - dist(query, node)| <= r (triangle inequality).
+    """
+
+    def __init__(self):
+        self.root: Optional[list] = None
+        self.size = 0
+
+    def add(self, value: int) -> bool:
+        """Insert a hash. Returns False if it was already present."""
+        if self.root is None:
+            self.root = [value, {}]
+            self.size = 1
+            return True
+
+        node = self.root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                return False
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [value, {}]
+                self.size += 1
+                return True
+            node = child
+
+    def search(self, value: int, radius: int) -> List[Tuple[int, int]]:
+        """Return (distance, hash) pairs within radius, nearest first."""
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= radius:
+                found.append((distance, node[0]))
+            low, high = distance - radius, distance + radius
+            for edge, child in node[1].items():
+                if low <= edge <= high:
+                    stack.append(child)
+        found.sort()
+        return found
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class IdentificationCache:
+    """Perceptual-hash keyed store of identification results."""
+
+    def __init__(self, path: Optional[str] = None, method: str = 'phash',
+                 max_distance: int = DEFAULT_MAX_DISTANCE):
+        if method not in HASH_FUNCTIONS:
+            raise ValueError(f"Unknown hash method: {method}")
+        self.path = path or os.path.join(os.path.dirname(__file__), 'data', f'identification_cache_{method}.json')
+        self.method = method
+        self.max_distance = max_distance
+        self.tree = BKTree()
+        self.results: Dict[int, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for key, result in data.get('results', {}).items():
+            value = int(key, 16)
+            self.results[value] = result
+            self.tree.add(value)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({
+                'method': self.method,
+                'results': {f"{value:016x}": result for value, result in self.results.items()},
+            }, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def hash(self, image_path: str) -> int:
+        return hash_image(image_path, self.method)
+
+    def put(self, image_hash: int, result: Dict[str, Any]):
+        """Store the model result for a hash (replacing any previous result)."""
+        self.results[image_hash] = result
+        self.tree.add(image_hash)
+
+    def put_image(self, image_path: str, result: Dict[str, Any]) -> int:
+        image_hash = self.hash(image_path)
+        self.put(image_hash, result)
+        return image_hash
+
+    def lookup(self, image_hash: int, max_distance: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Return the nearest cached result within max_distance bits, if any.
+
+        The returned dict is the stored result plus a `cache` entry describing
+        the matched hash and distance.
+        """
+        radius = self.max_distance if max_distance is None else max_distance
+        matches = self.tree.search(image_hash, radius)
+        if not matches:
+            return None
+        distance, matched = matches[0]
+        return {
+            **self.results[matched],
+            'cache': {
+                'hash': f"{matched:016x}",
+                'distance': distance,
+                'method': self.method,
+            },
+        }
+
+    def lookup_image(self, image_path: str, max_distance: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        return self.lookup(self.hash(image_path), max_distance)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+def main():
+    """Report near-duplicate groups among the backend uploads."""
+    parser = argparse.ArgumentParser(description='Perceptual hash identification cache')
+    parser.add_argument('--root', default=os.path.join(os.path.dirname(__file__), 'uploads'))
+    parser.add_argument('--method', choices=sorted(HASH_FUNCTIONS), default='phash')
+    parser.add_argument('--max-distance', type=int, default=DEFAULT_MAX_DISTANCE)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Perceptual Hash Cache")
+    print("=" * 50)
+
+    tree = BKTree()
+    names_by_hash: Dict[int, List[str]] = {}
+    for name in sorted(os.listdir(args.root)):
+        if name.startswith('.'):
+            continue
+        try:
+            value = hash_image(os.path.join(args.root, name), args.method)
+        except Exception as e:
+            print(f"⚠️ Skipping {name}: {e}")
+            continue
+        names_by_hash.setdefault(value, []).append(name)
+        tree.add(value)
+
+    print(f"📊 {sum(len(n) for n in names_by_hash.values())} images, {len(tree)} distinct hashes")
+    seen = set()
+    for value, names in names_by_hash.items():
+        if value in seen:
+            continue
+        group = []
+        for distance, match in tree.search(value, args.max_distance):
+            seen.add(match)
+            group.extend(names_by_hash[match])
+        if len(group) > 1:
+            print(f"   - {len(group)} near-duplicates: {', '.join(n[:8] for n in group)}")
+
+if __name__ == "__main__":
+    main()
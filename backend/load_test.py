@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - API Load Tester
+=====================================
+
+This module drives the Express backend with concurrent traffic and reports
+how it holds up: p50/p95/p99 latency, throughput and error rate, per step
+and overall.
+
+- Scenarios are short scripts of requests (for example: search a plant,
+  then ask the assistant about it) that run in order once per iteration.
+  Several scenarios can be mixed by weight, and scenario files in JSON can
+  add more.
+- Closed-loop mode keeps N virtual users busy back to back. Open-loop mode
+  starts iterations at a Poisson arrival rate and measures latency from
+  the scheduled start, so a slow server cannot hide its queueing delay.
+- Ramp mode steps the arrival rate up and reports the first stage where the
+  backend stops keeping up (throughput, p99 or errors), i.e. its
+  saturation point.
+
+The AI and Chroma dependencies can be replaced with the local stand-ins in
+stub_services.py, so the whole stack runs on one machine.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_PLANTS = [
+    'Monstera deliciosa', 'Snake Plant', 'Pothos', 'Fiddle Leaf Fig', 'Peace Lily',
+    'Spider Plant', 'ZZ Plant', 'Aloe Vera', 'Rubber Plant', 'Boston Fern',
+    'Chinese Evergreen', 'Jade Plant', 'Calathea', 'English Ivy', 'Basil',
+]
+
+DEFAULT_NOTES = [
+    'Watered thoroughly until it drained', 'New leaf unfurling', 'Rotated toward the window',
+    'Wiped dust off the leaves', 'Some yellowing on the lower leaves', 'Fertilized at half strength',
+]
+
+# Built-in scenario scripts; every step runs in order once per iteration.
+# Placeholders are filled from the iteration context ({plant}, {question},
+# {note}, {plant_id}), and auth steps send the virtual user's id header.
+SCENARIOS = {
+    'plant-care': [
+        {'name': 'plant-care search', 'method': 'POST', 'path': '/api/plant-care/search',
+         'json': {'plantName': '{plant}'}},
+    ],
+    'ask-ai': [
+        {'name': 'ask-ai', 'method': 'POST', 'path': '/api/ask-ai',
+         'json': {'question': '{question}', 'species': '{plant}'}},
+    ],
+    'logs': [
+        {'name': 'logs create', 'method': 'POST', 'path': '/api/logs', 'auth': True,
+         'json': {'plantId': '{plant_id}', 'note': '{note}', 'type': 'watering'}},
+        {'name': 'logs list', 'method': 'GET', 'path': '/api/logs?plantId={plant_id}&limit=10',
+         'auth': True},
+        {'name': 'logs stats', 'method': 'GET', 'path': '/api/logs/stats?plantId={plant_id}',
+         'auth': True},
+    ],
+    'identify': [
+        {'name': 'upload identify', 'method': 'POST', 'path': '/api/upload/identify',
+         'multipart': 'photo'},
+    ],
+    'browse-and-ask': [
+        {'name': 'plant-care search', 'method': 'POST', 'path': '/api/plant-care/search',
+         'json': {'plantName': '{plant}'}},
+        {'name': 'ask-ai', 'method': 'POST', 'path': '/api/ask-ai',
+         'json': {'question': '{question}', 'species': '{plant}'}},
+    ],
+}
+
+
+async def read_http_message(reader: asyncio.StreamReader,
+                            response: bool = False) -> Tuple[str, Dict[str, str], bytes]:
+    """Read one HTTP/1.1 message and return (start line, lowercased headers, body).
+
+    Handles Content-Length and chunked bodies; a response with neither is
+    read until the connection closes.
+    """
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            key, value = line.split(':', 1)
+            headers[key.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+            if size == 0:
+                # Skip trailers up to the blank line
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b''.join(chunks)
+    elif 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    elif response and headers.get('connection', '').lower() == 'close':
+        body = await reader.read()
+    else:
+        body = b''
+    return lines[0], headers, body
+
+
+class HTTPPool:
+    """Keep-alive HTTP/1.1 connections to one host, at most `size` open at once.
+
+    aiohttp is not a dependency of this repo, so this is a deliberately small
+    client on top of asyncio streams.
+    """
+
+    def __init__(self, host: str, port: int, size: int = 256, timeout: float = 60.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.slots = asyncio.Semaphore(size)
+
+    async def request(self, method: str, path: str, body: bytes = b'',
+                      headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        """Send one request and return (status, body)."""
+        lines = [f'{method} {path} HTTP/1.1', f'Host: {self.host}:{self.port}',
+                 f'Content-Length: {len(body)}']
+        lines += [f'{key}: {value}' for key, value in (headers or {}).items()]
+        payload = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+        async with self.slots:
+            while True:
+                reused = bool(self.idle)
+                reader, writer = self.idle.pop() if reused else await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), self.timeout)
+                try:
+                    writer.write(payload)
+                    status_line, response_headers, response_body = await asyncio.wait_for(
+                        read_http_message(reader, response=True), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError) as error:
+                    writer.close()
+                    # The server may have closed an idle keep-alive connection
+                    if reused:
+                        continue
+                    raise error
+                except BaseException:
+                    writer.close()
+                    raise
+
+                if response_headers.get('connection', '').lower() == 'close':
+                    writer.close()
+                else:
+                    self.idle.append((reader, writer))
+                return int(status_line.split()[1]), response_body
+
+    async def close(self):
+        while self.idle:
+            _, writer = self.idle.pop()
+            writer.close()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        'requests': count,
+        'errors': errors,
+        'error_rate': round(errors / count, 4) if count else 0.0,
+        'throughput_rps': round(count / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(values, 50), 1),
+        'p95_ms': round(percentile(values, 95), 1),
+        'p99_ms': round(percentile(values, 99), 1),
+        'mean_ms': round(sum(values) / count, 1) if count else 0.0,
+        'max_ms': round(values[-1], 1) if values else 0.0,
+    }
+
+
+class Recorder:
+    """Latencies and outcomes per step, plus whole iterations."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.dropped = 0
+
+    def record(self, name: str, latency_ms: float, status: str, ok: bool):
+        self.latencies.setdefault(name, []).append(latency_ms)
+        self.errors[name] = self.errors.get(name, 0) + (not ok)
+        counts = self.statuses.setdefault(name, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        steps = {name: dict(latency_summary(values, self.errors[name], elapsed),
+                            statuses=self.statuses[name])
+                 for name, values in sorted(self.latencies.items()) if name != 'iteration'}
+        all_latencies = [value for name, values in self.latencies.items()
+                         if name != 'iteration' for value in values]
+        all_errors = sum(count for name, count in self.errors.items() if name != 'iteration')
+        return {
+            'elapsed_s': round(elapsed, 2),
+            'overall': latency_summary(all_latencies, all_errors, elapsed),
+            'iterations': latency_summary(self.latencies.get('iteration', []),
+                                          self.errors.get('iteration', 0), elapsed),
+            'dropped': self.dropped,
+            'steps': steps,
+        }
+
+
+def _fill(value, context: Dict[str, Any]):
+    if isinstance(value, str):
+        return value.format(**context)
+    if isinstance(value, dict):
+        return {key: _fill(item, context) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fill(item, context) for item in value]
+    return value
+
+
+def _multipart(field: str, filename: str, content: bytes, content_type: str) -> Tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    body = (f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; '
+            f'filename="{filename}"\r\nContent-Type: {content_type}\r\n\r\n').encode('utf-8')
+    body += content + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def sample_image(seed: int = 0, size: int = 256) -> bytes:
+    """A small JPEG with a green blob, good enough for the identify route."""
+    import io
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    image = Image.new('RGB', (size, size), (rng.randint(180, 230),) * 3)
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x, y = rng.randint(0, size), rng.randint(0, size)
+        radius = rng.randint(size // 16, size // 5)
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius),
+                     fill=(rng.randint(20, 80), rng.randint(110, 190), rng.randint(20, 80)))
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=85)
+    return buffer.getvalue()
+
+
+def load_scenarios(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Scenario file: {name: [step, ...]} using the same step fields as SCENARIOS."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def parse_mix(specs: List[str], scenarios: Dict[str, List[Dict[str, Any]]]) -> List[Tuple[str, float]]:
+    """'name[:weight]' entries -> [(name, weight)]."""
+    mix = []
+    for spec in specs:
+        name, _, weight = spec.partition(':')
+        if name not in scenarios:
+            raise ValueError(f"Unknown scenario '{name}' (known: {', '.join(sorted(scenarios))})")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+class LoadTest:
+    """Runs scenario iterations against the backend and records the outcome."""
+
+    def __init__(self, pool: HTTPPool, scenarios: Dict[str, List[Dict[str, Any]]],
+                 mix: List[Tuple[str, float]], seed: int = 42, image: Optional[bytes] = None,
+                 questions: Optional[List[str]] = None, plants: Optional[List[str]] = None):
+        self.pool = pool
+        self.scenarios = scenarios
+        self.names = [name for name, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.rng = random.Random(seed)
+        self.image = image
+        self.plants = plants or DEFAULT_PLANTS
+        self.questions = questions or ['How often should I water my {plant}?']
+        self.users: List[Dict[str, str]] = []
+        self.recorder = Recorder()
+
+    def needs_users(self) -> bool:
+        return any(step.get('auth') for name in self.names for step in self.scenarios[name])
+
+    async def setup_users(self, count: int):
+        """Sign up `count` throwaway accounts, each with one plant for the log steps."""
+        run = uuid.uuid4().hex[:8]
+        for index in range(count):
+            body = json.dumps({'name': f'Load Test {index}', 'password': 'loadtest',
+                               'email': f'loadtest-{run}-{index}@example.com'}).encode('utf-8')
+            status, response = await self.pool.request(
+                'POST', '/api/auth/signup', body, {'Content-Type': 'application/json'})
+            if status >= 300:
+                raise RuntimeError(f'Sign up failed ({status}): {response[:200]!r}')
+            user_id = json.loads(response)['user']['id']
+
+            body = json.dumps({'name': self.plants[index % len(self.plants)],
+                               'species': self.plants[index % len(self.plants)]}).encode('utf-8')
+            status, response = await self.pool.request(
+                'POST', '/api/plant-data', body,
+                {'Content-Type': 'application/json', 'user-id': user_id})
+            if status >= 300:
+                raise RuntimeError(f'Creating a plant failed ({status}): {response[:200]!r}')
+            self.users.append({'user_id': user_id, 'plant_id': json.loads(response)['plant']['id']})
+
+    def _context(self) -> Dict[str, Any]:
+        plant = self.rng.choice(self.plants)
+        context = {'plant': plant, 'note': self.rng.choice(DEFAULT_NOTES)}
+        context['question'] = self.rng.choice(self.questions).replace('{plant}', plant)
+        if self.users:
+            context.update(self.rng.choice(self.users))
+        return context
+
+    async def run_step(self, step: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        headers = {}
+        body = b''
+        if 'json' in step:
+            body = json.dumps(_fill(step['json'], context)).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        elif 'multipart' in step:
+            body, headers['Content-Type'] = _multipart(step['multipart'], 'plant.jpg',
+                                                       self.image, 'image/jpeg')
+        if step.get('auth'):
+            headers['user-id'] = context['user_id']
+
+        started = time.perf_counter()
+        try:
+            status, _ = await self.pool.request(step.get('method', 'GET'),
+                                                _fill(step['path'], context), body, headers)
+            ok = status in step.get('expect', range(200, 300))
+            label = str(status)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as error:
+            ok, label = False, type(error).__name__
+        self.recorder.record(step.get('name', step['path']),
+                             (time.perf_counter() - started) * 1000, label, ok)
+        return ok
+
+    async def run_iteration(self, scheduled: Optional[float] = None):
+        """Run one scenario script; iteration latency counts from `scheduled` if given."""
+        started = scheduled if scheduled is not None else time.perf_counter()
+        name = self.rng.choices(self.names, self.weights)[0]
+        context = self._context()
+        ok = True
+        for step in self.scenarios[name]:
+            if not await self.run_step(step, context):
+                ok = False
+                break
+        self.recorder.record('iteration', (time.perf_counter() - started) * 1000,
+                             'ok' if ok else 'failed', ok)
+
+    async def closed_loop(self, concurrency: int, duration: float) -> Dict[str, Any]:
+        """`concurrency` virtual users run iterations back to back for `duration` seconds."""
+        self.recorder = Recorder()
+        started = time.perf_counter()
+        deadline = started + duration
+
+        async def user():
+            while time.perf_counter() < deadline:
+                await self.run_iteration()
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return self.recorder.summary(time.perf_counter() - started)
+
+    async def open_loop(self, rate: float, duration: float,
+                        max_in_flight: int = 1000) -> Dict[str, Any]:
+        """Start iterations at a Poisson `rate` per second for `duration` seconds.
+
+        Arrivals beyond `max_in_flight` are counted as dropped instead of
+        queued, so the generator itself never becomes the bottleneck.
+        """
+        self.recorder = Recorder()
+        pending = set()
+        started = time.perf_counter()
+        scheduled = started
+        while True:
+            scheduled += self.rng.expovariate(rate)
+            if scheduled - started >= duration:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(pending) >= max_in_flight:
+                self.recorder.dropped += 1
+                continue
+            task = asyncio.ensure_future(self.run_iteration(scheduled))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+        # Throughput over the arrival window, not the drain at the end
+        summary = self.recorder.summary(duration)
+        summary['offered_rps'] = rate
+        return summary
+
+    async def ramp(self, rates: List[float], duration: float, max_in_flight: int = 1000,
+                   slo_p99_ms: float = 2000.0, max_error_rate: float = 0.01) -> Dict[str, Any]:
+        """Open-loop stages at increasing rates until the backend saturates."""
+        stages = []
+        saturation = None
+        for rate in rates:
+            summary = await self.open_loop(rate, duration, max_in_flight)
+            iterations = summary['iterations']
+            reasons = []
+            if iterations['throughput_rps'] < 0.9 * rate:
+                reasons.append('throughput below offered rate')
+            if iterations['p99_ms'] > slo_p99_ms:
+                reasons.append(f'p99 above {slo_p99_ms:.0f} ms')
+            if summary['overall']['error_rate'] > max_error_rate or summary['dropped']:
+                reasons.append('errors')
+            summary['saturated'] = reasons
+            stages.append(summary)
+            print(f"   {rate:>7.1f}/s → {iterations['throughput_rps']:>7.1f}/s  "
+                  f"p50 {iterations['p50_ms']:.0f} ms  p99 {iterations['p99_ms']:.0f} ms  "
+                  f"errors {summary['overall']['error_rate']:.1%}" + (' ⚠️' if reasons else ''))
+            if reasons:
+                saturation = {'rate': rate, 'reasons': reasons}
+                break
+        return {'stages': stages, 'saturation': saturation}
+
+
+def parse_ramp(spec: str) -> List[float]:
+    """'start:stop:step' -> rates from start to stop inclusive."""
+    start, stop, step = (float(part) for part in spec.split(':'))
+    rates = []
+    rate = start
+    while rate <= stop + 1e-9:
+        rates.append(rate)
+        rate += step
+    return rates
+
+
+def print_summary(summary: Dict[str, Any]):
+    overall = summary['overall']
+    print(f"📊 {overall['requests']} requests in {summary['elapsed_s']} s "
+          f"({overall['throughput_rps']} req/s), errors {overall['error_rate']:.1%}"
+          + (f", dropped {summary['dropped']}" if summary['dropped'] else ''))
+    print(f"   {'step':<20} {'count':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>6}")
+    for name, stats in list(summary['steps'].items()) + [('iteration', summary['iterations'])]:
+        print(f"   {name:<20} {stats['requests']:>7} {stats['p50_ms']:>6.0f}ms "
+              f"{stats['p95_ms']:>6.0f}ms {stats['p99_ms']:>6.0f}ms {stats['error_rate']:>6.1%}")
+
+
+async def run(args) -> Dict[str, Any]:
+    scenarios = dict(SCENARIOS)
+    if args.scenario_file:
+        scenarios.update(load_scenarios(args.scenario_file))
+    mix = parse_mix(args.scenario or ['plant-care'], scenarios)
+
+    image = None
+    if any('multipart' in step for name, _ in mix for step in scenarios[name]):
+        if args.image:
+            with open(args.image, 'rb') as f:
+                image = f.read()
+        else:
+            image = sample_image(args.seed)
+
+    questions_path = os.path.join(BASE_DIR, 'data', 'retrieval_eval_queries.json')
+    questions = None
+    if os.path.exists(questions_path):
+        from bulk_query import load_questions
+        questions = load_questions(questions_path)
+
+    host, _, port = args.target.replace('http://', '').rstrip('/').partition(':')
+    pool = HTTPPool(host, int(port or 80), size=args.connections, timeout=args.timeout)
+    test = LoadTest(pool, scenarios, mix, seed=args.seed, image=image, questions=questions)
+    try:
+        if test.needs_users():
+            await test.setup_users(args.users)
+            print(f"👤 Signed up {args.users} load test users")
+
+        if args.ramp:
+            print(f"📈 Ramping {args.ramp} req/s, {args.duration:.0f} s per stage")
+            report = await test.ramp(parse_ramp(args.ramp), args.duration, args.max_in_flight,
+                                     args.slo_p99, args.max_error_rate)
+            if report['saturation']:
+                print(f"🔥 Saturated at {report['saturation']['rate']:.1f} iterations/s "
+                      f"({', '.join(report['saturation']['reasons'])})")
+            else:
+                print("✅ No saturation within the ramp")
+        elif args.rate:
+            print(f"🚦 Open loop: {args.rate} iterations/s for {args.duration:.0f} s")
+            report = await test.open_loop(args.rate, args.duration, args.max_in_flight)
+            print_summary(report)
+        else:
+            print(f"🔁 Closed loop: {args.concurrency} users for {args.duration:.0f} s")
+            report = await test.closed_loop(args.concurrency, args.duration)
+            print_summary(report)
+    finally:
+        await pool.close()
+
+    report['config'] = {'target': args.target, 'mix': mix, 'seed': args.seed}
+    return report
+
+
+def main():
+    """Run a load test against a running backend and optionally save the JSON report."""
+    parser = argparse.ArgumentParser(description='Smart Plant Tracker API load tester')
+    parser.add_argument('--target', default='http://127.0.0.1:5001')
+    parser.add_argument('--scenario', action='append',
+                        help=f"name[:weight], repeatable (built in: {', '.join(SCENARIOS)})")
+    parser.add_argument('--scenario-file', help='JSON file with extra scenarios')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds (per stage when ramping)')
+    parser.add_argument('--concurrency', type=int, default=10, help='closed-loop virtual users')
+    parser.add_argument('--rate', type=float, default=0, help='open-loop iterations per second')
+    parser.add_argument('--ramp', help='open-loop rate ramp start:stop:step, e.g. 5:100:5')
+    parser.add_argument('--slo-p99', type=float, default=2000.0, help='ramp p99 limit in ms')
+    parser.add_argument('--max-error-rate', type=float, default=0.01)
+    parser.add_argument('--max-in-flight', type=int, default=1000)
+    parser.add_argument('--connections', type=int, default=256)
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--users', type=int, default=4, help='accounts for authenticated steps')
+    parser.add_argument('--image', help='photo for upload steps (default: generated JPEG)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write the JSON report here')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - API Load Tester")
+    print("=" * 45)
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {os.path.abspath(args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Local Vector Collection
+=============================================
+
+An in-process stand-in for a Chroma collection, for offline evaluation and
+load testing. It implements the subset of the collection API our tools use
+(`add`, `get`, `count`, `query` with `where` filters) and returns results in
+the same nested-list shape as Chroma, so code written against
+`collection.query(query_texts=[...], n_results=k, include=[...])` runs against
+either one unchanged.
+
+Embeddings come from any backend with `embed_batch` (see
+embedding_service.py); the default hashing backend needs no model or network.
+Filters are resolved through a metadata bitmap index (metadata_bitmaps.py),
+so a filtered query only scores the documents that pass the filter.
+
+Author: Smart Plant Tracker Team
+"""
+
+import json
+import os
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from embedding_service import HashingEmbeddingBackend
+from metadata_bitmaps import MetadataBitmapIndex
+
+
+def matches_where(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate a Chroma-style metadata filter against one metadata dict."""
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == '$and':
+            if not all(matches_where(metadata, clause) for clause in condition):
+                return False
+            continue
+        if key == '$or':
+            if not any(matches_where(metadata, clause) for clause in condition):
+                return False
+            continue
+
+        value = metadata.get(key)
+        if not isinstance(condition, dict):
+            condition = {'$eq': condition}
+        for operator, operand in condition.items():
+            if operator == '$eq' and value != operand:
+                return False
+            if operator == '$ne' and value == operand:
+                return False
+            if operator == '$in' and value not in operand:
+                return False
+            if operator == '$nin' and value in operand:
+                return False
+            if operator in ('$gt', '$gte', '$lt', '$lte'):
+                if value is None:
+                    return False
+                if operator == '$gt' and not value > operand:
+                    return False
+                if operator == '$gte' and not value >= operand:
+                    return False
+                if operator == '$lt' and not value < operand:
+                    return False
+                if operator == '$lte' and not value <= operand:
+                    return False
+    return True
+
+
+class LocalCollection:
+    """Brute-force cosine-similarity collection with a Chroma-compatible API."""
+
+    def __init__(self, name: str = 'local', embedding_backend=None, metadata: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.metadata = metadata or {}
+        self.backend = embedding_backend or HashingEmbeddingBackend()
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._pending: List[np.ndarray] = []
+        self.metadata_index = MetadataBitmapIndex()
+
+    # Writing -----------------------------------------------------------
+
+    def add(self, documents: List[str], metadatas: Optional[List[Dict[str, Any]]] = None,
+            ids: Optional[List[str]] = None, embeddings: Optional[List[List[float]]] = None):
+        ids = ids or [f"doc_{len(self.ids) + i}" for i in range(len(documents))]
+        metadatas = metadatas or [{} for _ in documents]
+        for doc_id in ids:
+            if doc_id in self._positions:
+                raise ValueError(f"Duplicate id: {doc_id}")
+
+        vectors = np.asarray(embeddings if embeddings is not None else self.backend.embed_batch(documents),
+                             dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._pending.append(vectors / norms)
+
+        start = len(self.ids)
+        for doc_id, document, metadata in zip(ids, documents, metadatas):
+            self._positions[doc_id] = len(self.ids)
+            self.ids.append(doc_id)
+            self.documents.append(document)
+            self.metadatas.append(dict(metadata))
+        self.metadata_index.add(self.metadatas[start:])
+
+    @classmethod
+    def from_chroma_documents(cls, documents: List[Dict[str, Any]], name: str = 'local',
+                              embedding_backend=None, batch_size: int = 256) -> 'LocalCollection':
+        """Build from format_for_chroma-style [{id, document, metadata}] records."""
+        collection = cls(name, embedding_backend)
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start:start + batch_size]
+            collection.add(
+                documents=[d['document'] for d in batch],
+                metadatas=[d['metadata'] for d in batch],
+                ids=[d['id'] for d in batch],
+            )
+        return collection
+
+    @classmethod
+    def from_json_file(cls, path: str, **kwargs) -> 'LocalCollection':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_chroma_documents(json.load(f), **kwargs)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        if self._pending:
+            blocks = ([self._vectors] if len(self._vectors) else []) + self._pending
+            self._vectors = np.vstack(blocks)
+            self._pending = []
+        return self._vectors
+
+    # Reading -----------------------------------------------------------
+
+    def count(self) -> int:
+        return len(self.ids)
+
+    def get(self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None,
+            include: Optional[List[str]] = None) -> Dict[str, Any]:
+        if ids:
+            positions = [self._positions[i] for i in ids]
+            positions = [p for p in positions if matches_where(self.metadatas[p], where)]
+        else:
+            candidates = self.candidate_positions(where)
+            positions = range(len(self.ids)) if candidates is None else candidates.tolist()
+        return {
+            'ids': [self.ids[p] for p in positions],
+            'documents': [self.documents[p] for p in positions],
+            'metadatas': [self.metadatas[p] for p in positions],
+        }
+
+    def candidate_positions(self, where: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Document ordinals passing the filter, or None for no filter.
+
+        Clauses on indexed fields are answered from the bitmap index; any
+        others are checked only against the documents those clauses allow.
+        """
+        if not where:
+            return None
+        bitmap, exact = self.metadata_index.evaluate(where)
+        positions = np.arange(len(self.ids), dtype=np.int64) if bitmap is None else bitmap.to_array()
+        if exact:
+            return positions
+        return np.fromiter(
+            (p for p in positions.tolist() if matches_where(self.metadatas[p], where)),
+            dtype=np.int64,
+        )
+
+    def query(self, query_texts: Optional[List[str]] = None, n_results: int = 10,
+              where: Optional[Dict[str, Any]] = None, include: Optional[List[str]] = None,
+              query_embeddings: Optional[List[List[float]]] = None) -> Dict[str, Any]:
+        """Chroma-compatible nearest-neighbor query (cosine distance)."""
+        include = include or ['documents', 'metadatas', 'distances']
+        if query_embeddings is None:
+            query_embeddings = self.backend.embed_batch(list(query_texts))
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        queries = queries / norms
+
+        candidates = self.candidate_positions(where)
+        vectors = self.vectors if candidates is None else self.vectors[candidates]
+
+        result = {'ids': [], 'documents': [], 'metadatas': [], 'distances': []}
+        if not len(vectors):
+            for key in result:
+                result[key] = [[] for _ in queries]
+            return {key: value for key, value in result.items() if key == 'ids' or key in include}
+
+        scores = queries @ vectors.T
+        k = min(n_results, vectors.shape[0])
+        for row in scores:
+            top = np.argpartition(-row, k - 1)[:k]
+            top = top[np.argsort(-row[top])]
+            positions = top if candidates is None else candidates[top]
+            result['ids'].append([self.ids[p] for p in positions])
+            result['documents'].append([self.documents[p] for p in positions])
+            result['metadatas'].append([self.metadatas[p] for p in positions])
+            result['distances'].append([float(1 - row[i]) for i in top])
+
+        return {key: value for key, value in result.items() if key == 'ids' or key in include}
+
+
+def load_default_documents(filename: str = 'chroma_fast_plant_data.json') -> List[Dict[str, Any]]:
+    """Load the fast database's Chroma export.
+
+    Falls back to formatting the fast database in memory if the export has
+    not been generated.
+    """
+    path = os.path.join(os.path.dirname(__file__), filename)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    from fast_plant_database import FastPlantDatabase
+    return FastPlantDatabase().format_for_chroma()
+
+
+def load_default_collection(filename: str = 'chroma_fast_plant_data.json') -> LocalCollection:
+    """Build a local collection from the fast database's Chroma export."""
+    return LocalCollection.from_chroma_documents(load_default_documents(filename), name='fast_plant_care')
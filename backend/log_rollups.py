@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Log Statistics Rollups
+============================================
+
+This job keeps pre-aggregated care log statistics in summary tables inside
+the backend database (data/users.db), so `GET /api/logs/stats` becomes a
+few point reads instead of a scan over every log a user has written.
+
+Summaries are kept for every user (plant_id '') and every (user, plant):
+
+- log_stats_totals     total logs and latest log timestamp
+- log_stats_breakdown  counts by log type and by mood
+- log_stats_daily      counts per day (drives "this week" / "this month")
+- log_stats_weekly     counts per ISO week
+
+Triggers on `logs` append every insert, delete and update to
+log_rollup_journal. `update` folds the journal entries past the stored
+high-water mark into the summaries in one transaction. `rebuild`
+recomputes everything from the logs table, fanning the aggregation out
+over user shards in a process pool.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+DEFAULT_DB = os.path.join(os.path.dirname(__file__), 'data', 'users.db')
+ALL_PLANTS = ''
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_rollup_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    journal_seq INTEGER NOT NULL DEFAULT 0,
+    rebuilt_at TEXT,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS log_rollup_journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    delta INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    plant_id TEXT NOT NULL,
+    type TEXT,
+    mood TEXT,
+    timestamp TEXT
+);
+
+CREATE TABLE IF NOT EXISTS log_stats_totals (
+    user_id INTEGER NOT NULL,
+    plant_id TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    last_log TEXT,
+    PRIMARY KEY (user_id, plant_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS log_stats_breakdown (
+    user_id INTEGER NOT NULL,
+    plant_id TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (user_id, plant_id, dimension, value)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS log_stats_daily (
+    user_id INTEGER NOT NULL,
+    plant_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (user_id, plant_id, day)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS log_stats_weekly (
+    user_id INTEGER NOT NULL,
+    plant_id TEXT NOT NULL,
+    week TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (user_id, plant_id, week)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS logs_rollup_insert AFTER INSERT ON logs BEGIN
+    INSERT INTO log_rollup_journal (delta, user_id, plant_id, type, mood, timestamp)
+    VALUES (1, NEW.user_id, NEW.plant_id, NEW.type, NEW.mood, NEW.timestamp);
+END;
+
+CREATE TRIGGER IF NOT EXISTS logs_rollup_delete AFTER DELETE ON logs BEGIN
+    INSERT INTO log_rollup_journal (delta, user_id, plant_id, type, mood, timestamp)
+    VALUES (-1, OLD.user_id, OLD.plant_id, OLD.type, OLD.mood, OLD.timestamp);
+END;
+
+CREATE TRIGGER IF NOT EXISTS logs_rollup_update
+AFTER UPDATE OF user_id, plant_id, type, mood, timestamp ON logs BEGIN
+    INSERT INTO log_rollup_journal (delta, user_id, plant_id, type, mood, timestamp)
+    VALUES (-1, OLD.user_id, OLD.plant_id, OLD.type, OLD.mood, OLD.timestamp);
+    INSERT INTO log_rollup_journal (delta, user_id, plant_id, type, mood, timestamp)
+    VALUES (1, NEW.user_id, NEW.plant_id, NEW.type, NEW.mood, NEW.timestamp);
+END;
+
+INSERT OR IGNORE INTO log_rollup_state (id, journal_seq) VALUES (1, 0);
+"""
+
+SUMMARY_TABLES = ['log_stats_totals', 'log_stats_breakdown', 'log_stats_daily', 'log_stats_weekly']
+
+
+def iso_week(day: str) -> str:
+    """'2024-03-15' -> '2024-W11'."""
+    year, week, _ = date.fromisoformat(day).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class Rollup:
+    """In-memory aggregate deltas, keyed the same way as the summary tables."""
+
+    def __init__(self):
+        self.totals: Dict[Tuple[int, str], int] = defaultdict(int)
+        self.last_log: Dict[Tuple[int, str], str] = {}
+        self.breakdown: Dict[Tuple[int, str, str, str], int] = defaultdict(int)
+        self.daily: Dict[Tuple[int, str, str], int] = defaultdict(int)
+        self.weekly: Dict[Tuple[int, str, str], int] = defaultdict(int)
+        # Keys whose latest log may have been removed and needs recomputing
+        self.stale_last: set = set()
+
+    def add(self, delta: int, user_id: int, plant_id: str, log_type: Optional[str],
+            mood: Optional[str], timestamp: Optional[str]):
+        day = str(timestamp or '')[:10]
+        week = iso_week(day) if len(day) == 10 else None
+        for scope in (ALL_PLANTS, plant_id):
+            key = (user_id, scope)
+            self.totals[key] += delta
+            self.breakdown[key + ('type', log_type or 'general')] += delta
+            self.breakdown[key + ('mood', mood or 'neutral')] += delta
+            if week:
+                self.daily[key + (day,)] += delta
+                self.weekly[key + (week,)] += delta
+            if delta > 0:
+                if timestamp and timestamp > self.last_log.get(key, ''):
+                    self.last_log[key] = timestamp
+            else:
+                self.stale_last.add(key)
+
+    def merge(self, other: 'Rollup'):
+        for mine, theirs in ((self.totals, other.totals), (self.breakdown, other.breakdown),
+                             (self.daily, other.daily), (self.weekly, other.weekly)):
+            for key, value in theirs.items():
+                mine[key] += value
+        for key, timestamp in other.last_log.items():
+            if timestamp > self.last_log.get(key, ''):
+                self.last_log[key] = timestamp
+
+
+def ensure_schema(conn: sqlite3.Connection):
+    conn.executescript(SCHEMA)
+
+
+def _upsert_counts(conn: sqlite3.Connection, table: str, columns: List[str], counts: Dict[tuple, int]):
+    placeholders = ', '.join('?' * (len(columns) + 1))
+    conflict = ', '.join(columns)
+    conn.executemany(
+        f"INSERT INTO {table} ({conflict}, count) VALUES ({placeholders}) "
+        f"ON CONFLICT ({conflict}) DO UPDATE SET count = count + excluded.count",
+        [key + (value,) for key, value in counts.items() if value]
+    )
+    conn.execute(f"DELETE FROM {table} WHERE count <= 0")
+
+
+def apply_rollup(conn: sqlite3.Connection, rollup: Rollup):
+    """Add a rollup's deltas to the summary tables (caller owns the transaction)."""
+    conn.executemany(
+        "INSERT INTO log_stats_totals (user_id, plant_id, total, last_log) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (user_id, plant_id) DO UPDATE SET total = total + excluded.total, "
+        "last_log = NULLIF(MAX(COALESCE(last_log, ''), COALESCE(excluded.last_log, '')), '')",
+        [key + (value, rollup.last_log.get(key)) for key, value in rollup.totals.items()]
+    )
+    _upsert_counts(conn, 'log_stats_breakdown', ['user_id', 'plant_id', 'dimension', 'value'], rollup.breakdown)
+    _upsert_counts(conn, 'log_stats_daily', ['user_id', 'plant_id', 'day'], rollup.daily)
+    _upsert_counts(conn, 'log_stats_weekly', ['user_id', 'plant_id', 'week'], rollup.weekly)
+
+    for user_id, plant_id in rollup.stale_last:
+        if plant_id == ALL_PLANTS:
+            row = conn.execute("SELECT MAX(timestamp) FROM logs WHERE user_id = ?", (user_id,)).fetchone()
+        else:
+            row = conn.execute("SELECT MAX(timestamp) FROM logs WHERE user_id = ? AND plant_id = ?",
+                               (user_id, plant_id)).fetchone()
+        conn.execute("UPDATE log_stats_totals SET last_log = ? WHERE user_id = ? AND plant_id = ?",
+                     (row[0], user_id, plant_id))
+    conn.execute("DELETE FROM log_stats_totals WHERE total <= 0")
+
+
+def update(db_path: str = DEFAULT_DB) -> int:
+    """Fold journal entries past the high-water mark into the summaries; return how many.
+
+    The first run (before the triggers existed) does a full rebuild instead.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        ensure_schema(conn)
+        if conn.execute("SELECT rebuilt_at FROM log_rollup_state WHERE id = 1").fetchone()[0] is None:
+            conn.close()
+            return rebuild(db_path)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            watermark = conn.execute("SELECT journal_seq FROM log_rollup_state WHERE id = 1").fetchone()[0]
+            rows = conn.execute(
+                "SELECT seq, delta, user_id, plant_id, type, mood, timestamp FROM log_rollup_journal "
+                "WHERE seq > ? ORDER BY seq", (watermark,)
+            ).fetchall()
+            if not rows:
+                return 0
+
+            rollup = Rollup()
+            for _, delta, user_id, plant_id, log_type, mood, timestamp in rows:
+                rollup.add(delta, user_id, plant_id, log_type, mood, timestamp)
+            apply_rollup(conn, rollup)
+
+            high_water = rows[-1][0]
+            conn.execute("DELETE FROM log_rollup_journal WHERE seq <= ?", (high_water,))
+            conn.execute("UPDATE log_rollup_state SET journal_seq = ?, updated_at = ? WHERE id = 1",
+                         (high_water, datetime.now(timezone.utc).isoformat()))
+        return len(rows)
+    finally:
+        conn.close()
+
+
+def _aggregate_shard(db_path: str, shard: int, shards: int) -> Rollup:
+    """Aggregate the logs of users with user_id % shards == shard (runs in a worker)."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30)
+    try:
+        rollup = Rollup()
+        for user_id, plant_id, log_type, mood, timestamp in conn.execute(
+            "SELECT user_id, plant_id, type, mood, timestamp FROM logs WHERE user_id % ? = ?",
+            (shards, shard)
+        ):
+            rollup.add(1, user_id, plant_id, log_type, mood, timestamp)
+        rollup.stale_last.clear()
+        return rollup
+    finally:
+        conn.close()
+
+
+def rebuild(db_path: str = DEFAULT_DB, shards: int = 4, workers: Optional[int] = None) -> int:
+    """Recompute every summary from the logs table.
+
+    The write lock is held from the journal snapshot until the new summaries
+    commit, so no log change can be both counted and replayed. Readers are
+    not blocked; app writes wait (up to their busy timeout) for the rebuild.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        ensure_schema(conn)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            high_water = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM log_rollup_journal").fetchone()[0]
+
+            rollup = Rollup()
+            if shards > 1:
+                with ProcessPoolExecutor(max_workers=workers or shards) as pool:
+                    for shard_rollup in pool.map(_aggregate_shard, [db_path] * shards, range(shards),
+                                                 [shards] * shards):
+                        rollup.merge(shard_rollup)
+            else:
+                rollup = _aggregate_shard(db_path, 0, 1)
+
+            for table in SUMMARY_TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            apply_rollup(conn, rollup)
+
+            now = datetime.now(timezone.utc).isoformat()
+            conn.execute("DELETE FROM log_rollup_journal WHERE seq <= ?", (high_water,))
+            conn.execute("UPDATE log_rollup_state SET journal_seq = ?, rebuilt_at = ?, updated_at = ? "
+                         "WHERE id = 1", (high_water, now, now))
+        return sum(total for (_, scope), total in rollup.totals.items() if scope == ALL_PLANTS)
+    finally:
+        conn.close()
+
+
+def get_log_stats(conn: sqlite3.Connection, user_id: int, plant_id: Optional[str] = None,
+                  now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Same shape as database.getLogStats, read from the summary tables.
+
+    Week and month windows are counted in whole UTC days (the last 7 and 30
+    days including today).
+    """
+    scope = plant_id or ALL_PLANTS
+    today = (now or datetime.now(timezone.utc)).date()
+
+    row = conn.execute("SELECT total, last_log FROM log_stats_totals WHERE user_id = ? AND plant_id = ?",
+                       (user_id, scope)).fetchone()
+    stats = {
+        'totalLogs': row[0] if row else 0,
+        'logsThisWeek': 0,
+        'logsThisMonth': 0,
+        'typeBreakdown': {},
+        'moodBreakdown': {},
+        'lastLogDate': row[1] if row else None,
+    }
+    for dimension, value, count in conn.execute(
+        "SELECT dimension, value, count FROM log_stats_breakdown WHERE user_id = ? AND plant_id = ?",
+        (user_id, scope)
+    ):
+        stats['typeBreakdown' if dimension == 'type' else 'moodBreakdown'][value] = count
+
+    week_start = (today - timedelta(days=6)).isoformat()
+    for day, count in conn.execute(
+        "SELECT day, count FROM log_stats_daily WHERE user_id = ? AND plant_id = ? AND day >= ?",
+        (user_id, scope, (today - timedelta(days=29)).isoformat())
+    ):
+        stats['logsThisMonth'] += count
+        if day >= week_start:
+            stats['logsThisWeek'] += count
+    return stats
+
+
+def main():
+    """Update (or rebuild) the log statistics rollups in the backend database."""
+    parser = argparse.ArgumentParser(description='Maintain care log statistics rollups')
+    parser.add_argument('command', choices=['update', 'rebuild', 'stats'], nargs='?', default='update')
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('--shards', type=int, default=4)
+    parser.add_argument('--interval', type=float, help='keep updating every N seconds')
+    parser.add_argument('--user', type=int, help='user id for the stats command')
+    parser.add_argument('--plant', help='plant id for the stats command')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Log Statistics Rollups")
+    print("=" * 50)
+
+    if not os.path.exists(args.db):
+        print(f"❌ Error: {args.db} not found. Start the backend once to create it.")
+        return
+
+    if args.command == 'rebuild':
+        started = time.perf_counter()
+        total = rebuild(args.db, shards=args.shards)
+        print(f"✅ Rebuilt rollups for {total} logs across {args.shards} shards "
+              f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    elif args.command == 'stats':
+        conn = sqlite3.connect(args.db)
+        try:
+            print(get_log_stats(conn, args.user, args.plant))
+        finally:
+            conn.close()
+    else:
+        while True:
+            applied = update(args.db)
+            print(f"🔄 Applied {applied} log changes")
+            if not args.interval:
+                break
+            time.sleep(args.interval)
+
+if __name__ == "__main__":
+    main()
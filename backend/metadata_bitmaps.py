@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Metadata Bitmap Index
+===========================================
+
+Chroma-style `where` filters on the metadata format_for_chroma writes
+(`category`, `difficulty`, `toxicity`) used to be checked document by
+document, so even a filter matching a handful of plants cost a full scan.
+
+This module keeps one compressed bitmap of document ordinals per metadata
+value, laid out like a roaring bitmap: ordinals are split into chunks of
+65536 by their high 16 bits, and each chunk stores its low bits either as a
+sorted uint16 array (sparse, up to 4096 entries) or as a 1024-word bitset
+(dense). Filters become bitmap AND / OR / AND-NOT, and the matching
+ordinals are handed straight to the scorers:
+
+- LocalCollection.query / get     (local_collection.py)
+- QuantizedVectorIndex.search     (quantized_index.py, `candidates=`)
+- CatalogDB.search                (catalog_sqlite.py FTS5 BM25, `where=`, over
+                                  an index built from the catalog's own rows)
+
+Clauses on fields that are not indexed are checked afterwards against the
+bitmap's result only, so a selective indexed clause still bounds the cost.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import time
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+INDEXED_FIELDS = ('category', 'difficulty', 'toxicity')
+
+CHUNK_BITS = 16
+# Chunks with more entries than this are stored as bitsets (8 KB each)
+ARRAY_LIMIT = 4096
+
+INDEXABLE_TYPES = (str, int, float, bool)
+
+
+def _bitset_from_array(low: np.ndarray) -> np.ndarray:
+    dense = np.zeros(1 << CHUNK_BITS, dtype=bool)
+    dense[low] = True
+    return np.packbits(dense, bitorder='little').view(np.uint64)
+
+
+def _array_from_bitset(bits: np.ndarray) -> np.ndarray:
+    return np.flatnonzero(np.unpackbits(bits.view(np.uint8), bitorder='little')).astype(np.uint16)
+
+
+def _contains(bits: np.ndarray, low: np.ndarray) -> np.ndarray:
+    """Which of the sorted uint16 values `low` are set in a bitset."""
+    words = bits[low.astype(np.intp) >> 6]
+    return ((words >> (low & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+
+def _normalized(container: np.ndarray) -> Optional[np.ndarray]:
+    """Store a container in its smaller form; None when empty."""
+    if container.dtype == np.uint64:
+        cardinality = int(np.unpackbits(container.view(np.uint8)).sum())
+        if cardinality > ARRAY_LIMIT:
+            return container
+        container = _array_from_bitset(container)
+    elif len(container) > ARRAY_LIMIT:
+        return _bitset_from_array(container)
+    return container if len(container) else None
+
+
+def _and(a: np.ndarray, b: np.ndarray) -> Optional[np.ndarray]:
+    a_dense, b_dense = a.dtype == np.uint64, b.dtype == np.uint64
+    if a_dense and b_dense:
+        return _normalized(a & b)
+    if a_dense or b_dense:
+        array, bits = (b, a) if a_dense else (a, b)
+        return _normalized(array[_contains(bits, array)])
+    return _normalized(np.intersect1d(a, b, assume_unique=True))
+
+
+def _or(a: np.ndarray, b: np.ndarray) -> Optional[np.ndarray]:
+    a_dense, b_dense = a.dtype == np.uint64, b.dtype == np.uint64
+    if a_dense and b_dense:
+        return a | b
+    if not a_dense and not b_dense:
+        return _normalized(np.union1d(a, b))
+    array, bits = (b, a) if a_dense else (a, b)
+    return bits | _bitset_from_array(array)
+
+
+def _and_not(a: np.ndarray, b: np.ndarray) -> Optional[np.ndarray]:
+    a_dense, b_dense = a.dtype == np.uint64, b.dtype == np.uint64
+    if a_dense and b_dense:
+        return _normalized(a & ~b)
+    if a_dense:
+        return _normalized(a & ~_bitset_from_array(b))
+    if b_dense:
+        return _normalized(a[~_contains(b, a)])
+    return _normalized(np.setdiff1d(a, b, assume_unique=True))
+
+
+class Bitmap:
+    """An immutable roaring-style set of document ordinals."""
+
+    __slots__ = ('chunks',)
+
+    def __init__(self, chunks: Optional[Dict[int, np.ndarray]] = None):
+        self.chunks = chunks or {}
+
+    @classmethod
+    def from_sorted(cls, positions: np.ndarray) -> 'Bitmap':
+        """Build from sorted, unique non-negative ordinals."""
+        positions = np.asarray(positions, dtype=np.int64)
+        highs, starts = np.unique(positions >> CHUNK_BITS, return_index=True)
+        bounds = list(starts[1:]) + [len(positions)]
+        chunks = {}
+        for high, start, stop in zip(highs, starts, bounds):
+            low = (positions[start:stop] & 0xFFFF).astype(np.uint16)
+            chunks[int(high)] = _normalized(low)
+        return cls(chunks)
+
+    @classmethod
+    def full(cls, count: int) -> 'Bitmap':
+        return cls.from_sorted(np.arange(count, dtype=np.int64))
+
+    def _combine(self, other: 'Bitmap', operation, keep_left: bool, keep_right: bool) -> 'Bitmap':
+        chunks = {}
+        for high in sorted(self.chunks.keys() | other.chunks.keys()):
+            left, right = self.chunks.get(high), other.chunks.get(high)
+            if left is not None and right is not None:
+                container = operation(left, right)
+            elif left is not None:
+                container = left if keep_left else None
+            else:
+                container = right if keep_right else None
+            if container is not None:
+                chunks[high] = container
+        return Bitmap(chunks)
+
+    def __and__(self, other: 'Bitmap') -> 'Bitmap':
+        return self._combine(other, _and, False, False)
+
+    def __or__(self, other: 'Bitmap') -> 'Bitmap':
+        return self._combine(other, _or, True, True)
+
+    def __sub__(self, other: 'Bitmap') -> 'Bitmap':
+        return self._combine(other, _and_not, True, False)
+
+    def __len__(self) -> int:
+        return sum(len(c) if c.dtype == np.uint16 else int(np.unpackbits(c.view(np.uint8)).sum())
+                   for c in self.chunks.values())
+
+    def to_array(self) -> np.ndarray:
+        """Sorted int64 ordinals."""
+        parts = []
+        for high in sorted(self.chunks):
+            container = self.chunks[high]
+            low = container if container.dtype == np.uint16 else _array_from_bitset(container)
+            parts.append((high << CHUNK_BITS) + low.astype(np.int64))
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self.chunks.values())
+
+
+def union(bitmaps: Sequence[Bitmap]) -> Bitmap:
+    result = Bitmap()
+    for bitmap in bitmaps:
+        result = result | bitmap
+    return result
+
+
+class MetadataBitmapIndex:
+    """Bitmaps of document ordinals per (field, value) for Chroma-style filters.
+
+    Documents are added in ordinal order; bitmaps are (re)built lazily on
+    the first filter after an add, like LocalCollection's vector matrix.
+    """
+
+    def __init__(self, fields: Sequence[str] = INDEXED_FIELDS):
+        self.fields = tuple(fields)
+        self.count = 0
+        self._positions: Dict[str, Dict[Any, List[int]]] = {field: {} for field in self.fields}
+        self._bitmaps: Optional[Dict[str, Dict[Any, Bitmap]]] = None
+        self._all: Optional[Bitmap] = None
+        # Fields with values a bitmap can't key (lists, dicts) are left to the scan
+        self._unindexable = set()
+
+    def add(self, metadatas: Sequence[Dict[str, Any]]):
+        for metadata in metadatas:
+            for field in self.fields:
+                value = metadata.get(field)
+                if value is None:
+                    continue
+                if isinstance(value, INDEXABLE_TYPES):
+                    self._positions[field].setdefault(value, []).append(self.count)
+                else:
+                    self._unindexable.add(field)
+            self.count += 1
+        self._bitmaps = None
+        self._all = None
+
+    def _build(self):
+        if self._bitmaps is None:
+            self._bitmaps = {
+                field: {value: Bitmap.from_sorted(np.asarray(positions, dtype=np.int64))
+                        for value, positions in values.items()}
+                for field, values in self._positions.items()
+            }
+            self._all = Bitmap.full(self.count)
+
+    @property
+    def bitmaps(self) -> Dict[str, Dict[Any, Bitmap]]:
+        self._build()
+        return self._bitmaps
+
+    def bitmap(self, field: str, value: Any) -> Bitmap:
+        return self.bitmaps[field].get(value, Bitmap()) if isinstance(value, INDEXABLE_TYPES) else Bitmap()
+
+    def _condition(self, field: str, condition: Any) -> Tuple[Optional[Bitmap], bool]:
+        if field not in self.fields or field in self._unindexable:
+            return None, False
+        if not isinstance(condition, dict):
+            condition = {'$eq': condition}
+        result = self._all
+        for operator, operand in condition.items():
+            if not _indexable_operand(operator, operand):
+                return None, False
+            if operator == '$eq':
+                matched = self.bitmap(field, operand)
+            elif operator == '$ne':
+                matched = self._all - self.bitmap(field, operand)
+            elif operator == '$in':
+                matched = union([self.bitmap(field, value) for value in operand])
+            elif operator == '$nin':
+                matched = self._all - union([self.bitmap(field, value) for value in operand])
+            elif operator in ('$gt', '$gte', '$lt', '$lte'):
+                matched = union([bitmap for value, bitmap in self.bitmaps[field].items()
+                                 if _compare(operator, value, operand)])
+            else:
+                return None, False
+            result = result & matched
+        return result, True
+
+    def evaluate(self, where: Optional[Dict[str, Any]]) -> Tuple[Optional[Bitmap], bool]:
+        """Evaluate a Chroma-style filter as far as the index allows.
+
+        Returns (bitmap, exact): the bitmap holds every matching ordinal (None
+        means "could be any document"), and `exact` is False when clauses on
+        unindexed fields still have to be checked against its members.
+        """
+        self._build()
+        if not where:
+            return None, True
+        result, exact = None, True
+        for key, condition in where.items():
+            if key == '$and':
+                parts = [self.evaluate(clause) for clause in condition]
+            elif key == '$or':
+                parts = [self.evaluate(clause) for clause in condition]
+                if any(bitmap is None for bitmap, _ in parts):
+                    exact = False
+                    continue
+                parts = [(union([bitmap for bitmap, _ in parts]), all(e for _, e in parts))]
+            else:
+                parts = [self._condition(key, condition)]
+            for bitmap, part_exact in parts:
+                exact = exact and part_exact
+                if bitmap is not None:
+                    result = bitmap if result is None else result & bitmap
+        return result, exact
+
+
+def _indexable_operand(operator: str, operand: Any) -> bool:
+    """Whether the bitmaps can answer this operand; None, dicts and the like go to the scan."""
+    if operator in ('$in', '$nin'):
+        return (isinstance(operand, (list, tuple, set))
+                and all(isinstance(value, INDEXABLE_TYPES) for value in operand))
+    return isinstance(operand, INDEXABLE_TYPES)
+
+
+def _compare(operator: str, value: Any, operand: Any) -> bool:
+    try:
+        if operator == '$gt':
+            return value > operand
+        if operator == '$gte':
+            return value >= operand
+        if operator == '$lt':
+            return value < operand
+        return value <= operand
+    except TypeError:
+        return False
+
+
+def main():
+    """Compare bitmap filtering with a metadata scan on a synthetic catalog."""
+    from local_collection import matches_where
+    from synthetic_catalog import iter_records
+
+    parser = argparse.ArgumentParser(description='Metadata bitmap index benchmark')
+    parser.add_argument('--count', type=int, default=1000000, help='synthetic records to index')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Metadata Bitmap Index")
+    print("=" * 50)
+
+    metadatas = [{field: record[field] for field in ('name',) + INDEXED_FIELDS}
+                 for record in iter_records(args.seed, 0, args.count)]
+    started = time.perf_counter()
+    index = MetadataBitmapIndex()
+    index.add(metadatas)
+    bitmaps = index.bitmaps
+    print(f"📊 {index.count} documents, {sum(len(v) for v in bitmaps.values())} bitmaps, "
+          f"{sum(b.nbytes for v in bitmaps.values() for b in v.values()) / 1024 / 1024:.1f} MB, "
+          f"built in {time.perf_counter() - started:.2f} s")
+
+    filters = [
+        {'toxicity': 'Non-toxic to pets'},
+        {'$and': [{'toxicity': 'Non-toxic to pets'}, {'difficulty': 'Very Easy'}]},
+        {'$and': [{'category': 'Fern'}, {'difficulty': {'$in': ['Easy', 'Easy to Moderate']}},
+                  {'toxicity': {'$ne': 'Toxic to pets if ingested'}}]},
+        {'$or': [{'category': 'Cactus'}, {'category': 'Succulent'}]},
+    ]
+    for where in filters:
+        started = time.perf_counter()
+        scanned = sum(1 for metadata in metadatas if matches_where(metadata, where))
+        scan_time = time.perf_counter() - started
+        started = time.perf_counter()
+        bitmap, _ = index.evaluate(where)
+        matched = bitmap.to_array()
+        bitmap_time = time.perf_counter() - started
+        assert len(matched) == scanned
+        print(f"🔎 {len(matched):>8} matches  scan {scan_time * 1000:8.1f} ms  "
+              f"bitmap {bitmap_time * 1000:6.1f} ms  {where}")
+
+if __name__ == "__main__":
+    main()
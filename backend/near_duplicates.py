@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Near-Duplicate Care Documents
+===================================================
+
+Most catalog records are not unique care profiles: every species that
+`create_plant_entry` builds for a category carries the same template text,
+and every plant the scraper falls back to `generate_generic_care_info` for
+has the same body. Embedding and storing each of them separately costs
+per name instead of per profile.
+
+This module finds those clusters before documents are formatted for Chroma:
+
+- each record's care text (with its own name masked out) is cut into word
+  shingles and summarized as a MinHash signature
+- signatures are split into LSH bands; records sharing any band bucket with
+  an earlier record are compared against that bucket's first record only,
+  so the work stays roughly linear in the number of records
+- candidates whose estimated Jaccard similarity reaches the threshold are
+  merged; the earliest record of a cluster is its canonical record
+
+Clusters never span categories, because category is used for filtering and
+partition routing downstream.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import zlib
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Care fields compared for near-duplicates (name and category excluded)
+PROFILE_FIELDS = [
+    'watering', 'light', 'soil', 'temperature', 'humidity', 'fertilizer', 'pruning',
+    'propagation', 'common_problems', 'tips', 'difficulty', 'toxicity',
+]
+
+WORD_PATTERN = re.compile(r"[a-z0-9°%']+")
+
+
+# Odd multipliers combining word hashes into one word 3-gram hash
+GRAM_MULTIPLIERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64)
+
+
+class MinHasher:
+    """MinHash signatures over word 3-grams.
+
+    Words are crc32-hashed once (and cached); 3-gram hashes are combined
+    from them and permuted with multiply-shift hashes
+    ((a * x + b) mod 2^64) >> 32 (a odd) for a whole batch of texts at once.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = (rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) << np.uint64(1) | np.uint64(1))[:, None]
+        self.b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)[:, None]
+        self.word_hashes: Dict[str, int] = {}
+
+    def _word_hash(self, word: str) -> int:
+        value = self.word_hashes[word] = zlib.crc32(word.encode('utf-8'))
+        return value
+
+    def gram_hashes(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Concatenated 3-gram hashes of the texts and each text's start offset.
+
+        Texts shorter than three words use their word hashes (or the hash of
+        the empty string), so every text has at least one value.
+        """
+        cache, miss = self.word_hashes, self._word_hash
+        words = []
+        lengths = np.empty(len(texts), dtype=np.int64)
+        for i, text in enumerate(texts):
+            found = WORD_PATTERN.findall(text.lower()) or ['']
+            lengths[i] = len(found)
+            words.extend([cache.get(w) or miss(w) for w in found])
+        words = np.array(words, dtype=np.uint64)
+        size = len(GRAM_MULTIPLIERS)
+
+        # A gram starting at every word, valid only if it ends inside its own text
+        padded = np.concatenate([words, np.zeros(size - 1, dtype=np.uint64)])
+        grams = padded[:len(words)] * GRAM_MULTIPLIERS[0]
+        for k in range(1, size):
+            grams += padded[k:k + len(words)] * GRAM_MULTIPLIERS[k]
+        text_of = np.repeat(np.arange(len(texts)), lengths)
+        offset = np.arange(len(words)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        short = lengths < size
+        keep = offset <= lengths[text_of] - size
+        grams[short[text_of]] = words[short[text_of]]
+        keep |= short[text_of]
+
+        counts = np.where(short, lengths, lengths - size + 1)
+        return grams[keep], np.cumsum(counts) - counts
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """(len(texts), num_perm) signatures, hashed for the whole batch at once."""
+        values, starts = self.gram_hashes(texts)
+        # Wrapping uint64 arithmetic is the mod 2^64; no division needed
+        permuted = self.a * values[None, :]
+        permuted += self.b
+        permuted >>= np.uint64(32)
+        return np.minimum.reduceat(permuted, starts, axis=1).T
+
+
+def profile_text(plant: Dict[str, Any], fields: Sequence[str] = PROFILE_FIELDS) -> str:
+    """The record's (lowercased) care text with its own name masked, so templates compare equal."""
+    text = ' | '.join(str(plant.get(field) or '') for field in fields).lower()
+    name = plant.get('name')
+    if name:
+        text = text.replace(name.lower(), ' ')
+    return text
+
+
+def cluster_texts(texts: Sequence[str], threshold: float = 0.85, num_perm: int = 128,
+                  bands: int = 16, groups: Optional[Sequence[Any]] = None,
+                  stats: Optional[Dict[str, int]] = None, batch_size: int = 256) -> List[int]:
+    """Return, for every text, the index of its cluster's canonical (earliest) text.
+
+    Texts only cluster with texts of the same `groups` value when given.
+    `num_perm` must be a multiple of `bands`; more rows per band means fewer,
+    more similar candidates.
+    """
+    if num_perm % bands:
+        raise ValueError('num_perm must be a multiple of bands')
+    rows = num_perm // bands
+    hasher = MinHasher(num_perm)
+    stats = stats if stats is not None else {}
+
+    parent = list(range(len(texts)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    buckets: List[Dict[Any, int]] = [{} for _ in range(bands)]
+    # Only bucket heads are ever compared against, so only their signatures are kept
+    heads: Dict[int, np.ndarray] = {}
+    comparisons = 0
+    for batch_start in range(0, len(texts), batch_size):
+        batch = np.ascontiguousarray(hasher.signatures(texts[batch_start:batch_start + batch_size]))
+        # Each band's rows as one bytes key
+        band_keys = batch.view(f'V{rows * batch.itemsize}').tolist()
+        for offset, signature in enumerate(batch):
+            index = batch_start + offset
+            group = groups[index] if groups is not None else None
+            checked = set()
+            for band, band_key in enumerate(band_keys[offset]):
+                key = (group, band_key)
+                first = buckets[band].setdefault(key, index)
+                if first == index:
+                    heads[index] = signature
+                    continue
+                if first in checked:
+                    continue
+                checked.add(first)
+                comparisons += 1
+                if np.count_nonzero(heads[first] == signature) >= threshold * num_perm:
+                    # Union toward the earliest record so it stays canonical
+                    root, other = sorted((find(first), find(index)))
+                    parent[other] = root
+
+    canonical = [find(index) for index in range(len(texts))]
+    stats.update({'documents': len(texts), 'clusters': len(set(canonical)),
+                  'comparisons': comparisons, 'signatures_kept': len(heads)})
+    return canonical
+
+
+def cluster_plants(plants: Sequence[Dict[str, Any]], threshold: float = 0.85,
+                   stats: Optional[Dict[str, int]] = None) -> List[List[int]]:
+    """Group plant records into near-duplicate clusters of indexes, canonical first.
+
+    Clusters are ordered by their canonical record.
+    """
+    canonical = cluster_texts([profile_text(plant) for plant in plants], threshold,
+                              groups=[plant.get('category') for plant in plants], stats=stats)
+    clusters: Dict[int, List[int]] = {}
+    for index, root in enumerate(canonical):
+        clusters.setdefault(root, []).append(index)
+    return [clusters[root] for root in sorted(clusters)]
+
+
+def link_clusters(documents: List[Dict[str, Any]], clusters: List[List[int]],
+                  plants: Sequence[Dict[str, Any]], id_for, name_limit: int = 25
+                  ) -> List[Dict[str, Any]]:
+    """Attach cluster members to their canonical documents and return the member links.
+
+    `documents` holds one formatted document per cluster, in cluster order;
+    `id_for(index)` gives the document id a plant would have on its own.
+    The member names are appended to the canonical text (up to `name_limit`)
+    so a search for any member still lands on the shared document.
+    """
+    links = []
+    for document, members in zip(documents, clusters):
+        names = [plants[index]['name'] for index in members]
+        if len(members) > 1:
+            shown = ', '.join(names[1:name_limit + 1])
+            extra = len(names) - 1 - name_limit
+            document['document'] += f" | Same care as: {shown}" + (f" and {extra} more" if extra > 0 else '')
+        document['metadata']['cluster_size'] = len(members)
+        # The links file records full membership; metadata only names the first few
+        document['metadata']['members'] = '; '.join(names[:name_limit + 1])
+        links.extend({'id': id_for(index), 'name': plants[index]['name'],
+                      'canonical_id': document['id']} for index in members)
+    return links
+
+
+def main():
+    """Report near-duplicate clusters in a catalog JSON file (default: the fast database)."""
+    parser = argparse.ArgumentParser(description='Find near-duplicate plant care records')
+    parser.add_argument('input', nargs='?', help='catalog JSON (list of plants or {plants: [...]})')
+    parser.add_argument('--threshold', type=float, default=0.85)
+    parser.add_argument('--show', type=int, default=10, help='print the N largest clusters')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Near-Duplicate Care Documents")
+    print("=" * 55)
+
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            plants = json.load(f)
+        if isinstance(plants, dict):
+            plants = plants['plants']
+    else:
+        from fast_plant_database import FastPlantDatabase
+        plants = FastPlantDatabase().plant_database
+
+    stats = {}
+    started = time.perf_counter()
+    clusters = cluster_plants(plants, args.threshold, stats=stats)
+    elapsed = time.perf_counter() - started
+
+    print(f"📊 {stats['documents']} records → {stats['clusters']} distinct care profiles "
+          f"({1 - stats['clusters'] / max(stats['documents'], 1):.0%} fewer documents to embed)")
+    print(f"⏱️ {elapsed * 1000:.0f} ms, {stats['comparisons']} signature comparisons")
+    for members in sorted(clusters, key=len, reverse=True)[:args.show]:
+        if len(members) < 2:
+            break
+        canonical = plants[members[0]]
+        print(f"   {len(members):>4} × {canonical['name']} ({canonical.get('category', '?')})")
+    if args.input:
+        print(f"📁 Source: {os.path.abspath(args.input)}")
+
+if __name__ == "__main__":
+    main()
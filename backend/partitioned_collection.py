@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Category-Partitioned Collections
+======================================================
+
+This module splits the plant care documents into one collection per
+category group (foliage, succulents, edible, ...) instead of one flat
+`fast_plant_care` collection, and routes each query to the partitions that
+can answer it:
+
+- a `where` filter on `category` selects the groups holding those categories
+- plant mentions (via the Aho-Corasick entity extractor) select the groups
+  the mentioned plants live in; family mentions ("succulents") select that
+  family's group
+- anything else fans out to every partition in parallel and merges results
+
+`PartitionedCollection` exposes the same `query`/`count` interface as a
+Chroma collection, so it can be evaluated with retrieval_eval.py, and each
+partition can be rebuilt on its own.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Set
+
+BASE_DIR = os.path.dirname(__file__)
+
+# Partition -> categories from FastPlantDatabase (PLANT_FAMILIES keys and base plants)
+CATEGORY_GROUPS = {
+    'foliage': ['Houseplant', 'Pothos', 'Philodendron', 'Ficus', 'Tropical', 'Fern', 'Palm', 'Vine',
+                'Bamboo', 'Indoor Trees', 'Hanging Plants', 'Low Light'],
+    'succulents': ['Succulent', 'Cactus', 'Desert', 'High Light', 'Rock Garden'],
+    'edible': ['Herb', 'Vegetable Plants', 'Spice Plants', 'Tea Plants', 'Fruit Trees', 'Medicinal',
+               'Aromatic'],
+    'flowering': ['Flowering', 'Orchid', 'Flowering Houseplants'],
+    'trees': ['Tree', 'Bonsai'],
+    'specialty': ['Air Plant', 'Moss', 'Aquatic', 'Carnivorous', 'Water Plants', 'Bog Plants'],
+    'outdoor': ['Ornamental Grasses', 'Ground Covers', 'Climbing Plants', 'Shade Plants', 'Sun Plants'],
+}
+FALLBACK_PARTITION = 'other'
+
+_GROUP_BY_CATEGORY = {
+    category.lower(): group
+    for group, categories in CATEGORY_GROUPS.items()
+    for category in categories
+}
+
+
+def partition_for(category: str) -> str:
+    return _GROUP_BY_CATEGORY.get((category or '').strip().lower(), FALLBACK_PARTITION)
+
+
+def partition_documents(documents: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split format_for_chroma-style documents by their category group."""
+    partitions: Dict[str, List[Dict[str, Any]]] = {}
+    for document in documents:
+        group = partition_for(document['metadata'].get('category'))
+        partitions.setdefault(group, []).append(document)
+    return partitions
+
+
+def categories_in_where(where: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+    """Categories a filter restricts results to, or None if it does not restrict them."""
+    if not where:
+        return None
+    found = None
+    for key, condition in where.items():
+        if key == '$and':
+            for clause in condition:
+                clause_categories = categories_in_where(clause)
+                if clause_categories is not None:
+                    found = clause_categories if found is None else found & clause_categories
+        elif key == '$or':
+            branches = [categories_in_where(clause) for clause in condition]
+            if branches and all(branch is not None for branch in branches):
+                union = set().union(*branches)
+                found = union if found is None else found & union
+        elif key == 'category':
+            if isinstance(condition, dict):
+                if '$eq' in condition:
+                    values = {condition['$eq']}
+                elif '$in' in condition:
+                    values = set(condition['$in'])
+                else:
+                    continue
+            else:
+                values = {condition}
+            found = values if found is None else found & values
+    return found
+
+
+def partition_collection_name(prefix: str, group: str) -> str:
+    return f"{prefix}__{group}"
+
+
+class QueryRouter:
+    """Pick the partitions a query needs from filters and plant mentions."""
+
+    def __init__(self, documents: List[Dict[str, Any]]):
+        from fast_plant_database import PLANT_FAMILIES
+        from plant_entities import PlantEntityExtractor, normalize
+
+        self.groups_by_plant: Dict[str, Set[str]] = {}
+        entries = []
+        for document in documents:
+            metadata = document['metadata']
+            key = normalize(metadata['name'])
+            if key not in self.groups_by_plant:
+                self.groups_by_plant[key] = set()
+                entries.append({'text': metadata['name'], 'key': key, 'name': metadata['name'], 'kind': 'plant'})
+            self.groups_by_plant[key].add(partition_for(metadata.get('category')))
+
+        self.groups_by_family: Dict[str, str] = {}
+        for category in set(PLANT_FAMILIES) | set(_GROUP_BY_CATEGORY):
+            key = normalize(category)
+            self.groups_by_family[key] = partition_for(category)
+            entries.append({'text': category, 'key': key, 'name': category, 'kind': 'family'})
+
+        self.extractor = PlantEntityExtractor(entries)
+
+    def route(self, text: str, where: Optional[Dict[str, Any]] = None) -> Optional[Set[str]]:
+        """Partitions to search, or None to search all of them."""
+        categories = categories_in_where(where)
+        if categories is not None:
+            return {partition_for(category) for category in categories}
+
+        groups = set()
+        for mention in self.extractor.extract(text or ''):
+            if mention['kind'] == 'plant':
+                groups |= self.groups_by_plant.get(mention['key'], set())
+            else:
+                groups.add(self.groups_by_family[mention['key']])
+        return groups or None
+
+
+class PartitionedCollection:
+    """Chroma-style collection over several category partitions."""
+
+    def __init__(self, partitions: Dict[str, Any], router: Optional[QueryRouter] = None,
+                 max_workers: int = 8):
+        self.name = 'partitioned'
+        self.partitions = partitions
+        self.router = router
+        self.max_workers = max_workers
+        self._executor = None
+
+    @classmethod
+    def from_documents(cls, documents: List[Dict[str, Any]], embedding_backend=None,
+                       **kwargs) -> 'PartitionedCollection':
+        """Build one LocalCollection per category group."""
+        from local_collection import LocalCollection
+
+        partitions = {
+            group: LocalCollection.from_chroma_documents(docs, name=group, embedding_backend=embedding_backend)
+            for group, docs in partition_documents(documents).items()
+        }
+        return cls(partitions, QueryRouter(documents), **kwargs)
+
+    @classmethod
+    def from_chroma(cls, client, documents: List[Dict[str, Any]], prefix: str = 'fast_plant_care',
+                    **kwargs) -> 'PartitionedCollection':
+        """Attach to the partition collections written by populate_partitions()."""
+        partitions = {
+            group: client.get_collection(name=partition_collection_name(prefix, group))
+            for group in partition_documents(documents)
+        }
+        return cls(partitions, QueryRouter(documents), **kwargs)
+
+    def rebuild_partition(self, group: str, documents: List[Dict[str, Any]], embedding_backend=None):
+        """Replace one partition's local collection without touching the others."""
+        from local_collection import LocalCollection
+        self.partitions[group] = LocalCollection.from_chroma_documents(
+            documents, name=group, embedding_backend=embedding_backend)
+
+    def count(self) -> int:
+        return sum(partition.count() for partition in self.partitions.values())
+
+    def route(self, text: str, where: Optional[Dict[str, Any]] = None) -> List[str]:
+        groups = self.router.route(text, where) if self.router else None
+        if groups is None:
+            return sorted(self.partitions)
+        return sorted(group for group in groups if group in self.partitions)
+
+    def _fan_out(self, groups: List[str], kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if len(groups) == 1:
+            return [self.partitions[groups[0]].query(**kwargs)]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = [self._executor.submit(self.partitions[group].query, **kwargs) for group in groups]
+        return [future.result() for future in futures]
+
+    def query(self, query_texts: List[str], n_results: int = 10, where: Optional[Dict[str, Any]] = None,
+              include: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Route each query text, search only the chosen partitions and merge by distance."""
+        include = list(include or ['documents', 'metadatas', 'distances'])
+        inner_include = include if 'distances' in include else include + ['distances']
+        merged = {key: [] for key in ['ids'] + include}
+
+        for text in query_texts:
+            groups = self.route(text, where)
+            kwargs = {'query_texts': [text], 'n_results': n_results, 'include': inner_include}
+            if where:
+                kwargs['where'] = where
+
+            hits = []
+            for result in self._fan_out(groups, kwargs) if groups else []:
+                for i, doc_id in enumerate(result['ids'][0]):
+                    hits.append((result['distances'][0][i], doc_id, result, i))
+            hits.sort(key=lambda hit: hit[0])
+            hits = hits[:n_results]
+
+            merged['ids'].append([doc_id for _, doc_id, _, _ in hits])
+            for key in include:
+                merged[key].append([result[key][0][i] for _, _, result, i in hits])
+        return merged
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def populate_partitions(client, documents: List[Dict[str, Any]], prefix: str = 'fast_plant_care',
+                        groups: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Write each category group to its own Chroma collection.
+
+    Pass `groups` to rebuild only those partitions.
+    """
+    from populate_fast_plant_database import create_plant_care_collection, add_plants_to_chroma
+
+    written = {}
+    wanted = set(groups) if groups else None
+    for group, docs in sorted(partition_documents(documents).items()):
+        if wanted is not None and group not in wanted:
+            continue
+        name = partition_collection_name(prefix, group)
+        if wanted is not None:
+            try:
+                client.delete_collection(name=name)
+            except Exception:
+                pass
+        collection = create_plant_care_collection(client, name)
+        if add_plants_to_chroma(collection, docs):
+            written[group] = len(docs)
+    return written
+
+
+def main():
+    """Show partition sizes and routing for sample questions, or populate Chroma Cloud."""
+    parser = argparse.ArgumentParser(description='Category-partitioned plant care collections')
+    parser.add_argument('--input', default=os.path.join(BASE_DIR, 'chroma_fast_plant_data.json'))
+    parser.add_argument('--populate', action='store_true', help='write partitions to Chroma Cloud')
+    parser.add_argument('--groups', nargs='*', help='only rebuild these partitions')
+    parser.add_argument('questions', nargs='*')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Partitioned Collections")
+    print("=" * 50)
+
+    if os.path.exists(args.input):
+        with open(args.input, 'r', encoding='utf-8') as f:
+            documents = json.load(f)
+    else:
+        from fast_plant_database import FastPlantDatabase
+        documents = FastPlantDatabase().format_for_chroma()
+
+    if args.populate:
+        from populate_fast_plant_database import connect_to_chroma_cloud
+        client = connect_to_chroma_cloud()
+        if not client:
+            return
+        written = populate_partitions(client, documents, groups=args.groups)
+        print(f"✅ Wrote {sum(written.values())} documents to {len(written)} partitions")
+        return
+
+    collection = PartitionedCollection.from_documents(documents)
+    for group, partition in sorted(collection.partitions.items()):
+        print(f"📂 {group}: {partition.count()} documents")
+
+    for question in args.questions or [
+        "How often should I water my Snake Plant?",
+        "What soil do succulents need?",
+        "Which plants are safe for cats?",
+    ]:
+        groups = collection.route(question)
+        searched = sum(collection.partitions[g].count() for g in groups)
+        results = collection.query(query_texts=[question], n_results=3, include=['metadatas'])
+        top = ', '.join(m['name'] for m in results['metadatas'][0])
+        print(f"🔍 {question}\n   → {', '.join(groups)} ({searched}/{collection.count()} docs): {top}")
+    collection.close()
+
+if __name__ == "__main__":
+    main()
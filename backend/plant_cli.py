@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Plant Data CLI
+====================================
+
+One entry point for the Python data tools:
+
+    python plant_cli.py generate [--synthetic N] [--similar]
+    python plant_cli.py scrape [--num-plants N]
+    python plant_cli.py format [--input FILE] [--output FILE]
+    python plant_cli.py populate [--source fast|scraped]
+    python plant_cli.py query "How much light does a Snake Plant need?"
+    python plant_cli.py bench startup
+    python plant_cli.py bench retrieval
+
+Subcommand modules (and their dependencies such as chromadb, requests or
+numpy) are imported only when that subcommand runs, so `generate` and
+`format` start quickly and work without chromadb installed. Each handler
+declares the modules it imports with @startup_imports; `bench startup`
+imports a command line's declared modules in a fresh interpreter and fails
+when that exceeds the command's budget or pulls a heavyweight module into
+sys.modules.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+from typing import List, Dict, Any
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Import budget per command line (ms) and modules that must stay unloaded
+STARTUP_BUDGETS = {
+    'generate': 150,
+    'format': 150,
+    'format --input catalog.jsonl': 150,
+}
+FORBIDDEN_AT_STARTUP = ['chromadb', 'openai', 'requests', 'bs4', 'numpy', 'PIL']
+
+
+def startup_imports(*modules: str, **options: List[str]):
+    """Declare the modules a handler imports (keep in step with its body).
+
+    `options` maps an argument's dest to the extra modules the handler pulls
+    in when that argument is set, e.g. similar=['similar_plants'].
+    """
+    def declare(handler):
+        handler.startup_imports = (list(modules), options)
+        return handler
+    return declare
+
+
+@startup_imports('fast_plant_database', 'catalog_release', 'catalog_sqlite', 'catalog_merge',
+                 'partitioned_collection', synthetic=['synthetic_catalog'], similar=['similar_plants'])
+def cmd_generate(args) -> int:
+    if args.synthetic:
+        from synthetic_catalog import generate_catalog
+
+        manifest = generate_catalog(args.output or os.path.join(BASE_DIR, 'synthetic_catalog'),
+                                    args.synthetic, seed=args.seed)
+        print(f"✅ Generated {manifest['count']} synthetic records in {len(manifest['shards'])} shards")
+        return 0
+
+    from fast_plant_database import FastPlantDatabase
+
+    db = FastPlantDatabase()
+    db.save_to_json('fast_plant_care_data.json')
+    db.save_chroma_format('chroma_fast_plant_data.json')
+    print(f"📊 Total plants: {len(db.plant_database)}")
+
+    from catalog_release import publish_release
+    manifest = publish_release(db.plant_database)
+    print(f"📦 Catalog release v{manifest['version']}")
+    db.save_sqlite('fast_plant_care.db', version=manifest['version'])
+
+    if args.similar:
+        # Needs numpy, so it stays opt-in
+        from similar_plants import build_similarity_graph, DEFAULT_GRAPH_DIR
+        graph = build_similarity_graph(db.plant_database)
+        print(f"🔗 Similar plants: {graph['k']} neighbours per plant in {DEFAULT_GRAPH_DIR}")
+    return 0
+
+
+@startup_imports('plant_scraper')
+def cmd_scrape(args) -> int:
+    from plant_scraper import PlantCareScraper
+
+    scraper = PlantCareScraper()
+    scraper.scrape_plant_data(num_plants=args.num_plants)
+    scraper.save_to_json('scraped_plant_care_data.json')
+    return 0
+
+
+@startup_imports('fast_plant_database', 'document_renderer', dedupe=['near_duplicates'])
+def cmd_format(args) -> int:
+    if os.path.isdir(args.input) or args.input.endswith('.jsonl'):
+        # Sharded or JSON Lines catalogs are streamed straight to JSON Lines
+        from document_renderer import DocumentRenderer, iter_catalog_records
+
+        if args.dedupe:
+            print("❌ --dedupe needs the whole catalog in memory; use a JSON catalog")
+            return 1
+        output = args.output or (os.path.join(args.input, 'chroma_documents.jsonl') if os.path.isdir(args.input)
+                                 else os.path.splitext(args.input)[0] + '_chroma.jsonl')
+        with open(output, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+            count = DocumentRenderer().write_jsonl(iter_catalog_records(args.input), f)
+        print(f"💾 Saved {count} Chroma documents to {output}")
+        return 0
+
+    from fast_plant_database import format_plants_for_chroma
+
+    args.output = args.output or os.path.join(BASE_DIR, 'chroma_fast_plant_data.json')
+    with open(args.input, 'r', encoding='utf-8') as f:
+        plants = json.load(f)
+    if isinstance(plants, dict):
+        # Canonical catalog produced by catalog_merge.py
+        plants = plants['plants']
+
+    links = []
+    documents = format_plants_for_chroma(plants, dedupe=args.dedupe, links=links)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(documents, f, indent=2, ensure_ascii=False)
+    print(f"💾 Saved {len(documents)} Chroma documents to {args.output}")
+    if args.dedupe:
+        links_path = os.path.splitext(args.output)[0] + '_links.json'
+        with open(links_path, 'w', encoding='utf-8') as f:
+            json.dump(links, f, indent=2, ensure_ascii=False)
+        print(f"🔗 Linked {len(links)} plants to {len(documents)} shared documents in {links_path}")
+    return 0
+
+
+@startup_imports('populate_fast_plant_database', 'populate_plant_care_database')
+def cmd_populate(args) -> int:
+    if args.source == 'scraped':
+        import populate_plant_care_database as populate
+    else:
+        import populate_fast_plant_database as populate
+    populate.main()
+    return 0
+
+
+@startup_imports('populate_fast_plant_database')
+def cmd_query(args) -> int:
+    from populate_fast_plant_database import connect_to_chroma_cloud
+
+    client = connect_to_chroma_cloud()
+    if not client:
+        return 1
+    collection = client.get_collection(name=args.collection)
+    results = collection.query(
+        query_texts=[args.text],
+        n_results=args.n_results,
+        include=['documents', 'metadatas', 'distances']
+    )
+    for i, (doc, metadata, distance) in enumerate(zip(
+        results['documents'][0], results['metadatas'][0], results['distances'][0]
+    )):
+        print(f"{i + 1}. {metadata.get('name', 'Unknown')} (similarity {1 - distance:.3f})")
+        print(f"   {doc[:150]}...")
+    return 0
+
+
+def handler_imports(argv: List[str]) -> List[str]:
+    """Modules the handler of a command line declares it imports."""
+    args = build_parser().parse_args(argv)
+    modules, options = args.handler.startup_imports
+    return modules + [name for dest, extra in options.items() if getattr(args, dest, None) for name in extra]
+
+
+def measure_startup(command: str) -> Dict[str, Any]:
+    """Import the CLI and a command line's declared modules in a fresh interpreter.
+
+    Reports the import time and which FORBIDDEN_AT_STARTUP modules ended up
+    in sys.modules.
+    """
+    argv = shlex.split(command)
+    probe = (
+        "import sys, time, json\n"
+        "start = time.perf_counter()\n"
+        "import plant_cli\n"
+        f"plant_cli.build_parser().parse_args({argv!r})\n"
+        f"for name in {handler_imports(argv)!r}:\n"
+        "    __import__(name)\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "loaded = [m for m in plant_cli.FORBIDDEN_AT_STARTUP if m in sys.modules]\n"
+        "print(json.dumps({'ms': elapsed, 'loaded': loaded}))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', probe], cwd=BASE_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@startup_imports('retrieval_eval')
+def cmd_bench(args) -> int:
+    if args.target == 'retrieval':
+        from retrieval_eval import main as retrieval_main
+        return retrieval_main(['--output', args.output] if args.output else [])
+
+    failed = False
+    for command, budget in STARTUP_BUDGETS.items():
+        # Best of several runs to smooth out interpreter/cache noise
+        runs = [measure_startup(command) for _ in range(args.repeat)]
+        best = min(run['ms'] for run in runs)
+        loaded = runs[0]['loaded']
+        ok = best <= budget and not loaded
+        failed = failed or not ok
+        status = '✅' if ok else '❌'
+        extra = f", loaded {', '.join(loaded)}" if loaded else ''
+        print(f"{status} {command}: {best:.1f} ms (budget {budget} ms){extra}")
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='plant_cli', description='Smart Plant Tracker data tools')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help='generate the fast plant care catalog')
+    generate.add_argument('--synthetic', type=int, metavar='N', help='generate N synthetic records instead')
+    generate.add_argument('--seed', type=int, default=42)
+    generate.add_argument('--output', help='output directory for --synthetic')
+    generate.add_argument('--similar', action='store_true',
+                          help='also precompute the similar-plants graph (needs numpy)')
+    generate.set_defaults(handler=cmd_generate)
+
+    scrape = subparsers.add_parser('scrape', help='run the plant care scraper')
+    scrape.add_argument('--num-plants', type=int, default=50)
+    scrape.set_defaults(handler=cmd_scrape)
+
+    fmt = subparsers.add_parser('format', help='format a catalog for Chroma')
+    fmt.add_argument('--input', default=os.path.join(BASE_DIR, 'fast_plant_care_data.json'))
+    fmt.add_argument('--output', help='default: chroma_fast_plant_data.json, or JSON Lines next to a '
+                                      'synthetic catalog directory / .jsonl input')
+    fmt.add_argument('--dedupe', action='store_true',
+                     help='one document per near-duplicate cluster (see near_duplicates.py)')
+    fmt.set_defaults(handler=cmd_format)
+
+    populate = subparsers.add_parser('populate', help='upload formatted documents to Chroma Cloud')
+    populate.add_argument('--source', choices=['fast', 'scraped'], default='fast')
+    populate.set_defaults(handler=cmd_populate)
+
+    query = subparsers.add_parser('query', help='query a Chroma Cloud collection')
+    query.add_argument('text')
+    query.add_argument('--collection', default='fast_plant_care')
+    query.add_argument('--n-results', type=int, default=3)
+    query.set_defaults(handler=cmd_query)
+
+    bench = subparsers.add_parser('bench', help='run benchmarks')
+    bench.add_argument('target', nargs='?', choices=['startup', 'retrieval'], default='startup')
+    bench.add_argument('--repeat', type=int, default=5)
+    bench.add_argument('--output', help='report path for the retrieval benchmark')
+    bench.set_defaults(handler=cmd_bench)
+
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Plant Entity Extractor
+============================================
+
+This module finds plant mentions in free-text questions with an Aho-Corasick
+automaton compiled once from every catalog name, alias and family (e.g.
+"Ficus Lyrata", "ZZ Plant", "Pothos", "Succulent"). Text and patterns share
+one normalization (lowercase, punctuation to spaces, apostrophes dropped,
+simple plurals), and matching runs in a single pass over the message no
+matter how large the catalog is. Overlapping hits are resolved leftmost-
+longest, so "Marble Queen Pothos" wins over "Pothos".
+
+Author: Smart Plant Tracker Team
+"""
+
+import json
+import os
+import sys
+from collections import deque
+from typing import List, Dict, Any, Optional, Tuple
+
+BASE_DIR = os.path.dirname(__file__)
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """Normalize text, returning it padded with spaces plus a map to original offsets.
+
+    offsets[i] is the index in `text` of normalized character i (-1 for padding
+    and collapsed separators).
+    """
+    chars = [' ']
+    offsets = [-1]
+    for index, char in enumerate(text):
+        if char in "'’":
+            continue
+        if char.isalnum():
+            chars.append(char.lower())
+            offsets.append(index)
+        elif chars[-1] != ' ':
+            chars.append(' ')
+            offsets.append(-1)
+    if chars[-1] != ' ':
+        chars.append(' ')
+        offsets.append(-1)
+    return ''.join(chars), offsets
+
+
+def normalize(text: str) -> str:
+    return normalize_with_offsets(text)[0].strip()
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over strings with a payload per pattern."""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # Pattern ids ending at each state, including those reached via fail links
+        self.output: List[List[int]] = [[]]
+        self.patterns: List[str] = []
+        self.payloads: List[Any] = []
+        self._built = False
+
+    def add(self, pattern: str, payload: Any):
+        if self._built:
+            raise RuntimeError("Cannot add patterns after build()")
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = next_state
+        self.output[state].append(len(self.patterns))
+        self.patterns.append(pattern)
+        self.payloads.append(payload)
+
+    def build(self):
+        """Compute failure links breadth-first."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+        self._built = True
+
+    def iter_matches(self, text: str):
+        """Yield (end index exclusive, pattern id) for every occurrence."""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                yield index + 1, pattern_id
+
+
+class PlantEntityExtractor:
+    """Extract plant and family mentions from free text."""
+
+    def __init__(self, entries: List[Dict[str, str]]):
+        """`entries` are dicts with `text` (surface form), `key`, `name` and `kind`."""
+        self.automaton = AhoCorasick()
+        seen = set()
+        for entry in entries:
+            surface = normalize(entry['text'])
+            if not surface:
+                continue
+            for variant in self._variants(surface):
+                marker = (variant, entry['key'], entry['kind'])
+                if marker in seen:
+                    continue
+                seen.add(marker)
+                payload = {'key': entry['key'], 'name': entry['name'], 'kind': entry['kind']}
+                # Padding spaces make every match a whole-word match
+                self.automaton.add(f" {variant} ", payload)
+        self.automaton.build()
+
+    @staticmethod
+    def _variants(surface: str) -> List[str]:
+        variants = [surface]
+        if surface.endswith('s') and len(surface) > 3 and not surface.endswith(('ss', 'us', 'is')):
+            variants.append(surface[:-1])
+        elif not surface.endswith('s'):
+            variants.append(surface + 's')
+        return variants
+
+    @classmethod
+    def from_catalog(cls, catalog: Dict[str, Any], include_families: bool = True) -> 'PlantEntityExtractor':
+        """Compile from a canonical catalog (see catalog_merge.py)."""
+        from catalog_merge import SPECIES_ALIASES
+
+        entries = []
+        names_by_key = {}
+        for plant in catalog['plants']:
+            names_by_key[plant['key']] = plant['name']
+            for surface in [plant['name'], plant['key']] + plant.get('aliases', []):
+                entries.append({'text': surface, 'key': plant['key'], 'name': plant['name'], 'kind': 'plant'})
+
+        for alias, key in SPECIES_ALIASES.items():
+            if key in names_by_key:
+                entries.append({'text': alias, 'key': key, 'name': names_by_key[key], 'kind': 'plant'})
+
+        if include_families:
+            from fast_plant_database import PLANT_FAMILIES
+
+            families = set(PLANT_FAMILIES)
+            families.update(plant.get('category', '') for plant in catalog['plants'])
+            for family in sorted(f for f in families if f):
+                entries.append({'text': family, 'key': normalize(family), 'name': family, 'kind': 'family'})
+
+        return cls(entries)
+
+    @classmethod
+    def load_default(cls) -> 'PlantEntityExtractor':
+        """Compile from data/plant_catalog.json, merging sources if it is missing."""
+        path = os.path.join(BASE_DIR, 'data', 'plant_catalog.json')
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+        else:
+            from catalog_merge import build_catalog
+            catalog = build_catalog()
+        return cls.from_catalog(catalog)
+
+    def extract(self, text: str) -> List[Dict[str, Any]]:
+        """Return non-overlapping mentions, leftmost-longest, in text order.
+
+        When a surface form is both a plant and a family (e.g. "Pothos"), the
+        plant reading wins.
+        """
+        normalized, offsets = normalize_with_offsets(text)
+        candidates = []
+        for end, pattern_id in self.automaton.iter_matches(normalized):
+            length = len(self.automaton.patterns[pattern_id])
+            # Strip the padding spaces to get the word span
+            start, stop = end - length + 1, end - 1
+            kind_rank = 0 if self.automaton.payloads[pattern_id]['kind'] == 'plant' else 1
+            candidates.append((start, -(stop - start), kind_rank, pattern_id, stop))
+        candidates.sort()
+
+        mentions = []
+        cursor = 0
+        for start, _, _, pattern_id, stop in candidates:
+            if start < cursor:
+                continue
+            cursor = stop
+            payload = self.automaton.payloads[pattern_id]
+            original_start = offsets[start]
+            original_end = offsets[stop - 1] + 1
+            mentions.append({
+                **payload,
+                'start': original_start,
+                'end': original_end,
+                'text': text[original_start:original_end],
+            })
+        return mentions
+
+    def plant_keys(self, text: str) -> List[str]:
+        """Unique plant keys mentioned in text, in order of first mention."""
+        keys = []
+        for mention in self.extract(text):
+            if mention['kind'] == 'plant' and mention['key'] not in keys:
+                keys.append(mention['key'])
+        return keys
+
+
+def main():
+    """Print the plant mentions found in each argument (or a few samples)."""
+    print("🌱 Smart Plant Tracker - Plant Entity Extractor")
+    print("=" * 50)
+
+    extractor = PlantEntityExtractor.load_default()
+    print(f"📊 Compiled {len(extractor.automaton.patterns)} patterns into "
+          f"{len(extractor.automaton.goto)} automaton states")
+
+    for message in sys.argv[1:] or [
+        "My Ficus Lyrata and ZZ plant both have yellow leaves",
+        "Is a Marble Queen Pothos safe for cats?",
+        "What's the best soil for succulents and cacti?",
+    ]:
+        mentions = extractor.extract(message)
+        found = ', '.join(f"{m['text']}→{m['name']} ({m['kind']})" for m in mentions) or 'none'
+        print(f"🔍 {message}\n   {found}")
+
+if __name__ == "__main__":
+    main()
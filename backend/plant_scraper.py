@@ -16,8 +16,6 @@ Sources:
 Author: Smart Plant Tracker Team
 """
 
-import requests
-from bs4 import BeautifulSoup
 import json
 import time
 import random
@@ -27,12 +25,11 @@ from typing import List, Dict, Any
 import os
 from datetime import datetime
 
+from document_renderer import DocumentRenderer, SCRAPED_DOCUMENT_FIELDS
+
 class PlantCareScraper:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self._session = None
         self.scraped_plants = []
         self.plant_sources = [
             {
@@ -93,6 +90,18 @@ class PlantCareScraper:
             'Saguaro', 'Golden Barrel', 'Moon Cactus', 'Star Cactus'
         ]
 
+    @property
+    def session(self):
+        """HTTP session for live scraping, created on first use."""
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
+        return self._session
+
     def get_plant_care_info(self, plant_name: str) -> Dict[str, Any]:
         """Get comprehensive care information for a specific plant."""
         care_info = {
@@ -310,32 +319,28 @@ class PlantCareScraper:
         
         print(f"💾 Saved {len(self.scraped_plants)} plants to {output_path}")
 
-    def format_for_chroma(self) -> List[Dict[str, Any]]:
-        """Format scraped data for Chroma Cloud database."""
+    def format_for_chroma(self, dedupe: bool = False, links: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Format scraped data for Chroma Cloud database.
+        
+        With `dedupe`, plants sharing a near-identical body (such as the
+        generic fallback) share one document; see near_duplicates.py.
+        """
+        clusters = None
+        indexes = range(len(self.scraped_plants))
+        if dedupe:
+            from near_duplicates import cluster_plants
+            clusters = cluster_plants(self.scraped_plants)
+            indexes = [members[0] for members in clusters]
+        
+        renderer = DocumentRenderer(SCRAPED_DOCUMENT_FIELDS)
         chroma_documents = []
         
-        for plant in self.scraped_plants:
-            # Create comprehensive document text
-            document_parts = [
-                f"Plant: {plant['name']}",
-                f"Watering: {plant['watering']}",
-                f"Light: {plant['light']}",
-                f"Soil: {plant['soil']}",
-                f"Temperature: {plant['temperature']}",
-                f"Humidity: {plant['humidity']}",
-                f"Fertilizer: {plant['fertilizer']}",
-                f"Pruning: {plant['pruning']}",
-                f"Propagation: {plant['propagation']}",
-                f"Common Problems: {plant['common_problems']}",
-                f"Care Tips: {plant['tips']}",
-                f"Difficulty: {plant['difficulty']}",
-                f"Toxicity: {plant['toxicity']}"
-            ]
-            
-            document_text = " | ".join([part for part in document_parts if part.strip()])
+        for i in indexes:
+            plant = self.scraped_plants[i]
+            document_text = renderer.render(plant)
             
             chroma_documents.append({
-                'id': f"plant_{len(chroma_documents) + 1:03d}",
+                'id': f"plant_{i + 1:03d}",
                 'document': document_text,
                 'metadata': {
                     'name': plant['name'],
@@ -347,6 +352,13 @@ class PlantCareScraper:
                 }
             })
         
+        if clusters is not None:
+            from near_duplicates import link_clusters
+            member_links = link_clusters(chroma_documents, clusters, self.scraped_plants,
+                                         lambda i: f"plant_{i + 1:03d}")
+            if links is not None:
+                links.extend(member_links)
+        
         return chroma_documents
 
 def main():
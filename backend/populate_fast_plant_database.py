@@ -12,9 +12,6 @@ Author: Smart Plant Tracker Team
 import json
 import os
 import sys
-from chromadb import CloudClient
-from chromadb.config import Settings
-import openai
 from typing import List, Dict, Any
 from datetime import datetime
 
@@ -35,6 +32,8 @@ def load_fast_plant_data(filename: str = 'chroma_fast_plant_data.json') -> List[
 def connect_to_chroma_cloud():
     """Connect to Chroma Cloud database."""
     try:
+        from chromadb import CloudClient
+
         client = CloudClient(
             api_key=os.getenv("CHROMA_API_KEY", "ck-GWpo9jeE6H2Trwa69Gt77zviEqx7EZTw7s1UpvMcGFGu"),
             tenant=os.getenv("CHROMA_TENANT", "36db7d89-6330-46bf-a396-2836596dbd9a"),
@@ -124,21 +123,22 @@ def test_collection(collection):
         "How do I care for herbs?"
     ]
     
-    for query in test_queries:
+    # One multi-query call instead of a round trip per question
+    from bulk_query import iter_bulk_query
+
+    # A failing query yields its error instead of stopping the rest
+    for _, query, results in iter_bulk_query(collection, test_queries, n_results=3, return_errors=True):
         print(f"\n🔍 Query: '{query}'")
+        if 'error' in results:
+            print(f"❌ Error testing query '{query}': {results['error']}")
+            continue
         try:
-            results = collection.query(
-                query_texts=[query],
-                n_results=3,
-                include=['documents', 'metadatas', 'distances']
-            )
-            
-            print(f"📊 Found {len(results['documents'][0])} results")
+            print(f"📊 Found {len(results['documents'])} results")
             
             for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'][0],
-                results['metadatas'][0],
-                results['distances'][0]
+                results['documents'],
+                results['metadatas'],
+                results['distances']
             )):
                 similarity = 1 - distance
                 print(f"\n{i+1}. Similarity: {similarity:.3f}")
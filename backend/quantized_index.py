@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Quantized Vector Index
+============================================
+
+This module stores document embeddings compactly for the local vector index.
+Vectors are L2-normalized and kept in memory-mapped .npy files:
+
+- vectors.npy  float32 originals, only touched for exact re-ranking
+- sq8.npy      int8 scalar-quantized codes (per-dimension min/step), 4x smaller
+- pq.npy       optional product-quantization codes (uint8, one per subspace)
+
+Searches score every document against the compressed codes with asymmetric
+distance computation (the query stays float, only documents are quantized),
+then re-rank the best candidates exactly from the float32 file. Only the code
+arrays need to be resident, so a million-chunk corpus costs a few hundred MB
+(int8) or tens of MB (PQ) of RAM.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+# Candidates re-ranked exactly per result; PQ codes are coarser and need more
+DEFAULT_RERANK = {'sq8': 4, 'pq': 16}
+BLOCK_ROWS = 65536
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _kmeans(data: np.ndarray, k: int, iterations: int, rng: np.random.Generator) -> np.ndarray:
+    """Plain Lloyd's k-means returning k centroids."""
+    k = min(k, len(data))
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        distances = (
+            (data ** 2).sum(axis=1, keepdims=True)
+            - 2 * data @ centroids.T
+            + (centroids ** 2).sum(axis=1)
+        )
+        assignment = distances.argmin(axis=1)
+        for c in range(k):
+            members = data[assignment == c]
+            if len(members):
+                centroids[c] = members.mean(axis=0)
+            else:
+                centroids[c] = data[rng.integers(len(data))]
+    return centroids
+
+
+class QuantizedVectorIndex:
+    """Memory-mapped int8 / PQ compressed vector index with exact re-ranking."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        with open(os.path.join(path, 'ids.json'), 'r', encoding='utf-8') as f:
+            self.ids: List[str] = json.load(f)
+
+        self.dimension = self.meta['dimension']
+        self.vectors = np.load(os.path.join(path, 'vectors.npy'), mmap_mode='r')
+        self.sq_codes = np.load(os.path.join(path, 'sq8.npy'), mmap_mode='r')
+        self.sq_min = np.asarray(self.meta['sq_min'], dtype=np.float32)
+        self.sq_step = np.asarray(self.meta['sq_step'], dtype=np.float32)
+
+        self.pq_codes = None
+        self.pq_codebook = None
+        if self.meta.get('pq_subspaces'):
+            self.pq_codes = np.load(os.path.join(path, 'pq.npy'), mmap_mode='r')
+            self.pq_codebook = np.load(os.path.join(path, 'pq_codebook.npy'))
+
+    # Building ----------------------------------------------------------
+
+    @classmethod
+    def build(cls, path: str, ids: List[str], vectors: np.ndarray,
+              pq_subspaces: int = 0, pq_train_size: int = 20000, seed: int = 0) -> 'QuantizedVectorIndex':
+        """Write an index for the given vectors and open it.
+
+        `vectors` may itself be a memmap; it is processed in row blocks so the
+        float data never has to be copied into memory in one piece.
+        """
+        count, dimension = vectors.shape
+        if count != len(ids):
+            raise ValueError(f"Got {len(ids)} ids for {count} vectors")
+        if pq_subspaces and dimension % pq_subspaces:
+            raise ValueError(f"Dimension {dimension} is not divisible by {pq_subspaces} PQ subspaces")
+
+        os.makedirs(path, exist_ok=True)
+        stored = np.lib.format.open_memmap(os.path.join(path, 'vectors.npy'), mode='w+',
+                                           dtype=np.float32, shape=(count, dimension))
+        low = np.full(dimension, np.inf, dtype=np.float32)
+        high = np.full(dimension, -np.inf, dtype=np.float32)
+        for start in range(0, count, BLOCK_ROWS):
+            block = _normalize(np.asarray(vectors[start:start + BLOCK_ROWS], dtype=np.float32))
+            stored[start:start + len(block)] = block
+            low = np.minimum(low, block.min(axis=0))
+            high = np.maximum(high, block.max(axis=0))
+        stored.flush()
+
+        step = np.maximum((high - low) / 255.0, 1e-12).astype(np.float32)
+        codes = np.lib.format.open_memmap(os.path.join(path, 'sq8.npy'), mode='w+',
+                                          dtype=np.int8, shape=(count, dimension))
+        for start in range(0, count, BLOCK_ROWS):
+            block = np.asarray(stored[start:start + BLOCK_ROWS])
+            codes[start:start + len(block)] = (np.rint((block - low) / step) - 128).astype(np.int8)
+        codes.flush()
+
+        meta = {
+            'version': 1,
+            'dimension': dimension,
+            'count': count,
+            'metric': 'cosine',
+            'sq_min': low.tolist(),
+            'sq_step': step.tolist(),
+            'pq_subspaces': pq_subspaces,
+        }
+
+        if pq_subspaces:
+            cls._build_pq(path, stored, pq_subspaces, pq_train_size, seed)
+
+        with open(os.path.join(path, 'ids.json'), 'w', encoding='utf-8') as f:
+            json.dump(list(ids), f)
+        with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+        return cls(path)
+
+    @staticmethod
+    def _build_pq(path: str, stored: np.ndarray, subspaces: int, train_size: int, seed: int):
+        count, dimension = stored.shape
+        width = dimension // subspaces
+        rng = np.random.default_rng(seed)
+        sample = np.asarray(stored[np.sort(rng.choice(count, size=min(train_size, count), replace=False))])
+
+        codebook = np.zeros((subspaces, 256, width), dtype=np.float32)
+        for m in range(subspaces):
+            centroids = _kmeans(sample[:, m * width:(m + 1) * width], 256, 12, rng)
+            codebook[m, :len(centroids)] = centroids
+            # Unused slots (tiny corpora) repeat the first centroid
+            codebook[m, len(centroids):] = centroids[0]
+        np.save(os.path.join(path, 'pq_codebook.npy'), codebook)
+
+        codes = np.lib.format.open_memmap(os.path.join(path, 'pq.npy'), mode='w+',
+                                          dtype=np.uint8, shape=(count, subspaces))
+        norms = (codebook ** 2).sum(axis=2)
+        for start in range(0, count, BLOCK_ROWS):
+            block = np.asarray(stored[start:start + BLOCK_ROWS])
+            for m in range(subspaces):
+                part = block[:, m * width:(m + 1) * width]
+                codes[start:start + len(block), m] = (norms[m] - 2 * part @ codebook[m].T).argmin(axis=1)
+        codes.flush()
+
+    @classmethod
+    def from_dataset_json(cls, path: str, dataset_file: str, **kwargs) -> 'QuantizedVectorIndex':
+        """Build from a plantCareDataset.json-style list of {id, embedding} records.
+
+        Records without an embedding are skipped.
+        """
+        with open(dataset_file, 'r', encoding='utf-8') as f:
+            records = [record for record in json.load(f) if record.get('embedding')]
+        ids = [record['id'] for record in records]
+        vectors = np.asarray([record['embedding'] for record in records], dtype=np.float32)
+        return cls.build(path, ids, vectors, **kwargs)
+
+    # Searching ---------------------------------------------------------
+
+    def approximate_scores(self, query: np.ndarray, use_pq: bool = False,
+                           positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Approximate inner products of a normalized query with every document.
+
+        With `positions`, only the codes of those document ordinals are read
+        and scored, in the given order.
+        """
+        count = len(self.ids) if positions is None else len(positions)
+
+        def blocks(codes):
+            for start in range(0, count, BLOCK_ROWS):
+                rows = slice(start, start + BLOCK_ROWS) if positions is None else positions[start:start + BLOCK_ROWS]
+                yield start, np.asarray(codes[rows])
+
+        scores = np.empty(count, dtype=np.float32)
+        if use_pq:
+            if self.pq_codes is None:
+                raise ValueError("Index was built without product quantization")
+            subspaces = self.pq_codebook.shape[0]
+            width = self.dimension // subspaces
+            table = np.einsum('mkw,mw->mk', self.pq_codebook, query.reshape(subspaces, width))
+            for start, block in blocks(self.pq_codes):
+                scores[start:start + len(block)] = table[np.arange(subspaces), block].sum(axis=1)
+            return scores
+
+        # x ≈ min + step * (code + 128)  =>  q·x ≈ (q*step)·code + q·(min + 128*step)
+        weights = query * self.sq_step
+        bias = float(query @ (self.sq_min + 128 * self.sq_step))
+        for start, block in blocks(self.sq_codes):
+            scores[start:start + len(block)] = block.astype(np.float32) @ weights + bias
+        return scores
+
+    def search(self, query: Iterable[float], k: int = 10, rerank: Optional[int] = None,
+               use_pq: bool = False, candidates: Optional[np.ndarray] = None) -> List[Tuple[str, float]]:
+        """Return the top-k (id, cosine similarity) pairs.
+
+        The best `k * rerank` documents by approximate score are re-scored
+        exactly against the float32 vectors (rerank=0 skips re-ranking).
+        `candidates`, if given, restricts the search to those document
+        ordinals (e.g. a metadata_bitmaps filter result); only their codes
+        are scored, so the cost follows the size of the candidate set.
+        """
+        if rerank is None:
+            rerank = DEFAULT_RERANK['pq' if use_pq else 'sq8']
+        query = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        if candidates is not None:
+            candidates = np.asarray(candidates, dtype=np.int64)
+        scores = self.approximate_scores(query, use_pq, candidates)
+        pool_size = min(len(scores), k * max(rerank, 1))
+        if pool_size == 0:
+            return []
+
+        pool = np.argpartition(-scores, pool_size - 1)[:pool_size]
+        if rerank:
+            pool = np.sort(pool)
+        positions = pool if candidates is None else candidates[pool]
+        if rerank:
+            exact = np.asarray(self.vectors[positions]) @ query
+        else:
+            exact = scores[pool]
+        order = np.argsort(-exact)[:k]
+        return [(self.ids[positions[i]], float(exact[i])) for i in order]
+
+    def memory_footprint(self) -> Dict[str, int]:
+        """Bytes of each stored array (codes are what a search keeps resident)."""
+        footprint = {
+            'float32': self.vectors.nbytes,
+            'sq8': self.sq_codes.nbytes,
+        }
+        if self.pq_codes is not None:
+            footprint['pq'] = self.pq_codes.nbytes + self.pq_codebook.nbytes
+        return footprint
+
+
+def _recall_benchmark(count: int, dimension: int, subspaces: int, queries: int, path: str):
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(64, dimension)).astype(np.float32)
+    vectors = centers[rng.integers(64, size=count)] + 0.6 * rng.normal(size=(count, dimension)).astype(np.float32)
+    ids = [f"doc_{i}" for i in range(count)]
+
+    index = QuantizedVectorIndex.build(path, ids, vectors, pq_subspaces=subspaces)
+    exact_vectors = np.asarray(index.vectors)
+    query_vectors = _normalize(vectors[rng.integers(count, size=queries)] + 0.3 * rng.normal(size=(queries, dimension)).astype(np.float32))
+
+    results = {}
+    for label, use_pq in (('sq8', False), ('pq', True)):
+        hits = 0
+        started = time.perf_counter()
+        for query in query_vectors:
+            truth = set(np.argsort(-(exact_vectors @ query))[:10])
+            found = index.search(query, k=10, use_pq=use_pq)
+            hits += len(truth & {int(doc_id[4:]) for doc_id, _ in found})
+        results[label] = (hits / (10 * queries), (time.perf_counter() - started) / queries)
+    return index, results
+
+
+def main():
+    """Build a quantized index, from a dataset file or synthetic vectors."""
+    parser = argparse.ArgumentParser(description='Quantized vector index')
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(__file__), 'vector_index'))
+    parser.add_argument('--dataset', help='plantCareDataset.json-style file to index')
+    parser.add_argument('--pq-subspaces', type=int, default=0)
+    parser.add_argument('--benchmark', type=int, metavar='N', help='benchmark recall on N synthetic vectors')
+    parser.add_argument('--dimension', type=int, default=384)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Quantized Vector Index")
+    print("=" * 50)
+
+    if args.benchmark:
+        subspaces = args.pq_subspaces or args.dimension // 8
+        index, results = _recall_benchmark(args.benchmark, args.dimension, subspaces, 50, args.output)
+        for label, (recall, seconds) in results.items():
+            print(f"📊 {label}: recall@10 {recall:.3f}, {seconds * 1000:.1f} ms/query")
+    else:
+        dataset = args.dataset or os.path.join(os.path.dirname(__file__), 'data', 'plantCareDataset.json')
+        index = QuantizedVectorIndex.from_dataset_json(args.output, dataset, pq_subspaces=args.pq_subspaces)
+        print(f"✅ Indexed {len(index.ids)} vectors of dimension {index.dimension}")
+
+    for name, size in index.memory_footprint().items():
+        print(f"💾 {name}: {size / 1024 / 1024:.2f} MB")
+
+if __name__ == "__main__":
+    main()
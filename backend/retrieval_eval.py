@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Retrieval Evaluation Harness
+==================================================
+
+This script measures retrieval quality and latency for anything that exposes
+the collection `query` interface (a Chroma collection, LocalCollection, or a
+partitioned/batched wrapper). It runs a labeled query set
+(data/retrieval_eval_queries.json) and reports recall@k, MRR and
+p50/p95/p99 query latency as a JSON report, so changes to chunking, IDs or
+indexing can be compared run against run.
+
+A result is relevant when its metadata matches the query's label:
+`expected_plant` (metadata name), `expected_category` (metadata category)
+or `expected_difficulty` (any of the listed difficulty values). When the
+collection's metadata carries a `field` (chunked documents), it must also
+match `expected_field`.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+BASE_DIR = os.path.dirname(__file__)
+DEFAULT_QUERIES = os.path.join(BASE_DIR, 'data', 'retrieval_eval_queries.json')
+K_VALUES = (1, 3, 5, 10)
+
+
+def _norm(value: Any) -> str:
+    return ' '.join(str(value or '').lower().replace("'", '').split())
+
+
+def is_relevant(label: Dict[str, Any], metadata: Dict[str, Any]) -> bool:
+    """Whether a retrieved document's metadata satisfies a query label."""
+    if 'expected_plant' in label and _norm(metadata.get('name')) != _norm(label['expected_plant']):
+        return False
+    if 'expected_category' in label and _norm(metadata.get('category')) != _norm(label['expected_category']):
+        return False
+    if 'expected_difficulty' in label and metadata.get('difficulty') not in label['expected_difficulty']:
+        return False
+    if 'field' in metadata and label.get('expected_field') and metadata['field'] != label['expected_field']:
+        return False
+    return True
+
+
+def is_labeled(label: Dict[str, Any]) -> bool:
+    return any(key in label for key in ('expected_plant', 'expected_category', 'expected_difficulty'))
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def evaluate(collection, queries: List[Dict[str, Any]], k: int = 10, repeats: int = 1,
+             where: Optional[Dict[str, Any]] = None, label: str = '') -> Dict[str, Any]:
+    """Run every query against the collection and compute quality and latency metrics."""
+    k_values = [value for value in K_VALUES if value <= k]
+    hits = {value: 0 for value in k_values}
+    reciprocal_ranks = []
+    latencies = []
+    per_query = []
+
+    for query in queries:
+        kwargs = {'query_texts': [query['question']], 'n_results': k,
+                  'include': ['metadatas', 'distances']}
+        if where:
+            kwargs['where'] = where
+
+        for _ in range(repeats):
+            started = time.perf_counter()
+            results = collection.query(**kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        metadatas = results['metadatas'][0]
+        first_rank = None
+        if is_labeled(query):
+            for rank, metadata in enumerate(metadatas, 1):
+                if is_relevant(query, metadata):
+                    first_rank = rank
+                    break
+            for value in k_values:
+                if first_rank is not None and first_rank <= value:
+                    hits[value] += 1
+            reciprocal_ranks.append(1.0 / first_rank if first_rank else 0.0)
+
+        per_query.append({
+            'id': query.get('id'),
+            'question': query['question'],
+            'first_relevant_rank': first_rank,
+            'top': [metadata.get('name') for metadata in metadatas[:3]],
+        })
+
+    labeled = len(reciprocal_ranks)
+    ordered = sorted(latencies)
+    return {
+        'label': label,
+        'created_at': datetime.now().isoformat(),
+        'k': k,
+        'queries': len(queries),
+        'labeled_queries': labeled,
+        'collection_size': collection.count() if hasattr(collection, 'count') else None,
+        'recall': {f"@{value}": hits[value] / labeled if labeled else 0.0 for value in k_values},
+        'mrr': sum(reciprocal_ranks) / labeled if labeled else 0.0,
+        'latency_ms': {
+            'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+            'p50': percentile(ordered, 0.50),
+            'p95': percentile(ordered, 0.95),
+            'p99': percentile(ordered, 0.99),
+            'max': ordered[-1] if ordered else 0.0,
+        },
+        'per_query': per_query,
+    }
+
+
+def load_documents(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Chroma-format documents from a file, or the fast database's export."""
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    from local_collection import load_default_documents
+    return load_default_documents()
+
+
+def load_queries(path: str = DEFAULT_QUERIES) -> List[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_reports(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> List[str]:
+    """Human-readable metric deltas between two reports."""
+    lines = []
+    for key in baseline['recall']:
+        if key in candidate['recall']:
+            before, after = baseline['recall'][key], candidate['recall'][key]
+            lines.append(f"recall{key}: {before:.3f} → {after:.3f} ({after - before:+.3f})")
+    lines.append(f"mrr: {baseline['mrr']:.3f} → {candidate['mrr']:.3f} ({candidate['mrr'] - baseline['mrr']:+.3f})")
+    for key in ('p50', 'p95', 'p99'):
+        before, after = baseline['latency_ms'][key], candidate['latency_ms'][key]
+        lines.append(f"{key}: {before:.2f} ms → {after:.2f} ms ({after - before:+.2f})")
+    return lines
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"📊 {report['labeled_queries']}/{report['queries']} labeled queries, "
+          f"{report['collection_size']} documents")
+    print("   " + ", ".join(f"recall{key} {value:.3f}" for key, value in report['recall'].items()))
+    print(f"   MRR {report['mrr']:.3f}")
+    latency = report['latency_ms']
+    print(f"⏱️ p50 {latency['p50']:.2f} ms, p95 {latency['p95']:.2f} ms, p99 {latency['p99']:.2f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Evaluate a retrieval backend and write a JSON report."""
+    parser = argparse.ArgumentParser(description='Retrieval quality and latency evaluation')
+    parser.add_argument('--backend', choices=['local', 'chroma'], default='local')
+    parser.add_argument('--documents', help='Chroma-format JSON to index locally '
+                                            '(default: chroma_fast_plant_data.json)')
+    parser.add_argument('--collection', default='fast_plant_care', help='Chroma collection name')
+    parser.add_argument('--partitioned', action='store_true',
+                        help='route queries across category partitions (local backend)')
+    parser.add_argument('--queries', default=DEFAULT_QUERIES)
+    parser.add_argument('-k', type=int, default=10)
+    parser.add_argument('--repeats', type=int, default=3, help='timed runs per query')
+    parser.add_argument('--output', help='where to write the JSON report')
+    parser.add_argument('--compare', help='baseline report to diff against')
+    args = parser.parse_args(argv)
+
+    print("🌱 Smart Plant Tracker - Retrieval Evaluation")
+    print("=" * 50)
+
+    if args.backend == 'chroma':
+        from populate_fast_plant_database import connect_to_chroma_cloud
+        client = connect_to_chroma_cloud()
+        if not client:
+            return 1
+        collection = client.get_collection(name=args.collection)
+    elif args.partitioned:
+        from partitioned_collection import PartitionedCollection
+        collection = PartitionedCollection.from_documents(load_documents(args.documents))
+    else:
+        from local_collection import LocalCollection, load_default_collection
+        collection = (LocalCollection.from_json_file(args.documents) if args.documents
+                      else load_default_collection())
+
+    report = evaluate(collection, load_queries(args.queries), k=args.k, repeats=args.repeats,
+                      label=f"{args.backend}-partitioned" if args.partitioned else args.backend)
+    print_report(report)
+
+    output = args.output or os.path.join(
+        BASE_DIR, f"retrieval_report_{args.backend}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Report saved to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print("📈 Compared with baseline:")
+        for line in compare_reports(baseline, report):
+            print(f"   {line}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Streaming Sensor Alert Evaluator
+======================================================
+
+`getSensorAlerts` (utils/simulateSensors.js) checks one reading against
+fixed thresholds, so a value hovering around a threshold flaps between alert
+and no alert. This module evaluates continuous feeds from many plants
+instead:
+
+- every plant keeps a sliding window of recent readings per sensor in a
+  fixed-size ring buffer with a running sum, and rules test the window mean
+- thresholds are per species: temperature and humidity ranges come from the
+  care catalog text, moisture and light from the sensor ranges the simulator
+  uses, with getSensorAlerts' fixed thresholds as the fallback
+- a breach must persist for `duration` seconds before an alert is raised,
+  and it clears only once the mean is back inside the range by the
+  hysteresis margin
+- only state transitions (raised / cleared) are emitted
+
+`AlertStream` is an asyncio front-end: producers `await stream.ingest(...)`,
+one consumer task drains the queue in batches and fans alerts out to
+subscribers.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+SENSORS = ('moisture', 'light', 'temperature', 'humidity')
+
+INF = float('inf')
+
+# getSensorAlerts' fixed thresholds: sensor -> (low, high)
+DEFAULT_THRESHOLDS = {
+    'moisture': (20.0, 90.0),
+    'light': (200.0, INF),
+    'temperature': (60.0, 90.0),
+    'humidity': (-INF, INF),
+}
+
+# PLANT_SENSOR_RANGES from utils/simulateSensors.js: species -> sensor -> (min, max)
+SPECIES_SENSOR_RANGES = {
+    'snake plant': {'moisture': (20, 40), 'light': (200, 800), 'temperature': (65, 85), 'humidity': (30, 50)},
+    'fiddle leaf fig': {'moisture': (40, 70), 'light': (400, 1000), 'temperature': (65, 75), 'humidity': (50, 70)},
+    'monstera deliciosa': {'moisture': (50, 80), 'light': (300, 900), 'temperature': (68, 86), 'humidity': (60, 80)},
+    'pothos': {'moisture': (30, 60), 'light': (200, 700), 'temperature': (60, 85), 'humidity': (40, 60)},
+    'succulent': {'moisture': (10, 30), 'light': (500, 1000), 'temperature': (60, 90), 'humidity': (20, 40)},
+}
+
+# Slack outside a species' ideal range before it counts as a breach
+RANGE_TOLERANCE = {'moisture': 5.0, 'light': 100.0, 'temperature': 5.0, 'humidity': 10.0}
+
+ALERT_MESSAGES = {
+    ('moisture', 'low'): ('warning', '🌱 Low moisture detected - consider watering'),
+    ('moisture', 'high'): ('warning', '💧 High moisture detected - check for overwatering'),
+    ('light', 'low'): ('info', '☀️ Low light levels - consider moving to brighter location'),
+    ('light', 'high'): ('info', '☀️ Very bright light - watch for leaf scorch'),
+    ('temperature', 'low'): ('warning', '❄️ Low temperature - plant may be too cold'),
+    ('temperature', 'high'): ('warning', '🔥 High temperature - plant may be too hot'),
+    ('humidity', 'low'): ('info', '🌵 Low humidity - consider misting or a humidity tray'),
+    ('humidity', 'high'): ('info', '🌫️ High humidity - improve air circulation'),
+}
+
+
+class ThresholdBook:
+    """Resolve a species name to flat (low, high) thresholds for every sensor."""
+
+    def __init__(self, catalog_ranges: Optional[Dict[str, Dict[str, Tuple[float, float]]]] = None):
+        self.catalog_ranges = catalog_ranges or {}
+        self._cache: Dict[str, Tuple[float, ...]] = {}
+
+    @classmethod
+    def from_catalog(cls, plants: List[Dict[str, Any]]) -> 'ThresholdBook':
+        """Take temperature (°F) and humidity ranges from catalog care text."""
+        from catalog_merge import normalize_name
+        from catalog_sqlite import care_ranges
+
+        ranges = {}
+        for plant in plants:
+            key = plant.get('key') or normalize_name(plant['name'])
+            if key in ranges:
+                continue
+            sensor_ranges = {}
+            for attribute, low, high, _ in care_ranges(plant):
+                if attribute == 'temperature_f':
+                    sensor_ranges['temperature'] = (low, high)
+                elif attribute == 'humidity_pct':
+                    sensor_ranges['humidity'] = (low, high)
+            ranges[key] = sensor_ranges
+        return cls(ranges)
+
+    @classmethod
+    def load_default(cls) -> 'ThresholdBook':
+        from fast_plant_database import FastPlantDatabase
+        return cls.from_catalog(FastPlantDatabase().plant_database)
+
+    def thresholds(self, species: Optional[str]) -> Tuple[float, ...]:
+        """(low, high) pairs flattened in SENSORS order."""
+        from catalog_merge import normalize_name
+
+        key = normalize_name(species or '')
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        limits = dict(DEFAULT_THRESHOLDS)
+        for source in (self.catalog_ranges.get(key, {}), SPECIES_SENSOR_RANGES.get(key, {})):
+            for sensor, (low, high) in source.items():
+                tolerance = RANGE_TOLERANCE[sensor]
+                limits[sensor] = (low - tolerance, high + tolerance)
+
+        flat = tuple(value for sensor in SENSORS for value in limits[sensor])
+        self._cache[key] = flat
+        return flat
+
+
+class AlertEvaluator:
+    """Windowed, debounced threshold evaluation over many plants.
+
+    Per plant state lives in flat lists indexed by a slot number so the hot
+    path in `ingest_values` is plain list arithmetic.
+    """
+
+    def __init__(self, thresholds: Optional[ThresholdBook] = None, window: int = 6,
+                 duration: float = 60.0, hysteresis: float = 0.05):
+        self.book = thresholds or ThresholdBook()
+        self.window = window
+        self.duration = duration
+        self.hysteresis = hysteresis
+
+        self.slots: Dict[Any, int] = {}
+        self.plant_ids: List[Any] = []
+        self.limits: List[Tuple[float, ...]] = []
+        self.margins: List[Tuple[float, ...]] = []
+        # Ring buffer: window * len(SENSORS) values per plant, plus write position and fill count
+        self.buffers: List[List[float]] = []
+        self.positions: List[int] = []
+        self.counts: List[int] = []
+        self.sums: List[List[float]] = []
+        # Per sensor: active alert (-1 low, 0 none, 1 high), pending breach direction and start time
+        self.states: List[List[int]] = []
+        self.pending: List[List[int]] = []
+        self.since: List[List[float]] = []
+        # Sensors that have reported at least once (missing ones are not evaluated)
+        self.reported: List[List[bool]] = []
+        self.stats = {'readings': 0, 'raised': 0, 'cleared': 0, 'rejected': 0}
+
+    def register(self, plant_id: Any, species: Optional[str] = None) -> int:
+        slot = self.slots.get(plant_id)
+        if slot is not None:
+            self.set_species(plant_id, species)
+            return slot
+
+        slot = len(self.plant_ids)
+        self.slots[plant_id] = slot
+        self.plant_ids.append(plant_id)
+        self.limits.append(())
+        self.margins.append(())
+        self.buffers.append([0.0] * (self.window * len(SENSORS)))
+        self.positions.append(0)
+        self.counts.append(0)
+        self.sums.append([0.0] * len(SENSORS))
+        self.states.append([0] * len(SENSORS))
+        self.pending.append([0] * len(SENSORS))
+        self.since.append([0.0] * len(SENSORS))
+        self.reported.append([False] * len(SENSORS))
+        self.set_species(plant_id, species)
+        return slot
+
+    def set_species(self, plant_id: Any, species: Optional[str]):
+        slot = self.slots[plant_id]
+        limits = self.book.thresholds(species)
+        margins = []
+        for i in range(len(SENSORS)):
+            low, high = limits[2 * i], limits[2 * i + 1]
+            span = high - low if low != -INF and high != INF else abs(low if low != -INF else high)
+            margins.append(span * self.hysteresis if span != INF else 0.0)
+        self.limits[slot] = limits
+        self.margins[slot] = tuple(margins)
+
+    def ingest(self, plant_id: Any, timestamp: float, reading: Dict[str, float]) -> List[Dict[str, Any]]:
+        """Evaluate a reading dict ({moisture, light, temperature, humidity})."""
+        return self.ingest_values(plant_id, timestamp, *(reading.get(s) for s in SENSORS))
+
+    def ingest_values(self, plant_id: Any, timestamp: float, *values: Optional[float]) -> List[Dict[str, Any]]:
+        """Evaluate one reading given as values in SENSORS order (None = not reported)."""
+        slot = self.slots.get(plant_id)
+        if slot is None:
+            slot = self.register(plant_id)
+        self.stats['readings'] += 1
+
+        width = len(SENSORS)
+        buffer = self.buffers[slot]
+        sums = self.sums[slot]
+        base = self.positions[slot] * width
+        count = self.counts[slot]
+        full = count == self.window
+        if not full:
+            count += 1
+            self.counts[slot] = count
+        self.positions[slot] = (self.positions[slot] + 1) % self.window
+
+        limits = self.limits[slot]
+        states = self.states[slot]
+        reported = self.reported[slot]
+        events = None
+        for i in range(width):
+            value = values[i]
+            old = buffer[base + i]
+            if value is None:
+                if not reported[i]:
+                    continue
+                # Carry the window forward with its current mean
+                value = sums[i] / (count if full else count - 1)
+            elif not reported[i]:
+                # First value for this sensor: backfill the slots it missed
+                reported[i] = True
+                for j in range(i, len(buffer), width):
+                    buffer[j] = value
+                sums[i] = value * (count - 1 if not full else count)
+                old = value
+            buffer[base + i] = value
+            sums[i] += value - old if full else value
+            mean = sums[i] / count
+
+            low = limits[2 * i]
+            high = limits[2 * i + 1]
+            state = states[i]
+            if state == 0 and low <= mean <= high:
+                self.pending[slot][i] = 0
+                continue
+
+            event = self._step(slot, i, mean, low, high, timestamp)
+            if event is not None:
+                if events is None:
+                    events = []
+                events.append(event)
+        return events or []
+
+    def _step(self, slot: int, i: int, mean: float, low: float, high: float,
+              timestamp: float) -> Optional[Dict[str, Any]]:
+        states, pending, since = self.states[slot], self.pending[slot], self.since[slot]
+        state = states[i]
+
+        if state != 0:
+            margin = self.margins[slot][i]
+            if low + margin <= mean <= high - margin or (state == -1 and mean > high) or \
+                    (state == 1 and mean < low):
+                states[i] = 0
+                pending[i] = 0
+                return self._event(slot, i, state, 'cleared', mean, low, high, timestamp)
+            return None
+
+        direction = -1 if mean < low else 1
+        if pending[i] != direction:
+            pending[i] = direction
+            since[i] = timestamp
+        if timestamp - since[i] >= self.duration:
+            states[i] = direction
+            pending[i] = 0
+            return self._event(slot, i, direction, 'raised', mean, low, high, timestamp)
+        return None
+
+    def _event(self, slot: int, i: int, direction: int, status: str, mean: float,
+               low: float, high: float, timestamp: float) -> Dict[str, Any]:
+        sensor = SENSORS[i]
+        level = 'low' if direction == -1 else 'high'
+        alert_type, message = ALERT_MESSAGES[(sensor, level)]
+        self.stats[status] += 1
+        return {
+            'plant_id': self.plant_ids[slot],
+            'status': status,
+            'type': alert_type,
+            'message': message,
+            'sensor': sensor,
+            'level': level,
+            'value': round(mean, 2),
+            'threshold': low if direction == -1 else high,
+            'timestamp': timestamp,
+        }
+
+    def active_alerts(self, plant_id: Any) -> List[Dict[str, Any]]:
+        """Alerts currently raised for a plant."""
+        slot = self.slots.get(plant_id)
+        if slot is None:
+            return []
+        alerts = []
+        for i, state in enumerate(self.states[slot]):
+            if state:
+                mean = self.sums[slot][i] / max(self.counts[slot], 1)
+                low, high = self.limits[slot][2 * i], self.limits[slot][2 * i + 1]
+                alerts.append(self._event(slot, i, state, 'active', mean, low, high, time.time()))
+        return alerts
+
+
+def parse_reading(line: bytes) -> Optional[Tuple[Any, float, Dict[str, float], Optional[str]]]:
+    """(plant_id, timestamp, reading, species) from one JSON line, or None if it is malformed."""
+    try:
+        message = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(message, dict):
+        return None
+    plant_id = message.get('plant_id')
+    if isinstance(plant_id, bool) or not isinstance(plant_id, (str, int)):
+        return None
+    timestamp = message.get('timestamp', time.time())
+    if isinstance(timestamp, bool) or not isinstance(timestamp, (int, float)):
+        return None
+    reading = {}
+    for sensor in SENSORS:
+        value = message.get(sensor)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        reading[sensor] = value
+    species = message.get('species')
+    return plant_id, timestamp, reading, species if isinstance(species, str) else None
+
+
+class AlertStream:
+    """asyncio ingest front-end around an AlertEvaluator."""
+
+    def __init__(self, evaluator: AlertEvaluator, max_queue: int = 100000, batch_size: int = 1024):
+        self.evaluator = evaluator
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.subscribers: List[Callable[[Dict[str, Any]], Any]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], Any]):
+        """Call `callback(alert)` for every raised/cleared alert (may be a coroutine function)."""
+        self.subscribers.append(callback)
+
+    async def ingest(self, plant_id: Any, timestamp: float, reading: Dict[str, float]):
+        await self.queue.put((plant_id, timestamp, reading))
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._consume())
+
+    async def stop(self):
+        """Process everything queued so far, then stop the consumer.
+
+        If the consumer has died (e.g. a subscriber raised), its exception is
+        re-raised instead of waiting for a queue nobody drains.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        join = asyncio.ensure_future(self.queue.join())
+        await asyncio.wait({join, task}, return_when=asyncio.FIRST_COMPLETED)
+        if task.done():
+            join.cancel()
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _consume(self):
+        evaluator = self.evaluator
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            alerts = []
+            for plant_id, timestamp, reading in batch:
+                alerts.extend(evaluator.ingest(plant_id, timestamp, reading))
+            for alert in alerts:
+                for callback in self.subscribers:
+                    result = callback(alert)
+                    if asyncio.iscoroutine(result):
+                        await result
+            for _ in batch:
+                self.queue.task_done()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765):
+        """Accept JSON lines {plant_id, timestamp, moisture, light, ...} over TCP."""
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            async for line in reader:
+                parsed = parse_reading(line)
+                if parsed is None:
+                    # Skip malformed lines rather than dropping the connection
+                    self.evaluator.stats['rejected'] += 1
+                    continue
+                plant_id, timestamp, reading, species = parsed
+                if plant_id not in self.evaluator.slots and species:
+                    self.evaluator.register(plant_id, species)
+                await self.ingest(plant_id, timestamp, reading)
+            writer.close()
+
+        self.start()
+        server = await asyncio.start_server(handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def _benchmark(plants: int, readings_per_plant: int, species: List[str]) -> Tuple[float, Dict[str, int]]:
+    evaluator = AlertEvaluator(ThresholdBook.load_default(), window=6, duration=30.0)
+    rng = random.Random(42)
+    for p in range(plants):
+        evaluator.register(p, species[p % len(species)])
+
+    # Pre-generate readings so only evaluation is timed; every tenth plant drifts dry
+    feed = []
+    for step in range(readings_per_plant):
+        for p in range(plants):
+            moisture = 45 + rng.uniform(-8, 8) - (step * 2 if p % 10 == 0 else 0)
+            feed.append((p, step * 10.0, moisture, 500 + rng.uniform(-50, 50),
+                         72 + rng.uniform(-2, 2), 50 + rng.uniform(-5, 5)))
+
+    ingest = evaluator.ingest_values
+    started = time.perf_counter()
+    for plant_id, timestamp, moisture, light, temperature, humidity in feed:
+        ingest(plant_id, timestamp, moisture, light, temperature, humidity)
+    elapsed = time.perf_counter() - started
+    return len(feed) / elapsed, evaluator.stats
+
+
+def main():
+    """Benchmark the evaluator on a simulated fleet."""
+    parser = argparse.ArgumentParser(description='Streaming sensor alert evaluator')
+    parser.add_argument('--plants', type=int, default=10000)
+    parser.add_argument('--readings', type=int, default=30, help='readings per plant')
+    parser.add_argument('--serve', action='store_true', help='accept JSON-line readings over TCP')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Sensor Alert Evaluator")
+    print("=" * 50)
+
+    if args.serve:
+        stream = AlertStream(AlertEvaluator(ThresholdBook.load_default()))
+        stream.subscribe(lambda alert: print(f"🚨 {alert['plant_id']}: {alert['status']} {alert['message']}"))
+        print(f"📡 Listening for readings on port {args.port}")
+        asyncio.run(stream.serve(port=args.port))
+        return
+
+    rate, stats = _benchmark(args.plants, args.readings,
+                             ['Snake Plant', 'Pothos', 'Fiddle Leaf Fig', 'Echeveria', 'Boston Fern'])
+    print(f"📊 {stats['readings']} readings from {args.plants} plants")
+    print(f"⚡ {rate:,.0f} readings/s on one core")
+    print(f"🚨 {stats['raised']} alerts raised, {stats['cleared']} cleared")
+
+if __name__ == "__main__":
+    main()
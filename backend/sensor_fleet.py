@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Sensor Fleet Simulator
+============================================
+
+utils/simulateSensors.js drifts a single sensor state per call. This module
+simulates a whole fleet at once: the state of N devices is a NumPy array
+and every `step()` applies the same drift model as `driftValue` to all of
+them together (pull toward a jittered optimum, plus noise, clipped to the
+species range).
+
+- Species ranges come from the simulator's PLANT_SENSOR_RANGES plus
+  temperature/humidity ranges parsed from the care catalog.
+- Randomness is counter-based (a hash of seed, device, species and step), so
+  a device produces the same readings no matter how large the fleet is.
+- Scenarios from getSimulatedSensorDataForCondition ('needs_water', 'cold',
+  ...) can be injected into a fraction of the fleet for a number of steps.
+
+Readings can be written as JSON lines or replayed at a target rate into the
+alert evaluator (in process or over its TCP listener) or into the backend's
+health endpoint.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import zlib
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+import numpy as np
+
+from sensor_alerts import SENSORS, SPECIES_SENSOR_RANGES
+
+# Drift rates per sensor, as in updateSensorState
+DRIFT_RATES = np.array([0.1, 0.15, 0.05, 0.1])
+
+# Ranges used when nothing is known about a species ('snake plant' in the JS simulator)
+DEFAULT_RANGES = SPECIES_SENSOR_RANGES['snake plant']
+
+# getSimulatedSensorDataForCondition readings in SENSORS order
+CONDITIONS = {
+    'healthy': (60, 600, 72, 55),
+    'needs_water': (15, 500, 70, 45),
+    'overwatered': (90, 400, 68, 80),
+    'too_much_light': (40, 1200, 85, 30),
+    'too_little_light': (50, 100, 65, 60),
+    'cold': (45, 500, 55, 70),
+    'hot': (35, 800, 95, 20),
+}
+
+# Replay ports: sensor_alerts.py --serve listener and the Node backend
+DEFAULT_PORTS = {'tcp': 8765, 'http': 5001}
+
+_MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Vectorized SplitMix64 finalizer over uint64 arrays."""
+    with np.errstate(over='ignore'):
+        x = (x + np.uint64(0x9E3779B97F4A7C15)) & _MASK64
+        x = ((x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)) & _MASK64
+        x = ((x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)) & _MASK64
+        return x ^ (x >> np.uint64(31))
+
+
+def species_ranges(species: str, catalog_ranges: Dict[str, Dict[str, Tuple[float, float]]]) -> np.ndarray:
+    """(min, max, optimal) per sensor, shape (len(SENSORS), 3)."""
+    from catalog_merge import normalize_name
+
+    key = normalize_name(species)
+    merged = dict(DEFAULT_RANGES)
+    merged.update(catalog_ranges.get(key, {}))
+    merged.update(SPECIES_SENSOR_RANGES.get(key, {}))
+    return np.array([(low, high, (low + high) / 2) for low, high in (merged[s] for s in SENSORS)],
+                    dtype=np.float64)
+
+
+class SensorFleet:
+    """N simulated devices advanced together."""
+
+    def __init__(self, species: List[str], seed: int = 42, catalog_ranges=None):
+        if catalog_ranges is None:
+            from sensor_alerts import ThresholdBook
+            catalog_ranges = ThresholdBook.load_default().catalog_ranges
+
+        self.seed = seed
+        self.size = len(species)
+        self.species = list(species)
+        self.step_index = 0
+
+        names = sorted(set(species))
+        table = np.stack([species_ranges(name, catalog_ranges) for name in names])
+        species_index = np.array([names.index(name) for name in species])
+        self.low = table[species_index, :, 0]
+        self.high = table[species_index, :, 1]
+        self.optimal = table[species_index, :, 2]
+
+        # Per device key mixing the seed, device number and species
+        species_hash = np.array([zlib.crc32(name.encode('utf-8')) for name in species], dtype=np.uint64)
+        devices = np.arange(self.size, dtype=np.uint64)
+        self._keys = _splitmix64(_splitmix64(devices ^ np.uint64(seed)) ^ species_hash)
+
+        self.state = self.optimal + (self._uniform(0) - 0.5) * (self.high - self.low) * 0.2
+        # Active scenarios: device mask, condition values, last step (exclusive)
+        self.scenarios: List[Tuple[np.ndarray, np.ndarray, int]] = []
+
+    def _uniform(self, stream: int) -> np.ndarray:
+        """Uniform [0, 1) draws, shape (devices, sensors), for this step and stream."""
+        counter = np.uint64(self.step_index * 8 + stream)
+        lanes = np.arange(len(SENSORS), dtype=np.uint64)
+        bits = _splitmix64(self._keys[:, None] ^ _splitmix64(counter * np.uint64(16) + lanes)[None, :])
+        return (bits >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    def inject(self, condition: str, fraction: float = 0.1, steps: int = 30,
+               devices: Optional[np.ndarray] = None):
+        """Hold a condition's readings on some devices for `steps` steps."""
+        if devices is None:
+            pick = _splitmix64(self._keys ^ np.uint64(zlib.crc32(condition.encode('utf-8')) + self.step_index))
+            mask = (pick >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53)) < fraction
+        else:
+            mask = np.zeros(self.size, dtype=bool)
+            mask[devices] = True
+        values = np.array(CONDITIONS[condition], dtype=np.float64)
+        self.scenarios.append((mask, values, self.step_index + steps))
+        return mask
+
+    def step(self) -> np.ndarray:
+        """Advance every device one tick and return readings, shape (devices, sensors)."""
+        self.step_index += 1
+        jitter, noise = self._uniform(0), self._uniform(1)
+
+        target = self.optimal + (jitter - 0.5) * (self.high - self.low) * 0.2
+        drift = (target - self.state) * DRIFT_RATES
+        self.state = np.clip(self.state + drift + (noise - 0.5) * 2, self.low, self.high)
+
+        readings = self.state.copy()
+        self.scenarios = [s for s in self.scenarios if s[2] > self.step_index]
+        for mask, values, _ in self.scenarios:
+            readings[mask] = values + (noise[mask] - 0.5) * 2
+        return readings
+
+    def iter_readings(self, steps: int, interval: float = 10.0, start: float = 0.0
+                      ) -> Iterator[Tuple[float, np.ndarray]]:
+        for _ in range(steps):
+            readings = self.step()
+            yield start + self.step_index * interval, readings
+
+
+def write_jsonl(fleet: SensorFleet, path: str, steps: int, interval: float = 10.0) -> int:
+    """Write every reading as {plant_id, species, timestamp, moisture, ...} lines."""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for timestamp, readings in fleet.iter_readings(steps, interval):
+            rounded = np.round(readings, 1).tolist()
+            for device, values in enumerate(rounded):
+                record = {'plant_id': f"device_{device}", 'species': fleet.species[device],
+                          'timestamp': timestamp}
+                record.update(zip(SENSORS, values))
+                f.write(json.dumps(record) + '\n')
+                count += 1
+    return count
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def health_payload(reading: Dict[str, Any]) -> Dict[str, float]:
+    """Map a reading onto the /api/plant-health/calculate request body."""
+    return {
+        'soil_temp': round((reading['temperature'] - 32) * 5 / 9, 1),
+        'air_humidity': reading['humidity'],
+        'soil_moisture': reading['moisture'],
+        'light_lux': reading['light'],
+    }
+
+
+async def replay(readings: Iterator[Dict[str, Any]], target: str, rate: float,
+                 host: str = '127.0.0.1', port: Optional[int] = None, concurrency: int = 32) -> Dict[str, Any]:
+    """Send readings at `rate` per second (open loop) to a target.
+
+    Targets: 'alerts' (in-process AlertEvaluator), 'tcp' (sensor_alerts.py
+    --serve JSON-line listener) or 'http' (backend health endpoint). `port`
+    defaults to the target's own (DEFAULT_PORTS). HTTP replies outside 2xx
+    count as `http_errors`, requests that raised as `failed`.
+    """
+    port = port or DEFAULT_PORTS.get(target)
+    sent = 0
+    lag = 0.0
+    alerts = 0
+    http_errors = 0
+    failed = 0
+    started = time.perf_counter()
+
+    writer = None
+    evaluator = None
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = set()
+    if target == 'tcp':
+        _, writer = await asyncio.open_connection(host, port)
+    elif target == 'alerts':
+        from sensor_alerts import AlertEvaluator, ThresholdBook
+        evaluator = AlertEvaluator(ThresholdBook.load_default())
+
+    async def post(reading):
+        nonlocal http_errors, failed
+        body = json.dumps(health_payload(reading))
+        try:
+            status = await asyncio.to_thread(_post_json, host, port, '/api/plant-health/calculate', body)
+            if not 200 <= status < 300:
+                http_errors += 1
+        except Exception:
+            failed += 1
+        finally:
+            semaphore.release()
+
+    for reading in readings:
+        if rate:
+            delay = started + sent / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                lag = max(lag, -delay)
+
+        if target == 'alerts':
+            if evaluator.slots.get(reading['plant_id']) is None:
+                evaluator.register(reading['plant_id'], reading.get('species'))
+            alerts += len(evaluator.ingest(reading['plant_id'], reading['timestamp'], reading))
+        elif target == 'tcp':
+            writer.write((json.dumps(reading) + '\n').encode('utf-8'))
+            if sent % 1000 == 0:
+                await writer.drain()
+        else:
+            await semaphore.acquire()
+            task = asyncio.ensure_future(post(reading))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        sent += 1
+
+    if pending:
+        await asyncio.gather(*pending)
+    if writer is not None:
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    elapsed = time.perf_counter() - started
+    return {'sent': sent, 'elapsed': elapsed, 'rate': sent / elapsed if elapsed else 0.0,
+            'max_lag_ms': lag * 1000, 'alerts': alerts, 'http_errors': http_errors, 'failed': failed}
+
+
+def _post_json(host: str, port: int, path: str, body: str) -> int:
+    import http.client
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    try:
+        connection.request('POST', path, body, {'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def main():
+    """Simulate a fleet to a JSON-lines file, or replay one at a target rate."""
+    parser = argparse.ArgumentParser(description='Sensor fleet simulator and replay tool')
+    parser.add_argument('--devices', type=int, default=10000)
+    parser.add_argument('--steps', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--interval', type=float, default=10.0, help='seconds between readings')
+    parser.add_argument('--scenario', action='append', default=[],
+                        help='condition[:fraction[:steps]], e.g. needs_water:0.05:5')
+    parser.add_argument('--output', help='write readings to this JSON-lines file')
+    parser.add_argument('--replay', help='replay a JSON-lines file instead of simulating')
+    parser.add_argument('--target', choices=['alerts', 'tcp', 'http'], default='alerts')
+    parser.add_argument('--rate', type=float, default=0, help='readings per second (0 = as fast as possible)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help='default: 8765 for tcp (sensor_alerts.py --serve), 5001 for http')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Sensor Fleet Simulator")
+    print("=" * 50)
+
+    if args.replay:
+        stats = asyncio.run(replay(iter_jsonl(args.replay), args.target, args.rate, args.host, args.port))
+        print(f"📡 Replayed {stats['sent']} readings to {args.target} at {stats['rate']:,.0f}/s "
+              f"(max lag {stats['max_lag_ms']:.1f} ms)")
+        if args.target == 'alerts':
+            print(f"🚨 {stats['alerts']} alert transitions")
+        if stats['http_errors'] or stats['failed']:
+            print(f"❌ {stats['http_errors']} non-2xx responses, {stats['failed']} failed requests")
+        return
+
+    species_pool = sorted(SPECIES_SENSOR_RANGES) + ['Boston Fern', 'Echeveria', 'Basil', 'Phalaenopsis']
+    species = [species_pool[i % len(species_pool)] for i in range(args.devices)]
+    started = time.perf_counter()
+    fleet = SensorFleet(species, seed=args.seed)
+    for spec in args.scenario:
+        condition, _, rest = spec.partition(':')
+        fraction, _, steps = rest.partition(':')
+        mask = fleet.inject(condition, float(fraction or 0.1), int(steps or args.steps))
+        print(f"🧪 {condition}: {int(mask.sum())} devices")
+
+    if args.output:
+        count = write_jsonl(fleet, args.output, args.steps, args.interval)
+        print(f"💾 {count} readings written to {args.output} in {time.perf_counter() - started:.2f} s")
+        return
+
+    for _ in range(args.steps):
+        fleet.step()
+    elapsed = time.perf_counter() - started
+    print(f"⚡ {args.devices * args.steps:,} readings in {elapsed * 1000:.0f} ms "
+          f"({args.devices * args.steps / elapsed:,.0f}/s)")
+
+if __name__ == "__main__":
+    main()
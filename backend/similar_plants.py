@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Similar Plants Graph
+==========================================
+
+"Something like a Pothos but pet-safe" used to mean a live vector query
+plus post-filtering. This module precomputes, at catalog build time, the k
+nearest neighbours of every plant so such lookups become array reads.
+
+Each plant is described by two blocks, each L2-normalized and weighted:
+
+- care attributes: temperature and humidity ranges, watering and
+  fertilizing intervals (parsed as in catalog_sqlite.py), light class,
+  difficulty, toxicity and category
+- a text embedding of its rendered care document (embedding_service.py
+  backends; the local hashing model by default)
+
+Neighbours come from blocked matrix products (exact) or, for large
+catalogs, from an inverted-file approximation: plants are clustered with
+k-means and each cluster is only compared against its nearest clusters.
+
+The graph is stored as compact arrays next to the catalog:
+
+    similar_plants/meta.json       counts, k, method, categories
+    similar_plants/plants.json     [{key, name, category}] in row order
+    similar_plants/neighbors.npy   int32 (N, k) neighbour rows, best first
+    similar_plants/scores.npy      float16 (N, k) cosine similarities
+    similar_plants/pet_safe.npy    bool (species-specific toxicity only), difficulty.npy int8,
+                                   category.npy int16
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_GRAPH_DIR = os.path.join(BASE_DIR, 'similar_plants')
+
+DEFAULT_K = 32
+# Exact search up to this many plants, inverted-file approximation above
+EXACT_LIMIT = 20000
+# Similarity matrix cells computed per block (float32), about 64 MB
+BLOCK_CELLS = 1 << 24
+
+ATTRIBUTE_WEIGHT = 0.6
+CATEGORY_WEIGHT = 0.5
+
+DIFFICULTY_LEVELS = ['very easy', 'easy', 'easy to moderate', 'moderate', 'moderate to hard', 'hard']
+
+# (phrase, toxicity level) checked in order as whole words, so "toxicity" in
+# "Check toxicity before ..." stays unknown; level 0 means pet-safe
+TOXICITY_LEVELS = [
+    ('highly toxic', 1.0),
+    ('non-toxic', 0.0),
+    ('safe for pets', 0.0),
+    ('mildly toxic', 0.6),
+    ('toxic', 0.8),
+]
+_TOXICITY_PATTERNS = [(re.compile(rf'\b{re.escape(phrase)}\b'), level) for phrase, level in TOXICITY_LEVELS]
+UNKNOWN_TOXICITY = 0.5
+
+
+def light_features(text: str) -> List[float]:
+    """[low light, indirect light, direct sun] tolerance from the light text."""
+    lowered = (text or '').lower()
+    low = 1.0 if 'low' in lowered else 0.0
+    indirect = 1.0 if 'indirect' in lowered else 0.0
+    if 'avoid direct' in lowered:
+        direct = 0.0
+    elif 'direct' in lowered and ('tolerate' in lowered or 'morning' in lowered):
+        direct = 0.5
+    elif 'direct' in lowered or 'full sun' in lowered or 'plenty of sunlight' in lowered:
+        direct = 1.0
+    else:
+        direct = 0.0
+    return [low, indirect, direct]
+
+
+def difficulty_level(text: str) -> int:
+    lowered = (text or '').strip().lower()
+    return DIFFICULTY_LEVELS.index(lowered) if lowered in DIFFICULTY_LEVELS else 2
+
+
+def toxicity_level(text: str) -> float:
+    lowered = (text or '').lower()
+    for pattern, level in _TOXICITY_PATTERNS:
+        if pattern.search(lowered):
+            return level
+    return UNKNOWN_TOXICITY
+
+
+def plant_toxicity(plant: Dict[str, Any]) -> float:
+    """Toxicity level of a record; category template text says nothing about the species."""
+    from catalog_merge import is_template_field
+
+    if is_template_field(plant, 'toxicity'):
+        return UNKNOWN_TOXICITY
+    return toxicity_level(plant.get('toxicity'))
+
+
+def attribute_matrix(plants: List[Dict[str, Any]], categories: List[str]) -> np.ndarray:
+    """Care-attribute vectors, one row per plant, before normalization."""
+    from catalog_sqlite import care_ranges
+
+    numeric = np.full((len(plants), 6), np.nan, dtype=np.float32)
+    other = np.zeros((len(plants), 5 + len(categories)), dtype=np.float32)
+    category_index = {name: i for i, name in enumerate(categories)}
+    for row, plant in enumerate(plants):
+        ranges = {attribute: (low, high) for attribute, low, high, _ in care_ranges(plant)}
+        if 'temperature_f' in ranges:
+            numeric[row, 0:2] = np.array(ranges['temperature_f']) / 100.0
+        if 'humidity_pct' in ranges:
+            numeric[row, 2:4] = np.array(ranges['humidity_pct']) / 100.0
+        if 'watering_days' in ranges:
+            numeric[row, 4] = math.log1p(ranges['watering_days'][0]) / math.log1p(60)
+        if 'fertilizing_days' in ranges:
+            numeric[row, 5] = math.log1p(ranges['fertilizing_days'][0]) / math.log1p(120)
+        other[row, 0:3] = light_features(plant.get('light'))
+        other[row, 3] = difficulty_level(plant.get('difficulty')) / (len(DIFFICULTY_LEVELS) - 1)
+        other[row, 4] = plant_toxicity(plant)
+        other[row, 5 + category_index[plant.get('category', '')]] = CATEGORY_WEIGHT
+
+    # Plants without a parsable range take the catalog average for it
+    means = np.nanmean(np.where(np.isnan(numeric).all(axis=0), 0.0, numeric), axis=0)
+    numeric = np.where(np.isnan(numeric), means, numeric)
+    return np.hstack([numeric, other])
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def combined_vectors(plants: List[Dict[str, Any]], categories: List[str], embedding_backend=None,
+                     attribute_weight: float = ATTRIBUTE_WEIGHT) -> np.ndarray:
+    """Weighted, unit-length [attributes | text embedding] rows."""
+    from document_renderer import DocumentRenderer
+    from embedding_service import HashingEmbeddingBackend, embed_documents
+
+    backend = embedding_backend or HashingEmbeddingBackend()
+    renderer = DocumentRenderer()
+    texts = [renderer.render(plant) for plant in plants]
+    text_block = _normalize(np.asarray(embed_documents(backend, texts, batch_size=256), dtype=np.float32))
+    attribute_block = _normalize(attribute_matrix(plants, categories))
+    return np.hstack([attribute_block * math.sqrt(attribute_weight),
+                      text_block * math.sqrt(1.0 - attribute_weight)]).astype(np.float32)
+
+
+def _top_k(scores: np.ndarray, k: int):
+    """Indices and values of the k best scores per row, best first."""
+    k = min(k, scores.shape[1])
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    values = np.take_along_axis(scores, part, axis=1)
+    order = np.argsort(-values, axis=1)
+    return np.take_along_axis(part, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+
+def exact_neighbors(vectors: np.ndarray, k: int):
+    """k nearest neighbours of every row by blocked matrix products."""
+    count = len(vectors)
+    k = min(k, count - 1)
+    neighbors = np.empty((count, k), dtype=np.int32)
+    scores = np.empty((count, k), dtype=np.float32)
+    block = max(1, BLOCK_CELLS // max(count, 1))
+    for start in range(0, count, block):
+        stop = min(count, start + block)
+        similarity = vectors[start:stop] @ vectors.T
+        similarity[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        neighbors[start:stop], scores[start:stop] = _top_k(similarity, k)
+    return neighbors, scores
+
+
+def ivf_neighbors(vectors: np.ndarray, k: int, lists: Optional[int] = None, probes: int = 8,
+                  seed: int = 0):
+    """Approximate k-NN: each k-means cell is compared only with its `probes` nearest cells."""
+    from quantized_index import _kmeans
+
+    count = len(vectors)
+    k = min(k, count - 1)
+    lists = lists or max(1, int(math.sqrt(count)))
+    rng = np.random.default_rng(seed)
+    sample = vectors[rng.choice(count, size=min(count, lists * 64), replace=False)]
+    centroids = _normalize(_kmeans(sample, lists, 10, rng).astype(np.float32))
+
+    assignment = np.empty(count, dtype=np.int64)
+    block = max(1, BLOCK_CELLS // len(centroids))
+    for start in range(0, count, block):
+        assignment[start:start + block] = (vectors[start:start + block] @ centroids.T).argmax(axis=1)
+    members = [np.flatnonzero(assignment == cell) for cell in range(len(centroids))]
+    nearest_cells = np.argsort(-(centroids @ centroids.T), axis=1)
+
+    neighbors = np.empty((count, k), dtype=np.int32)
+    scores = np.empty((count, k), dtype=np.float32)
+    for cell, rows in enumerate(members):
+        if not len(rows):
+            continue
+        # Widen the probe until there are enough candidates besides the row itself
+        probe = probes
+        while True:
+            candidates = np.concatenate([members[c] for c in nearest_cells[cell, :probe]])
+            if len(candidates) > k or probe >= len(centroids):
+                break
+            probe *= 2
+        similarity = vectors[rows] @ vectors[candidates].T
+        similarity[rows[:, None] == candidates[None, :]] = -np.inf
+        top, values = _top_k(similarity, k)
+        neighbors[rows] = candidates[top]
+        scores[rows] = values
+    return neighbors, scores
+
+
+def build_similarity_graph(plants: List[Dict[str, Any]], path: str = DEFAULT_GRAPH_DIR,
+                           k: int = DEFAULT_K, method: str = 'auto', embedding_backend=None,
+                           attribute_weight: float = ATTRIBUTE_WEIGHT) -> Dict[str, Any]:
+    """Compute and store the k-NN graph for a catalog; returns its meta."""
+    from catalog_release import record_keys
+
+    if method == 'auto':
+        method = 'exact' if len(plants) <= EXACT_LIMIT else 'ivf'
+    categories = sorted({plant.get('category', '') for plant in plants})
+    vectors = combined_vectors(plants, categories, embedding_backend, attribute_weight)
+    neighbors, scores = (exact_neighbors if method == 'exact' else ivf_neighbors)(vectors, k)
+
+    os.makedirs(path, exist_ok=True)
+    category_index = {name: i for i, name in enumerate(categories)}
+    arrays = {
+        'neighbors': neighbors,
+        'scores': scores.astype(np.float16),
+        # Only species-specific records can vouch for pet safety
+        'pet_safe': np.array([plant_toxicity(p) == 0.0 for p in plants], dtype=bool),
+        'difficulty': np.array([difficulty_level(p.get('difficulty')) for p in plants], dtype=np.int8),
+        'category': np.array([category_index[p.get('category', '')] for p in plants], dtype=np.int16),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(path, f'{name}.npy'), array)
+
+    keys = record_keys(plants)
+    with open(os.path.join(path, 'plants.json'), 'w', encoding='utf-8') as f:
+        json.dump([{'key': key, 'name': plant['name'], 'category': plant.get('category', '')}
+                   for key, plant in zip(keys, plants)], f, ensure_ascii=False)
+    meta = {
+        'version': 1,
+        'count': len(plants),
+        'k': int(neighbors.shape[1]),
+        'method': method,
+        'attribute_weight': attribute_weight,
+        'categories': categories,
+        'created_at': datetime.now().isoformat(),
+    }
+    with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
+    return meta
+
+
+class SimilarPlants:
+    """Read-only lookups over a stored similar-plants graph."""
+
+    def __init__(self, path: str = DEFAULT_GRAPH_DIR):
+        from catalog_merge import normalize_name
+
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        with open(os.path.join(path, 'plants.json'), 'r', encoding='utf-8') as f:
+            self.plants: List[Dict[str, str]] = json.load(f)
+        self.neighbors = np.load(os.path.join(path, 'neighbors.npy'), mmap_mode='r')
+        self.scores = np.load(os.path.join(path, 'scores.npy'), mmap_mode='r')
+        self.pet_safe = np.load(os.path.join(path, 'pet_safe.npy'))
+        self.difficulty = np.load(os.path.join(path, 'difficulty.npy'))
+        self.category = np.load(os.path.join(path, 'category.npy'))
+        self.categories: List[str] = self.meta['categories']
+
+        self._normalize = normalize_name
+        self.rows: Dict[str, int] = {}
+        for row, plant in enumerate(self.plants):
+            self.rows.setdefault(plant['key'], row)
+            self.rows.setdefault(normalize_name(plant['name']), row)
+
+    def row_for(self, name: str) -> Optional[int]:
+        """Row of a plant by catalog key or (normalized) name; first match wins."""
+        row = self.rows.get(name)
+        return row if row is not None else self.rows.get(self._normalize(name))
+
+    def _results(self, row: int, positions: np.ndarray) -> List[Dict[str, Any]]:
+        results = []
+        for position in positions:
+            neighbor = int(self.neighbors[row, position])
+            results.append({**self.plants[neighbor], 'score': round(float(self.scores[row, position]), 4),
+                            'pet_safe': bool(self.pet_safe[neighbor]),
+                            'difficulty': DIFFICULTY_LEVELS[self.difficulty[neighbor]]})
+        return results
+
+    def similar(self, name: str, k: int = 10) -> List[Dict[str, Any]]:
+        """The k most similar plants, best first (empty for unknown names)."""
+        row = self.row_for(name)
+        if row is None:
+            return []
+        return self._results(row, np.arange(min(k, self.neighbors.shape[1])))
+
+    def alternatives(self, name: str, k: int = 5, pet_safe: Optional[bool] = None,
+                     max_difficulty: Optional[str] = None, category: Optional[str] = None,
+                     other_category: bool = False) -> List[Dict[str, Any]]:
+        """Similar plants that pass the filters, e.g. alternatives('Pothos', pet_safe=True).
+
+        Filters are applied to the stored neighbour row only, so at most the
+        graph's k candidates are considered.
+        """
+        row = self.row_for(name)
+        if row is None:
+            return []
+        candidates = np.asarray(self.neighbors[row])
+        keep = np.ones(len(candidates), dtype=bool)
+        if pet_safe is not None:
+            keep &= self.pet_safe[candidates] == pet_safe
+        if max_difficulty is not None:
+            keep &= self.difficulty[candidates] <= difficulty_level(max_difficulty)
+        if category is not None:
+            keep &= self.category[candidates] == self.categories.index(category) \
+                if category in self.categories else False
+        if other_category:
+            keep &= self.category[candidates] != self.category[row]
+        return self._results(row, np.flatnonzero(keep)[:k])
+
+
+def recall_at_k(approximate: np.ndarray, exact: np.ndarray) -> float:
+    """Share of the exact neighbours that the approximate graph found."""
+    hits = sum(len(np.intersect1d(a, e)) for a, e in zip(approximate, exact))
+    return hits / exact.size
+
+
+def main():
+    """Build the similar-plants graph for the fast database, or query a built one."""
+    parser = argparse.ArgumentParser(description='Similar plants k-NN graph')
+    parser.add_argument('plant', nargs='?', help='show alternatives for this plant instead of building')
+    parser.add_argument('--path', default=DEFAULT_GRAPH_DIR)
+    parser.add_argument('-k', type=int, default=DEFAULT_K, help='neighbours stored per plant')
+    parser.add_argument('--method', choices=['auto', 'exact', 'ivf'], default='auto')
+    parser.add_argument('--pet-safe', action='store_true', help='only pet-safe alternatives')
+    parser.add_argument('--max-difficulty', help="e.g. 'Easy'")
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='build over N synthetic records and report IVF recall against exact')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Similar Plants Graph")
+    print("=" * 50)
+
+    if args.plant:
+        graph = SimilarPlants(args.path)
+        results = graph.alternatives(args.plant, k=10, pet_safe=True if args.pet_safe else None,
+                                     max_difficulty=args.max_difficulty)
+        if graph.row_for(args.plant) is None:
+            print(f"❌ Unknown plant: {args.plant}")
+            return
+        print(f"🔎 Plants like {args.plant}:")
+        for result in results:
+            print(f"   {result['score']:.3f}  {result['name']} ({result['category']}, "
+                  f"{result['difficulty']}{', pet-safe' if result['pet_safe'] else ''})")
+        if not results:
+            print("   (no neighbour passes the filters)")
+        return
+
+    if args.synthetic:
+        from synthetic_catalog import iter_records
+
+        plants = list(iter_records(42, 0, args.synthetic))
+        categories = sorted({plant['category'] for plant in plants})
+        vectors = combined_vectors(plants, categories)
+        started = time.perf_counter()
+        exact, _ = exact_neighbors(vectors, args.k)
+        exact_time = time.perf_counter() - started
+        started = time.perf_counter()
+        approximate, _ = ivf_neighbors(vectors, args.k)
+        ivf_time = time.perf_counter() - started
+        print(f"📊 {len(plants)} plants, k={args.k}")
+        print(f"   exact: {exact_time:.2f} s")
+        print(f"   ivf:   {ivf_time:.2f} s, recall {recall_at_k(approximate, exact):.3f}")
+        return
+
+    from fast_plant_database import FastPlantDatabase
+
+    plants = FastPlantDatabase().plant_database
+    started = time.perf_counter()
+    meta = build_similarity_graph(plants, args.path, k=args.k, method=args.method)
+    print(f"✅ {meta['count']} plants, {meta['k']} neighbours each ({meta['method']}) "
+          f"in {time.perf_counter() - started:.2f} s")
+    print(f"💾 Saved to {args.path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Stub AI and Chroma Services
+=================================================
+
+This module provides local stand-ins for the two remote dependencies of the
+backend, so it can be load tested on one machine without API keys or cost:
+
+- an OpenAI-compatible server (`/v1/chat/completions` for chat and vision
+  requests, `/v1/embeddings`), answered in the shapes that
+  utils/aiAssistant.js and utils/imageAnalysis.js parse
+- a Chroma-compatible server (heartbeat, tenant/database/collection lookups
+  and `query`), answered with documents from the local plant catalog
+
+Each endpoint sleeps for a latency drawn from a log-normal distribution
+(median and spread per endpoint, see LATENCY_PROFILES), and can fail a
+fraction of calls with 429/500 to rehearse throttling.
+
+Point the backend at it with:
+
+    OPENAI_BASE_URL=http://127.0.0.1:8090/v1 CHROMA_URL=http://127.0.0.1:8091 npm start
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
+
+from load_test import read_http_message
+
+# (median seconds, log-normal sigma) per endpoint, roughly what the hosted
+# services show for the request sizes the backend sends
+LATENCY_PROFILES = {
+    'chat': (1.4, 0.45),
+    'vision': (3.2, 0.5),
+    'embeddings': (0.15, 0.3),
+    'chroma_query': (0.09, 0.35),
+    'chroma_meta': (0.03, 0.3),
+}
+
+STATUS_TEXT = {200: 'OK', 404: 'Not Found', 429: 'Too Many Requests', 500: 'Internal Server Error'}
+
+EMBEDDING_DIM = 384
+
+VISION_ANSWER = {
+    'species': 'Monstera deliciosa',
+    'healthScore': 0.82,
+    'growthStage': 'mature',
+    'issues': [{'type': 'watering', 'severity': 'low',
+                'description': 'Slight drooping on older leaves'}],
+    'recommendations': [{'type': 'watering', 'priority': 'medium',
+                         'message': 'Water when the top 2 inches of soil are dry',
+                         'action': 'Check soil moisture every 3 days'}],
+    'confidence': 0.85,
+    'analysisNotes': 'Stub analysis from stub_services.py',
+}
+
+
+class LatencyModel:
+    """Log-normal service times with an optional injected error rate."""
+
+    def __init__(self, scale: float = 1.0, error_rate: float = 0.0, seed: int = 42,
+                 profiles: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.scale = scale
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.profiles = profiles or LATENCY_PROFILES
+
+    def sample(self, kind: str) -> float:
+        median, sigma = self.profiles[kind]
+        return self.scale * median * math.exp(sigma * self.rng.gauss(0.0, 1.0))
+
+    def failure(self) -> Optional[int]:
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return self.rng.choice([429, 500])
+        return None
+
+
+class StubServer:
+    """Minimal keep-alive HTTP/1.1 server; subclasses implement `route`."""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.requests = 0
+
+    async def route(self, method: str, path: str, body: Any) -> Tuple[int, Any, str]:
+        """Return (status, JSON payload, latency profile)."""
+        raise NotImplementedError
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    start_line, headers, raw = await read_http_message(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                method, target = start_line.split()[:2]
+                path = target.split('?', 1)[0]
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = None
+
+                self.requests += 1
+                status, payload, kind = await self.route(method, path, body)
+                await asyncio.sleep(self.latency.sample(kind))
+                failure = self.latency.failure() if status == 200 else None
+                if failure:
+                    status, payload = failure, {'error': {'message': 'Injected stub failure'}}
+
+                data = json.dumps(payload).encode('utf-8')
+                writer.write((f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "OK")}\r\n'
+                              f'Content-Type: application/json\r\n'
+                              f'Content-Length: {len(data)}\r\n\r\n').encode('latin-1') + data)
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        finally:
+            writer.close()
+
+
+class OpenAIStub(StubServer):
+    """Chat completions (text or vision) and embeddings."""
+
+    async def route(self, method, path, body):
+        body = body or {}
+        if path.endswith('/chat/completions'):
+            messages = body.get('messages', [])
+            vision = any(isinstance(message.get('content'), list) and
+                         any(part.get('type') == 'image_url' for part in message['content'])
+                         for message in messages)
+            if vision:
+                content = json.dumps(VISION_ANSWER)
+            else:
+                question = messages[-1].get('content', '') if messages else ''
+                content = (f"Here is some care advice for your question: {question[:120]}\n"
+                           "1. Water when the top inch of soil is dry.\n"
+                           "2. Give it bright, indirect light.\n"
+                           "3. Feed monthly during the growing season.")
+            return 200, {
+                'id': f'chatcmpl-{uuid.uuid4().hex[:24]}',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': body.get('model', 'gpt-3.5-turbo'),
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': content}}],
+                'usage': {'prompt_tokens': 200, 'completion_tokens': 120, 'total_tokens': 320},
+            }, 'vision' if vision else 'chat'
+
+        if path.endswith('/embeddings'):
+            texts = body.get('input', [])
+            texts = [texts] if isinstance(texts, str) else texts
+            return 200, {
+                'object': 'list',
+                'model': body.get('model', 'text-embedding-3-small'),
+                'data': [{'object': 'embedding', 'index': i, 'embedding': pseudo_embedding(text)}
+                         for i, text in enumerate(texts)],
+                'usage': {'prompt_tokens': 10 * len(texts), 'total_tokens': 10 * len(texts)},
+            }, 'embeddings'
+
+        return 404, {'error': {'message': f'Unknown path {path}'}}, 'chroma_meta'
+
+
+class ChromaStub(StubServer):
+    """Enough of the Chroma v1/v2 HTTP API for the backend's collection lookups and queries."""
+
+    def __init__(self, latency: LatencyModel, documents: List[Dict[str, Any]]):
+        super().__init__(latency)
+        self.documents = documents
+        self.collections: Dict[str, Dict[str, Any]] = {}
+
+    def collection(self, name: str, tenant: str = 'default_tenant',
+                   database: str = 'default_database') -> Dict[str, Any]:
+        if name not in self.collections:
+            self.collections[name] = {
+                'id': str(uuid.uuid5(uuid.NAMESPACE_URL, name)), 'name': name,
+                'metadata': None, 'configuration_json': {}, 'dimension': EMBEDDING_DIM,
+                'tenant': tenant, 'database': database, 'log_position': 0, 'version': 0,
+            }
+        return self.collections[name]
+
+    def query(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        count = len(body.get('query_texts') or body.get('query_embeddings') or [None])
+        n_results = min(int(body.get('n_results', 10)), len(self.documents))
+        result = {'ids': [], 'documents': [], 'metadatas': [], 'distances': [],
+                  'embeddings': None, 'uris': None, 'data': None,
+                  'include': ['documents', 'metadatas', 'distances']}
+        for _ in range(count):
+            picks = self.latency.rng.sample(self.documents, n_results)
+            distances = sorted(self.latency.rng.uniform(0.2, 1.2) for _ in picks)
+            result['ids'].append([doc['id'] for doc in picks])
+            result['documents'].append([doc['document'] for doc in picks])
+            result['metadatas'].append([doc['metadata'] for doc in picks])
+            result['distances'].append(distances)
+        return result
+
+    async def route(self, method, path, body):
+        parts = [part for part in path.split('/') if part]
+        if parts[-1] in ('heartbeat', 'healthcheck'):
+            return 200, {'nanosecond heartbeat': time.time_ns()}, 'chroma_meta'
+        if parts[-1] == 'version':
+            return 200, '1.0.0', 'chroma_meta'
+        if parts[-1] == 'identity':
+            return 200, {'user_id': 'stub', 'tenant': 'default_tenant',
+                         'databases': ['default_database']}, 'chroma_meta'
+
+        tenant = parts[parts.index('tenants') + 1] if 'tenants' in parts[:-1] else 'default_tenant'
+        database = (parts[parts.index('databases') + 1] if 'databases' in parts[:-1]
+                    else 'default_database')
+        if 'collections' in parts:
+            rest = parts[parts.index('collections') + 1:]
+            if not rest:
+                if method == 'POST':
+                    return 200, self.collection((body or {}).get('name', 'default'),
+                                                tenant, database), 'chroma_meta'
+                return 200, list(self.collections.values()), 'chroma_meta'
+            if len(rest) == 1:
+                by_id = {item['id']: item for item in self.collections.values()}
+                return 200, by_id.get(rest[0]) or self.collection(rest[0], tenant, database), 'chroma_meta'
+            action = rest[1]
+            if action == 'query':
+                return 200, self.query(body or {}), 'chroma_query'
+            if action == 'count':
+                return 200, len(self.documents), 'chroma_meta'
+            if action == 'get':
+                docs = self.documents[:int((body or {}).get('limit') or 10)]
+                return 200, {'ids': [doc['id'] for doc in docs],
+                             'documents': [doc['document'] for doc in docs],
+                             'metadatas': [doc['metadata'] for doc in docs],
+                             'embeddings': None, 'uris': None, 'data': None,
+                             'include': ['documents', 'metadatas']}, 'chroma_meta'
+            return 200, True, 'chroma_meta'
+        if 'databases' in parts:
+            return 200, {'id': str(uuid.uuid5(uuid.NAMESPACE_URL, database)), 'name': database,
+                         'tenant': tenant}, 'chroma_meta'
+        if 'tenants' in parts:
+            return 200, {'name': tenant}, 'chroma_meta'
+        return 404, {'error': f'Unknown path {path}'}, 'chroma_meta'
+
+
+def pseudo_embedding(text: str) -> List[float]:
+    """Deterministic unit vector for a text, so repeated inputs embed the same."""
+    rng = random.Random(hashlib.sha1(text.encode('utf-8')).digest())
+    vector = [rng.gauss(0.0, 1.0) for _ in range(EMBEDDING_DIM)]
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+def stub_documents() -> List[Dict[str, Any]]:
+    """Documents from the local catalog, or a few canned ones if it is missing."""
+    try:
+        from local_collection import load_default_documents
+        documents = load_default_documents()
+        if documents:
+            return documents
+    except (OSError, ValueError, ImportError):
+        pass
+    return [{'id': f'stub_{i}', 'document': f'{name}: water when the topsoil is dry.',
+             'metadata': {'plant_name': name, 'type': 'care_overview'}}
+            for i, name in enumerate(['Monstera', 'Snake Plant', 'Pothos', 'Peace Lily'])]
+
+
+async def serve(host: str = '127.0.0.1', openai_port: int = 8090, chroma_port: int = 8091,
+                latency: Optional[LatencyModel] = None):
+    """Run both stubs until cancelled."""
+    latency = latency or LatencyModel()
+    openai_stub = OpenAIStub(latency)
+    chroma_stub = ChromaStub(latency, stub_documents())
+    servers = [await asyncio.start_server(openai_stub.handle, host, openai_port),
+               await asyncio.start_server(chroma_stub.handle, host, chroma_port)]
+    print(f"🤖 OpenAI stub on http://{host}:{openai_port}/v1")
+    print(f"🗄️ Chroma stub on http://{host}:{chroma_port} ({len(chroma_stub.documents)} documents)")
+    print(f"   OPENAI_BASE_URL=http://{host}:{openai_port}/v1 CHROMA_URL=http://{host}:{chroma_port}")
+    try:
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+    finally:
+        for server in servers:
+            server.close()
+        print(f"📊 Served {openai_stub.requests} OpenAI and {chroma_stub.requests} Chroma requests")
+
+
+def main():
+    """Start the OpenAI and Chroma stand-ins."""
+    parser = argparse.ArgumentParser(description='Local OpenAI and Chroma stand-ins for load tests')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--openai-port', type=int, default=8090)
+    parser.add_argument('--chroma-port', type=int, default=8091)
+    parser.add_argument('--latency-scale', type=float, default=1.0,
+                        help='multiply every latency median (0 = no delay)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of calls failing with 429/500')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Stub AI and Chroma Services")
+    print("=" * 55)
+
+    latency = LatencyModel(args.latency_scale, args.error_rate, args.seed)
+    try:
+        asyncio.run(serve(args.host, args.openai_port, args.chroma_port, latency))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Synthetic Large Catalog Generator
+=======================================================
+
+This script generates large, realistic plant care catalogs for scale testing.
+Records are built by crossing PLANT_FAMILIES species with cultivar, leaf,
+growth form and selection names (about 33 million distinct names) and the
+matching CARE_TEMPLATES entry, then applying small seeded perturbations
+(temperature and humidity ranges, watering cadence, difficulty, toxicity) so
+documents are similar to real catalog entries without being identical.
+
+Output is deterministic for a given (seed, count, shard size): record i always
+lands in shard i // shard_size and is generated from an RNG seeded by
+(seed, shard), so the number of worker processes does not change the result.
+Shards are streamed to JSON Lines files in the same record format as
+fast_plant_care_data.json, plus an `id` field. Shard files left over from an
+earlier, larger run in the same directory are removed.
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Tuple
+
+from fast_plant_database import PLANT_FAMILIES, CARE_TEMPLATES
+
+DEFAULT_SHARD_SIZE = 100000
+
+CULTIVARS = [
+    'Variegata', 'Aurea', 'Compacta', 'Nana', 'Albo', 'Marginata', 'Tricolor',
+    'Pendula', 'Crispa', 'Rubra', 'Argentea', 'Grandiflora', 'Minima', 'Gigantea',
+    'Silver Queen', 'Emerald Gem', 'Red Star', 'Green Wave', 'Golden Glow',
+    'Moonlight', 'Snow White', 'Black Velvet', 'Pink Lady', 'Royal Blue',
+    'Dwarf Form', 'Tiger Stripe', 'Sunset', 'Frosty', 'Midnight', 'Velvet Touch',
+    'Lemon Lime', 'Starlight', 'Copper Penny', 'Blushing Bride', 'Jade Pearl',
+    'Painted Lady', 'Ruby Ribbon', 'Ivory Tower', 'Cherry Bomb', 'Autumn Blaze',
+]
+
+LEAF_TYPES = [
+    'Broadleaf', 'Narrowleaf', 'Ruffled', 'Lobed', 'Glossy', 'Matte', 'Serrated',
+    'Velvet-leaf', 'Split-leaf', 'Round-leaf',
+]
+
+GROWTH_FORMS = [
+    'Compact', 'Trailing', 'Upright', 'Bushy', 'Climbing', 'Spreading', 'Columnar',
+    'Mounding', 'Weeping', 'Rosette', 'Clumping', 'Branching', 'Creeping', 'Tall',
+    'Miniature', 'Cascading',
+]
+
+SELECTIONS = [
+    'Classic', 'Select', 'Heritage', 'Prime', 'Wild Type', 'Nursery Strain',
+    'Highland', 'Lowland', 'Coastal', 'Alpine', 'Rainforest', 'Savanna',
+]
+
+DIFFICULTY_LEVELS = ['Very Easy', 'Easy', 'Easy to Moderate', 'Moderate', 'Moderate to Hard', 'Hard']
+
+TOXICITY_CHOICES = [
+    ('Non-toxic to pets', 0.30),
+    ('Generally safe for pets', 0.20),
+    ('Mildly toxic to pets', 0.20),
+    ('Toxic to pets if ingested', 0.25),
+    ('Highly toxic to pets and humans', 0.05),
+]
+
+WATERING_CADENCES = ['every 5-7 days', 'every 1-2 weeks', 'every 2-3 weeks', 'every 3-4 weeks']
+
+
+def _species_pool() -> List[Tuple[str, str]]:
+    """Unique (species, family) pairs in a stable order."""
+    seen = set()
+    pool = []
+    for family, species_list in PLANT_FAMILIES.items():
+        for species in species_list:
+            if species not in seen:
+                seen.add(species)
+                pool.append((species, family))
+    return pool
+
+SPECIES_POOL = _species_pool()
+BASE_COMBINATIONS = (len(SPECIES_POOL) * len(CULTIVARS) * len(LEAF_TYPES)
+                     * len(GROWTH_FORMS) * len(SELECTIONS))
+
+
+def record_name(index: int) -> str:
+    """Deterministic unique name for record index (mixed-radix decomposition)."""
+    # Species is the lowest digit: generate_record takes the family from index % len(SPECIES_POOL)
+    rest, species_index = divmod(index, len(SPECIES_POOL))
+    rest, cultivar_index = divmod(rest, len(CULTIVARS))
+    rest, leaf_index = divmod(rest, len(LEAF_TYPES))
+    rest, form_index = divmod(rest, len(GROWTH_FORMS))
+    series, selection_index = divmod(rest, len(SELECTIONS))
+    name = (f"{SPECIES_POOL[species_index][0]} '{CULTIVARS[cultivar_index]}' "
+            f"{LEAF_TYPES[leaf_index]} {GROWTH_FORMS[form_index]} {SELECTIONS[selection_index]}")
+    if series:
+        name += f" No. {series + 1}"
+    return name
+
+
+def _shift_temperature(text: str, rng: random.Random) -> str:
+    match = re.match(r'(\d+)-(\d+)°F', text)
+    if not match:
+        return text
+    shift = rng.randint(-4, 4)
+    spread = rng.randint(-2, 3)
+    low = int(match.group(1)) + shift
+    high = max(low + 5, int(match.group(2)) + shift + spread)
+    low_c = round((low - 32) * 5 / 9)
+    high_c = round((high - 32) * 5 / 9)
+    rest = text[match.end():]
+    rest = re.sub(r'^\s*\(\d+-\d+°C\)', '', rest)
+    return f"{low}-{high}°F ({low_c}-{high_c}°C){rest}"
+
+
+def _shift_humidity(text: str, rng: random.Random) -> str:
+    match = re.search(r'(\d+)-(\d+)%', text)
+    if match:
+        shift = rng.randint(-10, 10)
+        low = min(90, max(20, int(match.group(1)) + shift))
+        high = min(95, max(low + 10, int(match.group(2)) + shift))
+        return text[:match.start()] + f"{low}-{high}%" + text[match.end():]
+    if rng.random() < 0.3:
+        low = rng.choice([30, 40, 50, 60])
+        return f"{text.rstrip('.')} ({low}-{low + 20}% ideal)."
+    return text
+
+
+def _shift_watering(text: str, rng: random.Random) -> str:
+    if rng.random() < 0.4:
+        return f"{text} Typically {rng.choice(WATERING_CADENCES)}."
+    return text
+
+
+def _shift_difficulty(level: str, rng: random.Random) -> str:
+    index = DIFFICULTY_LEVELS.index(level) if level in DIFFICULTY_LEVELS else 1
+    roll = rng.random()
+    if roll < 0.15:
+        index -= 1
+    elif roll > 0.85:
+        index += 1
+    return DIFFICULTY_LEVELS[min(len(DIFFICULTY_LEVELS) - 1, max(0, index))]
+
+
+def _pick_toxicity(rng: random.Random) -> str:
+    roll = rng.random()
+    for value, weight in TOXICITY_CHOICES:
+        if roll < weight:
+            return value
+        roll -= weight
+    return TOXICITY_CHOICES[-1][0]
+
+
+def generate_record(index: int, rng: random.Random) -> Dict[str, Any]:
+    """Build one synthetic catalog record."""
+    family = SPECIES_POOL[index % len(SPECIES_POOL)][1]
+    template = CARE_TEMPLATES.get(family, CARE_TEMPLATES['Houseplant'])
+
+    return {
+        'id': f"synthetic_{index:08d}",
+        'name': record_name(index),
+        'watering': _shift_watering(template['watering'], rng),
+        'light': template['light'],
+        'soil': template['soil'],
+        'temperature': _shift_temperature(template['temperature'], rng),
+        'humidity': _shift_humidity(template['humidity'], rng),
+        'fertilizer': template['fertilizer'],
+        'pruning': template['pruning'],
+        'propagation': template['propagation'],
+        'common_problems': template['common_problems'],
+        'tips': template['tips'],
+        'difficulty': _shift_difficulty(template['difficulty'], rng),
+        'toxicity': template['toxicity'] if rng.random() < 0.5 else _pick_toxicity(rng),
+        'category': family,
+    }
+
+
+def shard_bounds(count: int, shard_size: int) -> List[Tuple[int, int, int]]:
+    """Return (shard, start, stop) for every shard of a count-record catalog."""
+    return [
+        (shard, start, min(count, start + shard_size))
+        for shard, start in enumerate(range(0, count, shard_size))
+    ]
+
+
+def iter_records(seed: int, start: int, stop: int, shard_size: int = DEFAULT_SHARD_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield records [start, stop) without writing files.
+
+    Records are identical to those written by generate_catalog for the same
+    seed and shard size.
+    """
+    for shard, shard_start, shard_stop in shard_bounds(stop, shard_size):
+        if shard_stop <= start:
+            continue
+        rng = random.Random(f"{seed}:{shard}")
+        for index in range(shard_start, shard_stop):
+            record = generate_record(index, rng)
+            if index >= start:
+                yield record
+
+
+def shard_filename(shard: int) -> str:
+    return f"catalog-{shard:05d}.jsonl"
+
+
+def remove_stale_shards(output_dir: str, keep: List[str]) -> List[str]:
+    """Delete shard files (and leftover temp files) that are not in keep."""
+    keep = set(keep)
+    removed = []
+    for filename in sorted(os.listdir(output_dir)):
+        if not re.fullmatch(r'catalog-\d{5}\.jsonl(\.tmp)?', filename) or filename in keep:
+            continue
+        os.remove(os.path.join(output_dir, filename))
+        removed.append(filename)
+    return removed
+
+
+def write_shard(output_dir: str, seed: int, shard: int, start: int, stop: int) -> Dict[str, Any]:
+    """Generate one shard and stream it to a JSON Lines file. Runs in a worker."""
+    rng = random.Random(f"{seed}:{shard}")
+    filename = shard_filename(shard)
+    path = os.path.join(output_dir, filename)
+    tmp_path = path + '.tmp'
+
+    with open(tmp_path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+        for index in range(start, stop):
+            f.write(json.dumps(generate_record(index, rng), ensure_ascii=False))
+            f.write('\n')
+    os.replace(tmp_path, path)
+
+    return {'file': filename, 'start': start, 'count': stop - start, 'bytes': os.path.getsize(path)}
+
+
+def generate_catalog(output_dir: str, count: int, seed: int = 42,
+                     shard_size: int = DEFAULT_SHARD_SIZE, workers: int = None) -> Dict[str, Any]:
+    """Generate a sharded synthetic catalog and write its manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    bounds = shard_bounds(count, shard_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(write_shard, output_dir, seed, shard, start, stop)
+            for shard, start, stop in bounds
+        ]
+        shards = [future.result() for future in futures]
+    # A smaller catalog regenerated into the same directory must not pick up old shards
+    removed = remove_stale_shards(output_dir, [shard['file'] for shard in shards])
+
+    manifest = {
+        'seed': seed,
+        'count': count,
+        'shard_size': shard_size,
+        'unique_names_before_series': BASE_COMBINATIONS,
+        'created_at': datetime.now().isoformat(),
+        'shards': shards,
+        'removed_stale_shards': removed,
+    }
+    with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    """Generate a synthetic plant care catalog."""
+    parser = argparse.ArgumentParser(description='Generate a synthetic plant care catalog')
+    parser.add_argument('--count', type=int, default=10000, help='number of records')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(__file__), 'synthetic_catalog'))
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Synthetic Catalog Generator")
+    print("=" * 55)
+    print(f"📋 Generating {args.count} records (seed {args.seed}) into {args.output}")
+
+    manifest = generate_catalog(args.output, args.count, args.seed, args.shard_size, args.workers)
+
+    total_bytes = sum(shard['bytes'] for shard in manifest['shards'])
+    print(f"✅ Wrote {len(manifest['shards'])} shards, {total_bytes / 1024 / 1024:.1f} MB")
+    if manifest['removed_stale_shards']:
+        print(f"🧹 Removed {len(manifest['removed_stale_shards'])} stale shards from an earlier run")
+    print(f"📁 Manifest: {os.path.join(args.output, 'manifest.json')}")
+
+if __name__ == "__main__":
+    main()
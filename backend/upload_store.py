@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Smart Plant Tracker - Content-Addressed Upload Store
+====================================================
+
+This module stores uploaded images once per unique content. Each upload is
+streamed through SHA-256, the bytes are kept as a single blob named by their
+digest, and a name→digest index maps the UUID file names the backend hands
+out to their blob. Existing upload directories can be migrated in place: each
+original name becomes a hardlink to its blob, so `/uploads/<name>` URLs keep
+working while duplicate copies stop using disk.
+
+Layout inside the uploads directory:
+    .blobs/<first 2 hex>/<sha256 digest>   one file per unique content
+    .index.json                            {"files": {name: digest}}
+
+Author: Smart Plant Tracker Team
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Any, BinaryIO, Iterator, Optional
+
+CHUNK_SIZE = 1024 * 1024
+BLOB_DIR = '.blobs'
+INDEX_FILE = '.index.json'
+
+
+def hash_stream(stream: BinaryIO, sink: Optional[BinaryIO] = None) -> str:
+    """Hash a binary stream chunk by chunk, optionally copying it to sink."""
+    digest = hashlib.sha256()
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        if sink is not None:
+            sink.write(chunk)
+    return digest.hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of a file without loading it in memory."""
+    with open(path, 'rb') as f:
+        return hash_stream(f)
+
+
+def cached_file_digest(path: str, key: str, cache: Dict[str, list]) -> str:
+    """Digest of a file, reusing cache[key] = [size, mtime_ns, digest] while both are unchanged.
+
+    Lets tools that run over un-migrated upload directories pay a stat per
+    file on repeat runs instead of rehashing every upload.
+    """
+    stat = os.stat(path)
+    entry = cache.get(key)
+    if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+        return entry[2]
+    digest = hash_file(path)
+    cache[key] = [stat.st_size, stat.st_mtime_ns, digest]
+    return digest
+
+
+class UploadStore:
+    """Content-addressed blob store with a name→digest index."""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.path.join(os.path.dirname(__file__), 'uploads')
+        self.blob_root = os.path.join(self.root, BLOB_DIR)
+        self.index_path = os.path.join(self.root, INDEX_FILE)
+        self.index: Dict[str, str] = self._load_index()
+
+    # Index -------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, str]:
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('files', {})
+
+    def save_index(self):
+        """Atomically write the name→digest index."""
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.index-', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'files': self.index}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    # Blobs -------------------------------------------------------------
+
+    def blob_path(self, digest: str) -> str:
+        """Return the path a blob with this digest is (or would be) stored at."""
+        return os.path.join(self.blob_root, digest[:2], digest)
+
+    def has_blob(self, digest: str) -> bool:
+        return os.path.exists(self.blob_path(digest))
+
+    def put_stream(self, name: str, stream: BinaryIO) -> str:
+        """Store an upload from a stream and link `name` to its blob.
+
+        The stream is written to a temporary file while it is hashed, so each
+        byte is read once. If a blob with the same digest already exists the
+        temporary copy is discarded.
+        """
+        os.makedirs(self.blob_root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.blob_root, prefix='.incoming-')
+        try:
+            with os.fdopen(fd, 'wb') as sink:
+                digest = hash_stream(stream, sink)
+            self._adopt_blob(tmp_path, digest)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._link_name(name, digest)
+        self.index[name] = digest
+        return digest
+
+    def put_file(self, name: str, path: str) -> str:
+        """Store a file from disk under `name`."""
+        with open(path, 'rb') as f:
+            return self.put_stream(name, f)
+
+    def _adopt_blob(self, path: str, digest: str):
+        """Move a fully written file into place as the blob for digest."""
+        target = self.blob_path(digest)
+        if os.path.exists(target):
+            return
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(path, target)
+
+    def _link_name(self, name: str, digest: str):
+        """Point uploads/<name> at the blob, replacing any existing file atomically."""
+        target = os.path.join(self.root, name)
+        blob = self.blob_path(digest)
+        if os.path.exists(target) and os.path.samefile(target, blob):
+            return
+        tmp_link = os.path.join(self.root, f'.{name}.link')
+        if os.path.exists(tmp_link):
+            os.remove(tmp_link)
+        os.link(blob, tmp_link)
+        os.replace(tmp_link, target)
+
+    # Lookups -----------------------------------------------------------
+
+    def digest_for(self, name: str) -> Optional[str]:
+        """Return the digest for an upload name, if indexed."""
+        return self.index.get(name)
+
+    def path_for(self, name: str) -> Optional[str]:
+        """Return the blob path for an upload name, if indexed."""
+        digest = self.index.get(name)
+        return self.blob_path(digest) if digest else None
+
+    def open(self, name: str) -> BinaryIO:
+        """Open an indexed upload for reading."""
+        path = self.path_for(name)
+        if path is None:
+            raise KeyError(name)
+        return open(path, 'rb')
+
+    def names_by_digest(self) -> Dict[str, list]:
+        """Group upload names by their content digest."""
+        groups: Dict[str, list] = {}
+        for name, digest in self.index.items():
+            groups.setdefault(digest, []).append(name)
+        return groups
+
+    def iter_uploads(self) -> Iterator[str]:
+        """Yield the names of regular, non-hidden files in the uploads directory."""
+        for entry in sorted(os.scandir(self.root), key=lambda e: e.name):
+            if entry.name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                continue
+            yield entry.name
+
+    # Migration ---------------------------------------------------------
+
+    def migrate(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Deduplicate the uploads directory in place using hardlinks.
+
+        Files already linked to their indexed blob are skipped without being
+        re-hashed, so repeated runs only touch new uploads.
+        """
+        stats = {'files': 0, 'new_blobs': 0, 'linked': 0, 'skipped': 0, 'bytes_reclaimed': 0}
+        os.makedirs(self.blob_root, exist_ok=True)
+
+        for name in self.iter_uploads():
+            path = os.path.join(self.root, name)
+            stats['files'] += 1
+
+            known = self.index.get(name)
+            if known and self.has_blob(known) and os.path.samefile(path, self.blob_path(known)):
+                stats['skipped'] += 1
+                continue
+
+            digest = hash_file(path)
+            blob = self.blob_path(digest)
+
+            if not os.path.exists(blob):
+                stats['new_blobs'] += 1
+                if not dry_run:
+                    os.makedirs(os.path.dirname(blob), exist_ok=True)
+                    os.link(path, blob)
+            elif not os.path.samefile(path, blob):
+                stats['linked'] += 1
+                # Space only comes back once the last other link goes away
+                if os.stat(path).st_nlink == 1:
+                    stats['bytes_reclaimed'] += os.path.getsize(path)
+                if not dry_run:
+                    self._link_name(name, digest)
+
+            if not dry_run:
+                self.index[name] = digest
+
+        if not dry_run:
+            self.save_index()
+        return stats
+
+    def prune(self, dry_run: bool = False) -> int:
+        """Remove index entries for deleted uploads and blobs nothing links to."""
+        removed = 0
+        surviving = {name: digest for name, digest in self.index.items()
+                     if os.path.exists(os.path.join(self.root, name))}
+        if not dry_run:
+            self.index = surviving
+
+        # Count from the surviving names in both modes so a dry run reports what a real prune removes
+        referenced = set(surviving.values())
+        if os.path.isdir(self.blob_root):
+            for prefix in os.scandir(self.blob_root):
+                if not prefix.is_dir():
+                    continue
+                for blob in os.scandir(prefix.path):
+                    if blob.name not in referenced and not blob.name.startswith('.'):
+                        removed += 1
+                        if not dry_run:
+                            os.remove(blob.path)
+
+        if not dry_run:
+            self.save_index()
+        return removed
+
+
+def main():
+    """Deduplicate the backend uploads directory."""
+    parser = argparse.ArgumentParser(description='Content-addressed upload store')
+    parser.add_argument('command', choices=['migrate', 'prune', 'stats'])
+    parser.add_argument('--root', help='uploads directory (default: backend/uploads)')
+    parser.add_argument('--dry-run', action='store_true', help='report without changing files')
+    args = parser.parse_args()
+
+    print("🌱 Smart Plant Tracker - Upload Store")
+    print("=" * 40)
+
+    store = UploadStore(args.root)
+
+    if args.command == 'migrate':
+        stats = store.migrate(dry_run=args.dry_run)
+        print(f"📊 Scanned {stats['files']} uploads")
+        print(f"   - {stats['new_blobs']} unique blobs added")
+        print(f"   - {stats['linked']} duplicates relinked")
+        print(f"   - {stats['skipped']} already migrated")
+        print(f"💾 Reclaimed {stats['bytes_reclaimed'] / 1024 / 1024:.1f} MB")
+    elif args.command == 'prune':
+        removed = store.prune(dry_run=args.dry_run)
+        print(f"🗑️ Removed {removed} unreferenced blobs")
+    else:
+        groups = store.names_by_digest()
+        print(f"📊 {len(store.index)} indexed uploads, {len(groups)} unique blobs")
+        for digest, names in sorted(groups.items(), key=lambda item: -len(item[1])):
+            if len(names) > 1:
+                print(f"   - {digest[:12]}… shared by {len(names)} uploads")
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,7 @@ async function initializeChroma() {
   try {
     // Initialize Chroma client (cloud instance)
     chromaClient = new ChromaClient({
-      path: 'https://api.trychroma.com',
+      path: process.env.CHROMA_URL || 'https://api.trychroma.com',
       apiKey: process.env.CHROMA_API_KEY || 'ck-BPG2XTtPWBPa2tFsatrfHmbsBTLdJYtKsnX75g8ZccYg',
       tenant: process.env.CHROMA_TENANT || '36db7d89-6330-46bf-a396-2836596dbd9a',
       database: process.env.CHROMA_DATABASE || 'plants'
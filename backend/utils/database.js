@@ -6,6 +6,8 @@ class Database {
   constructor() {
     this.db = null;
     this.dbPath = path.join(__dirname, '..', 'data', 'users.db');
+    this.statsDb = null;
+    this.statsQueue = Promise.resolve();
   }
 
   async init() {
@@ -537,7 +539,123 @@ class Database {
     });
   }
 
+  allAsync(sql, params = [], conn = this.db) {
+    return new Promise((resolve, reject) => {
+      conn.all(sql, params, (err, rows) => (err ? reject(err) : resolve(rows)));
+    });
+  }
+
+  // Read-only connection for the rollup reads, so their transaction never takes in
+  // writes that other requests issue on this.db meanwhile.
+  openStatsConnection() {
+    if (!this.statsDb) {
+      this.statsDb = new Promise((resolve, reject) => {
+        const conn = new sqlite3.Database(this.dbPath, sqlite3.OPEN_READONLY, (err) => (err ? reject(err) : resolve(conn)));
+      });
+      this.statsDb.catch(() => { this.statsDb = null; });
+    }
+    return this.statsDb;
+  }
+
+  // Run fn(conn) inside one read transaction on the stats connection, so every read
+  // sees the same snapshot. Calls are queued because BEGIN ... COMMIT blocks on one
+  // connection cannot overlap.
+  withReadTransaction(fn) {
+    const run = async () => {
+      const conn = await this.openStatsConnection();
+      const exec = (sql) => new Promise((resolve, reject) => conn.exec(sql, (err) => (err ? reject(err) : resolve())));
+      await exec('BEGIN');
+      try {
+        return await fn(conn);
+      } finally {
+        await exec('COMMIT');
+      }
+    };
+    const result = this.statsQueue.then(run, run);
+    this.statsQueue = result.catch(() => {});
+    return result;
+  }
+
+  // Read stats from the summary tables maintained by log_rollups.py, folding in
+  // journal entries the rollup job has not applied yet. Returns null when the
+  // rollups have never been built. All reads run in one transaction, so the
+  // summaries and the journal tail come from the same snapshot even while
+  // log_rollups.py folds the journal in.
+  async getLogStatsFromRollups(userId, plantId = null) {
+    const scope = plantId || '';
+    const now = new Date();
+    const dayKey = (daysAgo) => new Date(now.getTime() - daysAgo * 24 * 60 * 60 * 1000).toISOString().slice(0, 10);
+    const weekStart = dayKey(6);
+    const monthStart = dayKey(29);
+
+    const snapshot = await this.withReadTransaction(async (conn) => {
+      const state = await this.allAsync(
+        `SELECT journal_seq, rebuilt_at FROM log_rollup_state WHERE id = 1`, [], conn
+      ).catch(() => []);
+      if (state.length === 0 || !state[0].rebuilt_at) return null;
+
+      return Promise.all([
+        this.allAsync(`SELECT total, last_log FROM log_stats_totals WHERE user_id = ? AND plant_id = ?`, [userId, scope], conn),
+        this.allAsync(`SELECT dimension, value, count FROM log_stats_breakdown WHERE user_id = ? AND plant_id = ?`, [userId, scope], conn),
+        this.allAsync(`SELECT day, count FROM log_stats_daily WHERE user_id = ? AND plant_id = ? AND day >= ?`, [userId, scope, monthStart], conn),
+        this.allAsync(
+          `SELECT delta, type, mood, timestamp FROM log_rollup_journal WHERE seq > ? AND user_id = ?` +
+          (plantId ? ` AND plant_id = ?` : ''),
+          plantId ? [state[0].journal_seq, userId, plantId] : [state[0].journal_seq, userId],
+          conn
+        )
+      ]);
+    });
+    if (!snapshot) return null;
+    const [totals, breakdown, daily, pending] = snapshot;
+
+    const stats = {
+      totalLogs: totals.length > 0 ? totals[0].total : 0,
+      logsThisWeek: 0,
+      logsThisMonth: 0,
+      typeBreakdown: {},
+      moodBreakdown: {},
+      lastLogDate: totals.length > 0 ? totals[0].last_log : null
+    };
+
+    breakdown.forEach(row => {
+      const target = row.dimension === 'type' ? stats.typeBreakdown : stats.moodBreakdown;
+      target[row.value] = row.count;
+    });
+    daily.forEach(row => {
+      stats.logsThisMonth += row.count;
+      if (row.day >= weekStart) stats.logsThisWeek += row.count;
+    });
+
+    pending.forEach(entry => {
+      const type = entry.type || 'general';
+      const mood = entry.mood || 'neutral';
+      const day = String(entry.timestamp || '').slice(0, 10);
+      stats.totalLogs += entry.delta;
+      stats.typeBreakdown[type] = (stats.typeBreakdown[type] || 0) + entry.delta;
+      stats.moodBreakdown[mood] = (stats.moodBreakdown[mood] || 0) + entry.delta;
+      if (day >= monthStart) stats.logsThisMonth += entry.delta;
+      if (day >= weekStart) stats.logsThisWeek += entry.delta;
+      if (entry.delta > 0 && (!stats.lastLogDate || entry.timestamp > stats.lastLogDate)) {
+        stats.lastLogDate = entry.timestamp;
+      }
+    });
+    for (const breakdownMap of [stats.typeBreakdown, stats.moodBreakdown]) {
+      for (const key of Object.keys(breakdownMap)) {
+        if (breakdownMap[key] <= 0) delete breakdownMap[key];
+      }
+    }
+
+    return stats;
+  }
+
   async getLogStats(userId, plantId = null) {
+    const rollupStats = await this.getLogStatsFromRollups(userId, plantId).catch(err => {
+      console.error('Error reading log stat rollups, falling back to a full scan:', err);
+      return null;
+    });
+    if (rollupStats) return rollupStats;
+
     return new Promise((resolve, reject) => {
       let selectLogs = `SELECT * FROM logs WHERE user_id = ?`;
       const params = [userId];
@@ -578,6 +696,10 @@ class Database {
   }
 
   close() {
+    if (this.statsDb) {
+      this.statsDb.then(conn => conn.close()).catch(() => {});
+      this.statsDb = null;
+    }
     if (this.db) {
       this.db.close((err) => {
         if (err) {
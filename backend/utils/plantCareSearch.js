@@ -8,10 +8,101 @@ const path = require('path');
 
 let plantCareData = null;
 
+// Versioned releases published by catalog_release.py
+const RELEASE_DIR = path.join(__dirname, '../catalog_releases/fast_plant_care');
+const MANIFEST_PATH = path.join(RELEASE_DIR, 'manifest.json');
+const RELEASE_POLL_MS = 5000;
+
+const release = {
+  version: 0,
+  records: new Map(),
+  manifestMtime: 0,
+  lastPoll: 0
+};
+
+function readJson(filePath) {
+  return JSON.parse(fs.readFileSync(filePath, 'utf8'));
+}
+
+/**
+ * Find the deltas leading from the loaded version to the manifest's version
+ * @returns {Array|null} Delta entries in order, or null if any are missing
+ */
+function findDeltaChain(manifest) {
+  if (!release.version) return null;
+
+  const byStart = new Map(manifest.deltas.map(entry => [entry.from_version, entry]));
+  const chain = [];
+  let version = release.version;
+  while (version !== manifest.version) {
+    const entry = byStart.get(version);
+    if (!entry) return null;
+    chain.push(entry);
+    version = entry.to_version;
+  }
+  return chain;
+}
+
+/**
+ * Poll the release manifest and apply any new deltas (or reload the snapshot)
+ * @returns {boolean} True if a release was found
+ */
+function refreshFromRelease() {
+  let stat;
+  try {
+    stat = fs.statSync(MANIFEST_PATH);
+  } catch (error) {
+    return release.version > 0;
+  }
+  if (stat.mtimeMs === release.manifestMtime) return true;
+
+  const manifest = readJson(MANIFEST_PATH);
+  if (manifest.version === release.version) {
+    release.manifestMtime = stat.mtimeMs;
+    return true;
+  }
+
+  // Build the new version on a copy so a failed read (e.g. mid-publish)
+  // leaves the current records intact and is retried on the next poll
+  let records;
+  const chain = findDeltaChain(manifest);
+  if (chain) {
+    records = new Map(release.records);
+    for (const entry of chain) {
+      const delta = readJson(path.join(RELEASE_DIR, entry.file));
+      delta.removed.forEach(key => records.delete(key));
+      for (const [key, record] of Object.entries(delta.changed)) records.set(key, record);
+      for (const [key, record] of Object.entries(delta.added)) records.set(key, record);
+    }
+    console.log(`🔄 Applied ${chain.length} catalog delta(s): v${release.version} → v${manifest.version}`);
+  } else {
+    const snapshot = readJson(path.join(RELEASE_DIR, manifest.snapshot));
+    records = new Map(snapshot.keys.map((key, i) => [key, snapshot.records[i]]));
+    console.log(`✅ Loaded plant care catalog v${manifest.version} (${records.size} records)`);
+  }
+
+  release.records = records;
+  release.version = manifest.version;
+  release.manifestMtime = stat.mtimeMs;
+  plantCareData = Array.from(records.values());
+  return true;
+}
+
 /**
- * Load plant care data from JSON file
+ * Load plant care data, preferring the versioned release so a regenerated
+ * catalog is picked up without a restart
  */
 function loadPlantCareData() {
+  const now = Date.now();
+  if (plantCareData && now - release.lastPoll < RELEASE_POLL_MS) return plantCareData;
+  release.lastPoll = now;
+
+  try {
+    if (refreshFromRelease()) return plantCareData;
+  } catch (error) {
+    console.error('Error reloading plant care release:', error);
+    if (plantCareData) return plantCareData;
+  }
   if (plantCareData) return plantCareData;
   
   try {